@@ -1,3 +1,17 @@
 from .nodes import NODE_CLASS_MAPPINGS, NODE_DISPLAY_NAME_MAPPINGS
+from .worker_pool import install_worker_pool
+from .disk_cache import install_disk_cache
+from .profiler import install_profiler
+from .thread_control import install_thread_limit
+from .warmup import install_warmup
+
+# The disk cache wraps the worker dispatch, so hits never reach a worker;
+# the profiler wraps both and measures what the user waits for
+install_worker_pool(NODE_CLASS_MAPPINGS)
+install_disk_cache(NODE_CLASS_MAPPINGS)
+install_profiler(NODE_CLASS_MAPPINGS)
+install_thread_limit()
+# Last, so the thread limit is in place before TBB starts
+install_warmup()
 
 __all__ = ["NODE_CLASS_MAPPINGS", "NODE_DISPLAY_NAME_MAPPINGS"]
\ No newline at end of file
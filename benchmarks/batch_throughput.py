@@ -0,0 +1,93 @@
+"""
+Throughput of the list (batch) nodes on many small meshes.
+
+Builds --count small noisy spheres and runs Decimate, Relax, Transform,
+Fill Holes, Offset and Get Mesh Info over the whole list in one call with
+max_workers = 1, 2, 4, ... up to the number of cores. Prints meshes per
+second and the speedup over max_workers = 1.
+
+With --worker-processes N, the worker pool is enabled (MESHLIB_WORKER_PROCESSES)
+and the items of Decimate and Offset run in N worker processes. MeshLib
+holds the GIL in some algorithms (decimation, offsets), so their items only
+scale across processes; relax, transform, hole filling and mesh info overlap
+in threads.
+
+Usage:
+    python benchmarks/batch_throughput.py [--count 1000] [--resolution 16] [--worker-processes 0] [--json out.json]
+"""
+
+import argparse
+import json
+import os
+
+from common import load_package, timeit
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=1000, help="Number of meshes in the list")
+    parser.add_argument("--resolution", type=int, default=16, help="UV sphere resolution of each mesh")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count())
+    parser.add_argument("--worker-processes", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--json", help="Write the results to this file")
+    args = parser.parse_args()
+    
+    if args.worker_processes:
+        os.environ["MESHLIB_WORKER_PROCESSES"] = str(args.worker_processes)
+    
+    package = load_package()
+    nodes = package.nodes.NODE_CLASS_MAPPINGS
+    
+    sphere, = nodes["MeshlibMakeSphere"]().process(1.0, args.resolution, args.resolution)
+    meshes = [nodes["MeshlibAddNoise"]().process(sphere, 0.01, seed)[0] for seed in range(args.count)]
+    faces = sphere.topology.numValidFaces()
+    
+    workloads = {
+        "decimate": lambda workers: nodes["MeshlibDecimate"]().process(
+            meshes, [faces // 2], [0.01], [1], max_workers=[workers]),
+        "relax": lambda workers: nodes["MeshlibRelax"]().process(meshes, [5], [0.5], max_workers=[workers]),
+        "transform": lambda workers: nodes["MeshlibTransform"]().process(
+            meshes, [0.1], [0.2], [0.3], [10.0], [20.0], [30.0], [1.5], max_workers=[workers]),
+        "fill_holes": lambda workers: nodes["MeshlibFillHoles"]().process(meshes, max_workers=[workers]),
+        "offset": lambda workers: nodes["MeshlibOffset"]().process(meshes, [0.05], [100000], max_workers=[workers]),
+        "mesh_info": lambda workers: nodes["MeshlibGetMeshInfo"]().process(meshes, max_workers=[workers]),
+    }
+    
+    worker_counts = []
+    count = 1
+    while count < args.max_workers:
+        worker_counts.append(count)
+        count *= 2
+    worker_counts.append(args.max_workers)
+    
+    results = []
+    print(f"{args.count} meshes of {faces} faces, {os.cpu_count()} cores, {args.worker_processes} worker processes")
+    print(f"{'node':>10} {'workers':>8} {'s':>8} {'meshes/s':>10} {'speedup':>8}")
+    for name, workload in workloads.items():
+        # Warm up (and start the worker processes) outside the measurements
+        workload(worker_counts[-1])
+        single = None
+        for workers in worker_counts:
+            seconds, _ = timeit(lambda: workload(workers), args.repeat)
+            single = single or seconds
+            row = {
+                "node": name,
+                "max_workers": workers,
+                "worker_processes": args.worker_processes,
+                "meshes": args.count,
+                "faces": faces,
+                "seconds": seconds,
+                "meshes_per_s": args.count / seconds,
+                "speedup": single / seconds,
+            }
+            results.append(row)
+            print(f"{name:>10} {workers:>8} {seconds:>8.3f} {row['meshes_per_s']:>10.1f} {row['speedup']:>8.2f}")
+    
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
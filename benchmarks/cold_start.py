@@ -0,0 +1,85 @@
+"""
+Time to first result of a fresh process, with and without the warm-up.
+
+Every trial starts a new Python process that registers the nodes (as ComfyUI
+does at startup) with MESHLIB_WARMUP set to the mode under test, waits
+--idle seconds (the time between server start and the first queued job) and
+then runs a first job: Make Sphere -> Decimate -> Boolean. It reports the
+registration time and the time from submitting the job to its result.
+
+Usage:
+    python benchmarks/cold_start.py [--modes off,import,smoke] [--idle 2.0] [--trials 3] [--json out.json]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+
+def child(idle):
+    """Runs in the fresh process: register the nodes, wait, run the first job."""
+    start = time.perf_counter()
+    from common import load_package
+    package = load_package()
+    registered = time.perf_counter() - start
+    
+    time.sleep(idle)
+    
+    nodes = package.nodes.NODE_CLASS_MAPPINGS
+    start = time.perf_counter()
+    sphere, = nodes["MeshlibMakeSphere"]().process(1.0, 64, 64)
+    (decimated,), _, _ = nodes["MeshlibDecimate"]().process([sphere], [2000], [0.01], [8])
+    (shifted,), = nodes["MeshlibTransform"]().process([sphere], [0.5], [0.0], [0.0], [0.0], [0.0], [0.0], [1.0])
+    nodes["MeshlibBoolean"]().process(decimated, shifted, "Union", "exact")
+    first_result = time.perf_counter() - start
+    
+    print(json.dumps({"registration_s": registered, "first_result_s": first_result}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--modes", default="off,import,smoke", help="Comma separated MESHLIB_WARMUP values")
+    parser.add_argument("--idle", type=float, default=2.0, help="Seconds between registration and the first job")
+    parser.add_argument("--trials", type=int, default=3)
+    parser.add_argument("--json", help="Write the results to this file")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    
+    if args.child:
+        child(args.idle)
+        return
+    
+    results = []
+    print(f"{'warm-up':>8} {'idle s':>7} {'register ms':>12} {'first result ms':>16} {'total ms':>9}")
+    for mode in args.modes.split(","):
+        env = dict(os.environ, MESHLIB_WARMUP="0" if mode == "off" else mode)
+        trials = []
+        for _ in range(args.trials):
+            output = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), "--child", "--idle", str(args.idle)],
+                env=env, cwd=os.path.dirname(os.path.abspath(__file__)), check=True, capture_output=True, text=True,
+            ).stdout
+            trials.append(json.loads(output.strip().splitlines()[-1]))
+        
+        row = {
+            "mode": mode,
+            "idle_s": args.idle,
+            "registration_s": float(np.median([trial["registration_s"] for trial in trials])),
+            "first_result_s": float(np.median([trial["first_result_s"] for trial in trials])),
+        }
+        results.append(row)
+        print(f"{mode:>8} {args.idle:>7.1f} {row['registration_s'] * 1e3:>12.1f} {row['first_result_s'] * 1e3:>16.1f} "
+              f"{(row['registration_s'] + row['first_result_s']) * 1e3:>9.1f}")
+    
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""Minimal stand-in for the parts of ComfyUI's comfy package used by the nodes."""
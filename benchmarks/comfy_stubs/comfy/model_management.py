@@ -0,0 +1,16 @@
+interrupt_processing = False
+
+
+class InterruptProcessingException(Exception):
+    pass
+
+
+def processing_interrupted():
+    return interrupt_processing
+
+
+def throw_exception_if_processing_interrupted():
+    global interrupt_processing
+    if interrupt_processing:
+        interrupt_processing = False
+        raise InterruptProcessingException()
@@ -0,0 +1,12 @@
+class ProgressBar:
+    def __init__(self, total):
+        self.total = total
+        self.current = 0
+    
+    def update(self, value):
+        self.current += value
+    
+    def update_absolute(self, value, total=None, preview=None):
+        if total is not None:
+            self.total = total
+        self.current = value
@@ -0,0 +1,34 @@
+"""
+Minimal stand-in for ComfyUI's folder_paths module, used by the benchmarks
+when they run outside a ComfyUI installation. Files go to a temporary folder.
+"""
+
+import os
+import tempfile
+
+_base_directory = os.path.join(tempfile.gettempdir(), "meshlib_benchmarks")
+
+
+def get_output_directory():
+    return os.path.join(_base_directory, "output")
+
+
+def get_input_directory():
+    return os.path.join(_base_directory, "input")
+
+
+def get_save_image_path(filename_prefix, output_dir):
+    subfolder = os.path.dirname(os.path.normpath(filename_prefix))
+    filename = os.path.basename(os.path.normpath(filename_prefix))
+    full_output_folder = os.path.join(output_dir, subfolder)
+    os.makedirs(full_output_folder, exist_ok=True)
+    
+    counter = 1
+    while any(name.startswith(f"{filename}_{counter:05}") for name in os.listdir(full_output_folder)):
+        counter += 1
+    
+    return full_output_folder, filename, counter, subfolder, filename_prefix
+
+
+def get_temp_directory():
+    return os.path.join(_base_directory, "temp")
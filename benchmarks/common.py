@@ -0,0 +1,55 @@
+"""
+Shared helpers for the benchmark scripts.
+"""
+
+import importlib
+import os
+import sys
+import time
+
+import numpy as np
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STUBS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "comfy_stubs")
+
+
+def load_package():
+    """
+    Import the node package the way ComfyUI does (by its directory name).
+    
+    Outside ComfyUI, minimal stand-ins for the ComfyUI modules are put at the
+    end of sys.path; the path is inherited by spawned worker processes.
+    """
+    try:
+        import folder_paths  # noqa: F401
+        import comfy.utils  # noqa: F401
+    except ImportError:
+        sys.path.append(STUBS_DIR)
+    
+    parent = os.path.dirname(REPO_DIR)
+    if parent not in sys.path:
+        sys.path.insert(0, parent)
+    
+    return importlib.import_module(os.path.basename(REPO_DIR))
+
+
+def timeit(fn, repeat=3):
+    """Median wall time of fn() in seconds, and the last result."""
+    times = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - start)
+    
+    return float(np.median(times)), result
+
+
+def PeakRSS(interval=0.005):
+    """
+    Context manager sampling the resident set size (the package's profiler.PeakRSS).
+    
+    After the block, peak holds the highest RSS seen minus the RSS at entry,
+    in bytes (None where /proc is not available).
+    """
+    return load_package().profiler.PeakRSS(interval)
@@ -0,0 +1,105 @@
+"""
+Predicted versus measured peak memory of the budgeted nodes.
+
+Every case runs in a fresh Python process with the memory checks disabled
+(MESHLIB_MEMORY_BUDGET_MB=0): it builds the input (UV spheres, or their
+vertices as a point cloud), computes the memory_budget estimate the node
+would check, then runs the node and samples its peak RSS growth. A ratio
+above 1 means the estimate is pessimistic.
+
+Usage:
+    python benchmarks/memory_estimate.py [--resolutions 128,512] [--voxel-counts 1000000,5000000,20000000] [--json out.json]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+
+OPERATIONS = ("decimate", "boolean", "voxel_boolean", "offset", "triangulate")
+
+
+def child(operation, resolution, voxel_count):
+    """Runs in the fresh process: estimate, then measure one node call."""
+    from common import load_package, PeakRSS
+    package = load_package()
+    nodes = package.nodes.NODE_CLASS_MAPPINGS
+    budget = package.memory_budget
+    
+    import meshlib.mrmeshpy as mrmeshpy
+    import meshlib.mrmeshnumpy as mrmeshnumpy
+    
+    sphere = mrmeshpy.makeUVSphere(1.0, resolution, resolution)
+    shifted = mrmeshpy.copyMesh(sphere)
+    shifted.transform(mrmeshpy.AffineXf3f.translation(mrmeshpy.Vector3f(0.5, 0.2, 0.1)))
+    points = mrmeshnumpy.pointCloudFromPoints(mrmeshnumpy.getNumpyVerts(sphere))
+    faces = sphere.topology.numValidFaces()
+    
+    if operation == "decimate":
+        predicted = budget.estimate_decimate(sphere)
+        run = lambda: nodes["MeshlibDecimate"]().process_item(sphere, faces // 2, 0.01, 64)
+    elif operation == "boolean":
+        predicted = budget.estimate_boolean(sphere, shifted)
+        run = lambda: nodes["MeshlibBoolean"]().process(sphere, shifted, "Union", "exact")
+    elif operation == "voxel_boolean":
+        predicted = budget.estimate_voxel_boolean(sphere, shifted, voxel_count)
+        run = lambda: nodes["MeshlibBoolean"]().process(sphere, shifted, "Union", "voxel", voxel_count)
+    elif operation == "offset":
+        predicted = budget.estimate_offset(sphere, 0.05, voxel_count)
+        run = lambda: nodes["MeshlibOffset"]().process_item(sphere, 0.05, voxel_count)
+    else:
+        # The node estimates the fix on the triangulated mesh; a sphere of the same points is a close stand-in
+        predicted = (budget.estimate_triangulation(points.validPoints.count())
+                     + budget.estimate_offset(sphere, 0.0, voxel_count) - budget.BASE_BYTES)
+        run = lambda: nodes["MeshlibTriangulatePointCloud"]().process(points, True, voxel_count)
+    
+    with PeakRSS(0.002) as peak:
+        run()
+    
+    print(json.dumps({"faces": faces, "predicted": predicted, "measured": peak.peak}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--operations", default=",".join(OPERATIONS))
+    parser.add_argument("--resolutions", default="128,512", help="UV sphere resolutions (2 * r^2 faces)")
+    parser.add_argument("--voxel-counts", default="1000000,5000000,20000000")
+    parser.add_argument("--json", help="Write the results to this file")
+    parser.add_argument("--child", nargs=3, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    
+    if args.child:
+        operation, resolution, voxel_count = args.child
+        child(operation, int(resolution), int(voxel_count))
+        return
+    
+    env = dict(os.environ, MESHLIB_MEMORY_BUDGET_MB="0")
+    voxel_counts = [int(count) for count in args.voxel_counts.split(",")]
+    
+    results = []
+    print(f"{'operation':>14} {'faces':>9} {'voxels':>10} {'predicted MB':>13} {'measured MB':>12} {'ratio':>6}")
+    for operation in args.operations.split(","):
+        for resolution in (int(r) for r in args.resolutions.split(",")):
+            # Mesh-only operations don't depend on the voxel count
+            for voxel_count in voxel_counts if operation in ("voxel_boolean", "offset", "triangulate") else [0]:
+                output = subprocess.run(
+                    [sys.executable, os.path.abspath(__file__), "--child", operation, str(resolution), str(voxel_count)],
+                    env=env, cwd=os.path.dirname(os.path.abspath(__file__)), check=True, capture_output=True, text=True,
+                ).stdout
+                row = dict(json.loads(output.strip().splitlines()[-1]), operation=operation, voxel_count=voxel_count)
+                row["ratio"] = row["predicted"] / row["measured"] if row["measured"] else None
+                results.append(row)
+                
+                ratio = f"{row['ratio']:.2f}" if row["ratio"] else "-"
+                print(f"{operation:>14} {row['faces']:>9} {voxel_count:>10} {row['predicted'] / 1e6:>13.1f} "
+                      f"{(row['measured'] or 0) / 1e6:>12.1f} {ratio:>6}")
+    
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
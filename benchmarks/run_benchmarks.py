@@ -0,0 +1,283 @@
+"""
+Benchmark every node registered in NODE_CLASS_MAPPINGS.
+
+Runs headless on CPU: outside ComfyUI, folder_paths and comfy are replaced by
+the stand-ins in comfy_stubs. For each scale, synthetic inputs are built
+with the primitive and noise nodes (a noisy UV sphere of about that many
+faces, a shifted copy for two-mesh nodes, a copy with two holes for the
+repair nodes, its vertices as a point cloud, an
+octree partition for chunk nodes, its vertex and face arrays, ...). Node inputs are then generated from
+INPUT_TYPES: required inputs take their default (or first choice), optional
+inputs are left out, and the few inputs that need realistic values are set in
+INPUT_OVERRIDES.
+
+Each node is run once as warmup and then --repeat times. Recorded per node
+and scale: median and minimum wall time, peak RSS growth during the call and
+throughput (input faces per second). Nodes whose inputs can't be generated
+or that fail are listed with their reason.
+
+With --baseline, results are compared to an earlier --json output and the
+script exits with status 1 when a node got slower than the threshold.
+
+Usage:
+    python benchmarks/run_benchmarks.py [--scales 10k,1m,10m] [--nodes Decimate,Offset]
+        [--repeat 3] [--json results.json] [--baseline baseline.json] [--threshold 0.2]
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import traceback
+from importlib import metadata
+
+import numpy as np
+
+from common import load_package, PeakRSS
+
+# Approximate face counts of the generated meshes
+SCALES = {
+    "10k": 10000,
+    "1m": 1000000,
+    "10m": 10000000,
+}
+
+# Inputs that need a value depending on the generated data: (node, input) -> fn(inputs, faces)
+INPUT_OVERRIDES = {
+    ("MeshlibDecimate", "target_faces"): lambda inputs, faces: faces // 2,
+    ("MeshlibPointSampling", "num_samples"): lambda inputs, faces: faces // 2,
+    ("MeshlibFillHoles", "mesh"): lambda inputs, faces: inputs["open_mesh"],
+    ("MeshlibStitchHoles", "mesh"): lambda inputs, faces: inputs["open_mesh"],
+    ("MeshlibOctreePartition", "max_faces_per_chunk"): lambda inputs, faces: max(1000, faces // 8),
+    ("MeshlibDeformSequence", "frames"): lambda inputs, faces: np.linspace([0, 0, 0], [0.1, 0.2, 0.3], 8, dtype=np.float32),
+}
+
+# Second operand of two-mesh nodes
+SECOND_MESH_INPUTS = ("mesh_b", "mesh_fixed")
+
+
+def build_inputs(package, faces):
+    """
+    Synthetic node inputs for a scale.
+    
+    Returns:
+        Dict of named inputs (mesh, shifted_mesh, open_mesh, points, arrays, chunks, file paths, ...)
+    """
+    import folder_paths
+    import meshlib.mrmeshpy as mrmeshpy
+    import meshlib.mrmeshnumpy as mrmeshnumpy
+    
+    nodes = package.nodes.NODE_CLASS_MAPPINGS
+    utils = package.utils
+    
+    # A UV sphere with resolution n has 2 n^2 faces
+    resolution = max(4, int(round((faces / 2) ** 0.5)))
+    sphere, = nodes["MeshlibMakeSphere"]().process(1.0, resolution, resolution)
+    mesh, = nodes["MeshlibAddNoise"]().process(sphere, 0.001, 0)
+    
+    (shifted,), = nodes["MeshlibTransform"]().process([mesh], [0.5], [0.2], [0.1], [0.0], [0.0], [0.0], [1.0])
+    
+    # Two holes at the poles for the repair nodes
+    vertices, all_faces = utils.mesh_to_numpy(mesh)
+    polar = np.abs(vertices[all_faces].mean(axis=1)[:, 2]) > 0.95
+    open_mesh = mrmeshpy.copyMesh(mesh)
+    open_mesh.deleteFaces(mrmeshnumpy.faceBitSetFromBools(polar))
+    
+    points = utils.numpy_to_pointcloud(vertices)
+    chunks, _ = nodes["MeshlibOctreePartition"]().process(mesh, max(1000, faces // 8))
+    
+    mesh_path = os.path.join(folder_paths.get_input_directory(), f"benchmark_{faces}.ply")
+    os.makedirs(os.path.dirname(mesh_path), exist_ok=True)
+    mrmeshpy.saveMesh(mesh, mesh_path)
+    points_path = os.path.join(folder_paths.get_input_directory(), f"benchmark_{faces}_points.ply")
+    mrmeshpy.PointsSave.toAnySupportedFormat(points, points_path)
+    
+    inputs = {
+        "faces": mesh.topology.numValidFaces(),
+        "mesh": mesh,
+        "shifted_mesh": shifted,
+        "open_mesh": open_mesh,
+        "points": points,
+        "vertex_array": vertices,
+        "face_array": all_faces,
+        "chunks": chunks,
+        "mesh_path": mesh_path,
+        "points_path": points_path,
+    }
+    try:
+        inputs["trimesh"] = utils.meshlib_to_trimesh(mesh)
+    except ImportError:
+        pass
+    
+    return inputs
+
+
+def node_arguments(node_name, node_class, inputs):
+    """
+    Keyword arguments for a node, generated from its INPUT_TYPES.
+    
+    Raises:
+        LookupError: An input can't be generated
+    """
+    arguments = {}
+    for name, spec in node_class.INPUT_TYPES().get("required", {}).items():
+        input_type = spec[0]
+        options = spec[1] if len(spec) > 1 else {}
+        override = INPUT_OVERRIDES.get((node_name, name))
+        
+        if override is not None:
+            value = override(inputs, inputs["faces"])
+        elif isinstance(input_type, (list, tuple)):
+            value = options.get("default", input_type[0])
+        elif input_type == "MESHLIB_MESH":
+            value = inputs["shifted_mesh"] if name in SECOND_MESH_INPUTS else inputs["mesh"]
+        elif input_type == "MESHLIB_POINTCLOUD":
+            value = inputs["points"]
+        elif input_type == "MESHLIB_ARRAY":
+            value = inputs["face_array"] if name == "faces" else inputs["vertex_array"]
+        elif input_type == "MESHLIB_CHUNKS":
+            value = inputs["chunks"]
+        elif input_type == "TRIMESH" and "trimesh" in inputs:
+            value = inputs["trimesh"]
+        elif input_type == "STRING" and name == "file_path":
+            value = inputs["points_path"] if "Points" in node_name else inputs["mesh_path"]
+        elif input_type in ("INT", "FLOAT", "BOOLEAN", "STRING") and "default" in options:
+            value = options["default"]
+        else:
+            raise LookupError(f"no generator for input '{name}' of type {input_type}")
+        
+        arguments[name] = value
+    
+    # Batch nodes (one output per input item) get one-item lists, so timings stay per mesh
+    if getattr(node_class, "INPUT_IS_LIST", False) and all(getattr(node_class, "OUTPUT_IS_LIST", None) or (False,)):
+        arguments = {name: [value] for name, value in arguments.items()}
+    # Other list nodes get both meshes as the list and single values wrapped in lists
+    elif getattr(node_class, "INPUT_IS_LIST", False):
+        arguments = {
+            name: [inputs["mesh"], inputs["shifted_mesh"]] if value is inputs["mesh"] else [value]
+            for name, value in arguments.items()
+        }
+    
+    return arguments
+
+
+def run_node(node_class, arguments, warmup, repeat):
+    """Time a node call; returns (median s, min s, peak RSS growth in bytes or None)."""
+    node = node_class()
+    function = getattr(node, node_class.FUNCTION)
+    
+    for _ in range(warmup):
+        function(**arguments)
+    
+    times = []
+    peak = None
+    for _ in range(repeat):
+        with PeakRSS() as rss:
+            start = time.perf_counter()
+            result = function(**arguments)
+            times.append(time.perf_counter() - start)
+        del result
+        if rss.peak is not None:
+            peak = max(peak or 0, rss.peak)
+    
+    return float(np.median(times)), float(np.min(times)), peak
+
+
+def compare(results, baseline, threshold):
+    """
+    Compare results to a baseline run.
+    
+    Returns:
+        List of (node, scale, baseline s, current s) that got slower than threshold
+    """
+    previous = {(row["node"], row["scale"]): row for row in baseline["results"] if row.get("status") == "ok"}
+    regressions = []
+    for row in results:
+        base = previous.get((row["node"], row["scale"]))
+        if row["status"] == "ok" and base is not None and row["wall_s"] > base["wall_s"] * (1 + threshold):
+            regressions.append((row["node"], row["scale"], base["wall_s"], row["wall_s"]))
+    
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scales", default=",".join(SCALES), help=f"Comma separated subset of {', '.join(SCALES)}")
+    parser.add_argument("--nodes", help="Comma separated substrings; only matching node names are run")
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--json", help="Write the results to this file")
+    parser.add_argument("--baseline", help="Results file of an earlier run to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed slowdown against the baseline (0.2 = 20%%)")
+    args = parser.parse_args()
+    
+    package = load_package()
+    mappings = package.nodes.NODE_CLASS_MAPPINGS
+    
+    scales = [scale.strip() for scale in args.scales.split(",") if scale.strip()]
+    unknown = [scale for scale in scales if scale not in SCALES]
+    if unknown:
+        parser.error(f"unknown scales: {', '.join(unknown)}")
+    patterns = [pattern.strip() for pattern in args.nodes.split(",")] if args.nodes else None
+    node_names = [name for name in mappings if patterns is None or any(pattern in name for pattern in patterns)]
+    
+    results = []
+    print(f"{'node':<32} {'scale':>6} {'median ms':>11} {'min ms':>10} {'peak MB':>9} {'Mfaces/s':>9}")
+    for scale in scales:
+        inputs = build_inputs(package, SCALES[scale])
+        for node_name in node_names:
+            row = {"node": node_name, "scale": scale, "faces": inputs["faces"]}
+            try:
+                arguments = node_arguments(node_name, mappings[node_name], inputs)
+                median, best, peak = run_node(mappings[node_name], arguments, args.warmup, args.repeat)
+            except LookupError as e:
+                row.update(status="skipped", reason=str(e))
+                print(f"{node_name:<32} {scale:>6} skipped: {e}")
+            except Exception as e:
+                row.update(status="error", reason=f"{type(e).__name__}: {e}")
+                print(f"{node_name:<32} {scale:>6} error: {type(e).__name__}: {e}")
+                traceback.print_exc(limit=1, file=sys.stderr)
+            else:
+                row.update(
+                    status="ok",
+                    wall_s=median,
+                    wall_min_s=best,
+                    peak_rss_mb=None if peak is None else peak / 2 ** 20,
+                    faces_per_s=inputs["faces"] / median if median > 0 else None,
+                )
+                peak_text = "-" if peak is None else f"{peak / 2 ** 20:.1f}"
+                print(f"{node_name:<32} {scale:>6} {median * 1e3:>11.1f} {best * 1e3:>10.1f} {peak_text:>9} "
+                      f"{inputs['faces'] / median / 1e6 if median > 0 else float('inf'):>9.2f}")
+            results.append(row)
+    
+    report = {
+        "meta": {
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "meshlib": metadata.version("meshlib"),
+            "numpy": np.__version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "warmup": args.warmup,
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+    
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        for node_name, scale, before, after in regressions:
+            print(f"REGRESSION {node_name} @ {scale}: {before * 1e3:.1f} ms -> {after * 1e3:.1f} ms ({after / before - 1:+.0%})")
+        if regressions:
+            sys.exit(1)
+        print(f"No regression above {args.threshold:.0%} against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Downstream speedup of sorting a mesh along a space filling curve.
+
+A UV sphere is shuffled (random vertex and face order, as in files written
+by tools that do not care about locality), then reordered with each method:
+- shuffled: no reordering (reference)
+- morton / hilbert: utils.reorder_mesh
+- pack: MeshLib's own Mesh.packOptimally()
+
+For each variant, measures relax, a collision test against a shifted copy
+(including the AABB tree builds) and an offset. Every measurement starts
+from a fresh mesh so no cached AABB tree is reused.
+
+Usage:
+    python benchmarks/spatial_reorder.py [--resolution 512] [--json out.json]
+"""
+
+import argparse
+import json
+import time
+
+import numpy as np
+
+from common import load_package
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--resolution", type=int, default=512)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--json", help="Write the results to this file")
+    args = parser.parse_args()
+    
+    package = load_package()
+    utils = package.utils
+    from meshlib import mrmeshpy, mrmeshnumpy
+    
+    vertices, faces = utils.mesh_to_numpy(mrmeshpy.makeUVSphere(1.0, args.resolution, args.resolution))
+    rng = np.random.default_rng(0)
+    permutation = rng.permutation(len(vertices))
+    rank = np.empty_like(permutation)
+    rank[permutation] = np.arange(len(permutation))
+    shuffled = (vertices[permutation], rank[faces][rng.permutation(len(faces))].astype(np.int32))
+    
+    def pack(mesh):
+        mesh.packOptimally()
+        return mesh
+    
+    def relax(mesh):
+        params = mrmeshpy.MeshRelaxParams()
+        params.iterations = 5
+        mrmeshpy.relax(mesh, params)
+    
+    def collision(mesh):
+        other = mrmeshpy.copyMesh(mesh)
+        other.transform(mrmeshpy.AffineXf3f.translation(mrmeshpy.Vector3f(0.5, 0.0, 0.0)))
+        mrmeshpy.findCollidingTriangles(mrmeshpy.MeshPart(mesh), mrmeshpy.MeshPart(other))
+    
+    def offset(mesh):
+        params = mrmeshpy.OffsetParameters()
+        params.voxelSize = mrmeshpy.suggestVoxelSize(mesh, 1000000)
+        mrmeshpy.offsetMesh(mesh, 0.05, params)
+    
+    variants = {
+        "shuffled": lambda mesh: mesh,
+        "morton": lambda mesh: utils.reorder_mesh(mesh, "morton"),
+        "hilbert": lambda mesh: utils.reorder_mesh(mesh, "hilbert"),
+        "pack": pack,
+    }
+    operations = {"relax": relax, "collision": collision, "offset": offset}
+    
+    def measure(fn, prepare):
+        times = []
+        for _ in range(args.repeat):
+            mesh = prepare()
+            start = time.perf_counter()
+            fn(mesh)
+            times.append(time.perf_counter() - start)
+        return float(np.median(times))
+    
+    results = []
+    print(f"{len(faces)} faces")
+    print(f"{'variant':>10} {'reorder ms':>11} " + " ".join(f"{name + ' ms':>13}" for name in operations))
+    for name, reorder in variants.items():
+        def prepare(reorder=reorder):
+            return reorder(mrmeshnumpy.meshFromFacesVerts(*shuffled[::-1]))
+        
+        row = {"variant": name, "faces": len(faces)}
+        row["reorder"] = measure(reorder, lambda: mrmeshnumpy.meshFromFacesVerts(*shuffled[::-1]))
+        for operation, fn in operations.items():
+            row[operation] = measure(fn, prepare)
+        results.append(row)
+        print(f"{name:>10} {row['reorder'] * 1e3:>11.1f} "
+              + " ".join(f"{row[operation] * 1e3:>13.1f}" for operation in operations))
+    
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Scaling of the heavy nodes with the native thread limit.
+
+Runs Decimate, Offset, Boolean and ICP on a noisy sphere with the MeshLib
+(TBB) thread limit set to 1, 2, 4, ... up to the number of cores, and prints
+wall time, speedup over one thread and parallel efficiency.
+
+With --background N, N processes spinning on the CPU run during the
+measurements to emulate other work sharing the machine (e.g. PyTorch
+preprocessing), which shows how much a thread limit costs or saves under
+contention.
+
+Usage:
+    python benchmarks/thread_scaling.py [--resolution 512] [--background 0] [--json out.json]
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+
+from common import load_package, timeit
+
+
+def _spin(stop):
+    while not stop.is_set():
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--resolution", type=int, default=512)
+    parser.add_argument("--max-threads", type=int, default=os.cpu_count())
+    parser.add_argument("--background", type=int, default=0, help="Number of busy processes running meanwhile")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--json", help="Write the results to this file")
+    args = parser.parse_args()
+    
+    package = load_package()
+    nodes = package.nodes.NODE_CLASS_MAPPINGS
+    thread_control = package.thread_control
+    
+    sphere, = nodes["MeshlibMakeSphere"]().process(1.0, args.resolution, args.resolution)
+    mesh, = nodes["MeshlibAddNoise"]().process(sphere, 0.001, 0)
+    (shifted,), = nodes["MeshlibTransform"]().process([mesh], [0.5], [0.2], [0.1], [5.0], [0.0], [0.0], [1.0])
+    faces = mesh.topology.numValidFaces()
+    
+    workloads = {
+        "decimate": lambda: nodes["MeshlibDecimate"]().process([mesh], [faces // 4], [0.001], [64]),
+        "offset": lambda: nodes["MeshlibOffset"]().process([mesh], [0.05], [2000000]),
+        "boolean": lambda: nodes["MeshlibBoolean"]().process(mesh, shifted, "Union", "exact"),
+        "icp": lambda: nodes["MeshlibICP"]().process(shifted, mesh, 0.01, 0.1, 0.003, 100),
+    }
+    
+    thread_counts = []
+    count = 1
+    while count < args.max_threads:
+        thread_counts.append(count)
+        count *= 2
+    thread_counts.append(args.max_threads)
+    
+    stop = multiprocessing.Event()
+    background = [multiprocessing.Process(target=_spin, args=(stop,), daemon=True) for _ in range(args.background)]
+    for process in background:
+        process.start()
+    
+    results = []
+    print(f"{faces} faces, {os.cpu_count()} cores, {args.background} busy background processes")
+    print(f"{'node':>10} {'threads':>8} {'ms':>10} {'speedup':>8} {'efficiency':>11}")
+    try:
+        for name, workload in workloads.items():
+            # Warm up caches (AABB trees, allocator) outside the measurements
+            workload()
+            single = None
+            for threads in thread_counts:
+                thread_control.set_thread_limit(threads)
+                seconds, _ = timeit(workload, args.repeat)
+                single = single or seconds
+                row = {
+                    "node": name,
+                    "threads": threads,
+                    "active_threads": thread_control.active_thread_limit(),
+                    "background": args.background,
+                    "faces": faces,
+                    "seconds": seconds,
+                    "speedup": single / seconds,
+                    "efficiency": single / seconds / threads,
+                }
+                results.append(row)
+                print(f"{name:>10} {threads:>8} {seconds * 1e3:>10.1f} {row['speedup']:>8.2f} {row['efficiency']:>11.0%}")
+    finally:
+        thread_control.set_thread_limit(0)
+        stop.set()
+        for process in background:
+            process.join()
+    
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
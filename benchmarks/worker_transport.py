@@ -0,0 +1,84 @@
+"""
+Transport overhead of the process worker pool against mesh size.
+
+For UV spheres of growing resolution, measures:
+- arrays: extracting vertex / face arrays and passing them through shared memory
+- pickle: pickling and unpickling the same arrays instead (reference)
+- rebuild: rebuilding the mesh topology from the arrays (mrmeshnumpy)
+- worker: a full round trip through a worker process (mesh out and back,
+  i.e. two array transfers and two rebuilds)
+- copy: mrmeshpy.copyMesh, the cheapest thing a node can do with a mesh
+
+The rebuild dominates: dispatching to a worker pays off for operations that
+take much longer than two rebuilds of their input and output.
+
+Usage:
+    python benchmarks/worker_transport.py [--max-resolution 1024] [--json out.json]
+"""
+
+import argparse
+import json
+import pickle
+
+from common import load_package, timeit
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--max-resolution", type=int, default=1024)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--json", help="Write the results to this file")
+    args = parser.parse_args()
+    
+    package = load_package()
+    worker_pool = package.worker_pool
+    from meshlib import mrmeshpy, mrmeshnumpy
+    
+    # Start the worker outside the measurements
+    pool, future = worker_pool.submit(worker_pool._echo, None)
+    future.result()
+    
+    def shm_round_trip(mesh):
+        blocks = []
+        vertices, faces = package.utils.mesh_to_numpy(mesh)
+        encoded = [worker_pool.encode(vertices, blocks), worker_pool.encode(faces, blocks)]
+        try:
+            return worker_pool.decode(encoded)
+        finally:
+            worker_pool._release(blocks)
+    
+    def pickle_round_trip(mesh):
+        return pickle.loads(pickle.dumps(package.utils.mesh_to_numpy(mesh), protocol=pickle.HIGHEST_PROTOCOL))
+    
+    def worker_round_trip(mesh):
+        blocks = []
+        pool, future = worker_pool.submit(worker_pool._echo, worker_pool.encode(mesh, blocks))
+        return worker_pool._collect("echo", pool, future, blocks)
+    
+    results = []
+    resolution = 64
+    print(f"{'faces':>10} {'MB':>8} {'arrays ms':>10} {'pickle ms':>10} {'rebuild ms':>11} {'worker ms':>10} {'copy ms':>9}")
+    while resolution <= args.max_resolution:
+        mesh = mrmeshpy.makeUVSphere(1.0, resolution, resolution)
+        vertices, faces = package.utils.mesh_to_numpy(mesh)
+        row = {
+            "faces": len(faces),
+            "megabytes": (vertices.nbytes + faces.nbytes) / 1e6,
+            "arrays": timeit(lambda: shm_round_trip(mesh), args.repeat)[0],
+            "pickle": timeit(lambda: pickle_round_trip(mesh), args.repeat)[0],
+            "rebuild": timeit(lambda: mrmeshnumpy.meshFromFacesVerts(faces, vertices), args.repeat)[0],
+            "worker": timeit(lambda: worker_round_trip(mesh), args.repeat)[0],
+            "copy": timeit(lambda: mrmeshpy.copyMesh(mesh), args.repeat)[0],
+        }
+        results.append(row)
+        print(f"{row['faces']:>10} {row['megabytes']:>8.1f} {row['arrays'] * 1e3:>10.1f} {row['pickle'] * 1e3:>10.1f} "
+              f"{row['rebuild'] * 1e3:>11.1f} {row['worker'] * 1e3:>10.1f} {row['copy'] * 1e3:>9.1f}")
+        resolution *= 2
+    
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
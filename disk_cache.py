@@ -0,0 +1,293 @@
+"""
+Persistent result cache for ComfyUI-Meshlib
+
+Opt-in on-disk cache for expensive nodes. Results are keyed by a content
+fingerprint of the input meshes / point clouds (hash of their arrays), the
+other node inputs and the node's source code, so identical work is reused
+across restarts and by every machine sharing the cache directory, no matter
+which upstream node produced the inputs.
+
+Enable it by setting MESHLIB_DISK_CACHE_DIR to a directory. The cache size is
+capped by MESHLIB_DISK_CACHE_SIZE_MB (default 4096); least recently used
+entries are evicted first.
+
+Each entry is a directory holding meta.json and one file per mesh (MeshLib's
+native .mrmesh format, which stores the topology and loads several times
+faster than rebuilding it) or array (.npy).
+"""
+
+import contextlib
+import hashlib
+import inspect
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from importlib import metadata
+from multiprocessing import parent_process
+
+import numpy as np
+
+from .utils import (
+    mesh_fingerprint,
+    pointcloud_fingerprint,
+    pointcloud_to_numpy,
+    numpy_to_pointcloud,
+    wrap_node_function,
+)
+
+
+# Bump when the entry layout changes
+CACHE_FORMAT = 1
+
+# Nodes whose results are cached
+CACHED_NODES = (
+    "MeshlibOffset",
+    "MeshlibBoolean",
+    "MeshlibBooleanMany",
+    "MeshlibDecimate",
+    "MeshlibTriangulatePointCloud",
+)
+
+# Inputs that don't change the result and are left out of the key
+UNKEYED_INPUTS = ("max_threads", "max_workers")
+
+_eviction_lock = threading.Lock()
+
+
+class _Uncacheable(Exception):
+    """Raised for inputs or outputs the cache cannot represent."""
+
+
+def cache_directory():
+    """Cache directory from MESHLIB_DISK_CACHE_DIR, or None when disabled."""
+    return os.environ.get("MESHLIB_DISK_CACHE_DIR") or None
+
+
+def cache_size_limit():
+    """Size cap in bytes from MESHLIB_DISK_CACHE_SIZE_MB."""
+    try:
+        return int(float(os.environ.get("MESHLIB_DISK_CACHE_SIZE_MB", "4096")) * 1024 * 1024)
+    except ValueError:
+        return 4096 * 1024 * 1024
+
+
+def _key_material(value):
+    """JSON-serializable stand-in of a node input; meshes and clouds become fingerprints."""
+    import meshlib.mrmeshpy as mrmeshpy
+    
+    if isinstance(value, mrmeshpy.Mesh):
+        return ["mesh", mesh_fingerprint(value)]
+    if isinstance(value, mrmeshpy.PointCloud):
+        return ["points", pointcloud_fingerprint(value)]
+    if isinstance(value, np.ndarray):
+        return ["array", value.dtype.str, list(value.shape),
+                hashlib.blake2b(np.ascontiguousarray(value).tobytes(), digest_size=16).hexdigest()]
+    if isinstance(value, (list, tuple)):
+        return [_key_material(item) for item in value]
+    if isinstance(value, dict):
+        return {str(key): _key_material(item) for key, item in sorted(value.items())}
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    
+    raise _Uncacheable(type(value).__name__)
+
+
+def cache_key(node_name, code_hash, kwargs):
+    """
+    Cache key of a node call.
+    
+    Args:
+        node_name: Node class name
+        code_hash: Hash of the node source, so code changes invalidate entries
+        kwargs: Node inputs
+    
+    Returns:
+        Hex digest string
+    """
+    material = {
+        "format": CACHE_FORMAT,
+        "node": node_name,
+        "code": code_hash,
+        "meshlib": metadata.version("meshlib"),
+        "inputs": _key_material(kwargs),
+    }
+    encoded = json.dumps(material, sort_keys=True, allow_nan=True).encode()
+    return hashlib.blake2b(encoded, digest_size=20).hexdigest()
+
+
+def _save_output(value, directory, index):
+    import meshlib.mrmeshpy as mrmeshpy
+    
+    if isinstance(value, mrmeshpy.Mesh):
+        filename = f"{index}.mrmesh"
+        mrmeshpy.saveMesh(value, os.path.join(directory, filename))
+        return {"type": "mesh", "file": filename}
+    if isinstance(value, mrmeshpy.PointCloud):
+        coords, normals = pointcloud_to_numpy(value)
+        entry = {"type": "points", "file": f"{index}.npy", "normals": None}
+        np.save(os.path.join(directory, entry["file"]), coords)
+        if normals is not None:
+            entry["normals"] = f"{index}_normals.npy"
+            np.save(os.path.join(directory, entry["normals"]), normals)
+        return entry
+    if isinstance(value, np.ndarray):
+        filename = f"{index}.npy"
+        np.save(os.path.join(directory, filename), value)
+        return {"type": "array", "file": filename}
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return {"type": "value", "value": value}
+    
+    raise _Uncacheable(type(value).__name__)
+
+
+def _load_output(entry, directory):
+    import meshlib.mrmeshpy as mrmeshpy
+    
+    if entry["type"] == "mesh":
+        return mrmeshpy.loadMesh(os.path.join(directory, entry["file"]))
+    if entry["type"] == "points":
+        coords = np.load(os.path.join(directory, entry["file"]))
+        normals = np.load(os.path.join(directory, entry["normals"])) if entry["normals"] else None
+        return numpy_to_pointcloud(coords, normals)
+    if entry["type"] == "array":
+        return np.load(os.path.join(directory, entry["file"]))
+    
+    return entry["value"]
+
+
+def load(key):
+    """Cached result for a key, or None. A hit refreshes the entry for LRU eviction."""
+    directory = os.path.join(cache_directory(), key[:2], key)
+    try:
+        with open(os.path.join(directory, "meta.json")) as f:
+            meta = json.load(f)
+        result = tuple(_load_output(entry, directory) for entry in meta["outputs"])
+    except (OSError, ValueError, KeyError, RuntimeError):
+        return None
+    
+    with contextlib.suppress(OSError):
+        os.utime(directory)
+    
+    return result
+
+
+def store(key, result):
+    """
+    Write a result tuple to the cache (atomically) and evict old entries.
+    
+    Results containing values the cache cannot represent are skipped.
+    """
+    root = cache_directory()
+    directory = os.path.join(root, key[:2], key)
+    if os.path.isdir(directory):
+        return
+    
+    # Staged next to the buckets, which are only created for complete entries
+    staging = tempfile.mkdtemp(prefix=".tmp-", dir=root)
+    try:
+        outputs = [_save_output(value, staging, index) for index, value in enumerate(result)]
+        with open(os.path.join(staging, "meta.json"), "w") as f:
+            json.dump({"format": CACHE_FORMAT, "created": time.time(), "outputs": outputs}, f)
+        os.makedirs(os.path.dirname(directory), exist_ok=True)
+        # Another process may have stored the same entry meanwhile
+        with contextlib.suppress(OSError):
+            os.rename(staging, directory)
+    except _Uncacheable:
+        pass
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+    
+    evict(cache_size_limit())
+
+
+def evict(limit):
+    """Delete least recently used entries until the cache is below limit bytes."""
+    root = cache_directory()
+    
+    with _eviction_lock:
+        entries = []
+        total = 0
+        for bucket in os.scandir(root):
+            if bucket.name.startswith(".tmp-") or not bucket.is_dir():
+                continue
+            for entry in os.scandir(bucket.path):
+                if entry.name.startswith(".tmp-") or not entry.is_dir():
+                    continue
+                try:
+                    size = sum(f.stat().st_size for f in os.scandir(entry.path))
+                    entries.append((entry.stat().st_mtime, size, entry.path))
+                except OSError:
+                    continue
+                total += size
+        
+        for _, size, path in sorted(entries):
+            if total <= limit:
+                break
+            shutil.rmtree(path, ignore_errors=True)
+            total -= size
+
+
+def _cached(node_name, code_hash):
+    def wrapper(function):
+        signature = inspect.signature(function)
+        
+        def lookup(self, args, kwargs):
+            arguments = signature.bind(self, *args, **kwargs).arguments
+            arguments.pop(next(iter(signature.parameters)))
+            for name in UNKEYED_INPUTS:
+                arguments.pop(name, None)
+            try:
+                return cache_key(node_name, code_hash, dict(arguments))
+            except _Uncacheable:
+                return None
+        
+        if inspect.iscoroutinefunction(function):
+            async def cached(self, *args, **kwargs):
+                key = lookup(self, args, kwargs)
+                result = load(key) if key else None
+                if result is None:
+                    result = await function(self, *args, **kwargs)
+                    if key and isinstance(result, tuple):
+                        store(key, result)
+                return result
+        else:
+            def cached(self, *args, **kwargs):
+                key = lookup(self, args, kwargs)
+                result = load(key) if key else None
+                if result is None:
+                    result = function(self, *args, **kwargs)
+                    if key and isinstance(result, tuple):
+                        store(key, result)
+                return result
+        
+        return cached
+    
+    return wrapper
+
+
+def install_disk_cache(node_class_mappings):
+    """
+    Wrap the FUNCTION of the CACHED_NODES with the disk cache when enabled.
+    
+    List (batch) nodes cache their ITEM_FUNCTION instead, one entry per item,
+    so a list that shares items with an earlier run only computes the new ones.
+    
+    Does nothing when MESHLIB_DISK_CACHE_DIR is unset, and inside worker
+    processes (the server process looks the cache up before dispatching).
+    
+    Args:
+        node_class_mappings: NODE_CLASS_MAPPINGS dict
+    """
+    if cache_directory() is None or parent_process() is not None:
+        return
+    
+    os.makedirs(cache_directory(), exist_ok=True)
+    for node_name in CACHED_NODES:
+        node_class = node_class_mappings.get(node_name)
+        if node_class is None:
+            continue
+        code_hash = hashlib.blake2b(inspect.getsource(inspect.getmodule(node_class)).encode(), digest_size=16).hexdigest()
+        wrap_node_function(node_class, _cached(node_name, code_hash), getattr(node_class, "ITEM_FUNCTION", None))
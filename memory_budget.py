@@ -0,0 +1,313 @@
+"""
+Memory budget for ComfyUI-Meshlib
+
+Voxel offsets, triangulation, booleans and decimation of large inputs can
+allocate gigabytes, and a native allocation failure takes the whole ComfyUI
+server down. Before such work starts, the nodes predict its peak memory from
+the input size, the voxel count and the operation, and compare it with a
+budget:
+
+- MESHLIB_MEMORY_BUDGET_MB: budget in MiB. Unset or "auto" uses 80% of the
+  memory currently available to the system; 0 disables the checks.
+- MESHLIB_MEMORY_POLICY: what to do when a job does not fit.
+    - auto: switch to a tiled mode where the node has one, otherwise lower
+      the voxel count until it fits, otherwise fail
+    - reduce: only lower the voxel count, otherwise fail
+    - fail: fail with a message naming the estimate and the budget
+
+The Memory Settings node changes both at runtime. Jobs running at the same
+time reserve their estimates, so concurrent list items or booleans wait for
+each other instead of jointly exceeding the budget. Worker processes check
+their own jobs against the same budget.
+
+The estimates are linear models fitted to the peak resident memory of
+MeshLib 3.x (benchmarks/memory_estimate.py compares them with measurements);
+they aim to be slightly pessimistic.
+"""
+
+import math
+import os
+import threading
+
+
+MEMORY_POLICIES = ("auto", "reduce", "fail")
+
+# Share of the available memory used when no budget is set
+AUTO_BUDGET_FRACTION = 0.8
+
+# Allocator and thread pool overhead of any MeshLib call
+BASE_BYTES = 8 << 20
+# A mesh with its topology (copies, outputs)
+MESH_BYTES_PER_FACE = 60
+# Decimation: working copy, packing and the per-part quadric state
+DECIMATE_BYTES_PER_FACE = 140
+# Exact boolean: AABB trees of both operands, intersection contours and the result
+BOOLEAN_BYTES_PER_FACE = 165
+# Voxel boolean: two dense float fields as MeshLib volumes and numpy arrays, the combined field
+VOXEL_BOOLEAN_BYTES_PER_VOXEL = 36
+VOXEL_BOOLEAN_BYTES_PER_FACE = 110
+# Offsets keep a sparse narrow band around the surface
+OFFSET_BYTES_PER_BAND_VOXEL = 32
+OFFSET_BYTES_PER_FACE = 24
+OFFSET_BAND_VOXELS = 3
+# Triangulation: point cloud, neighbour search tree and local triangulations
+TRIANGULATION_BYTES_PER_POINT = 240
+
+_budget_mb = None
+_policy = None
+_reserved = 0
+_condition = threading.Condition()
+
+
+class MemoryBudgetError(MemoryError):
+    """A job is predicted to need more memory than the budget allows."""
+
+
+def format_bytes(nbytes):
+    """Human readable size, e.g. "1.5 GiB"."""
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if abs(nbytes) < 1024 or unit == "GiB":
+            return f"{nbytes:.0f} {unit}" if unit == "B" else f"{nbytes:.1f} {unit}"
+        nbytes /= 1024
+
+
+def available_memory():
+    """Bytes of memory available to new allocations, or None when unknown."""
+    try:
+        with open("/proc/meminfo") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (ValueError, OSError, AttributeError):
+        return None
+
+
+def _parse_budget(value):
+    value = str(value).strip().lower()
+    if value in ("", "auto"):
+        return None
+    try:
+        return max(0, int(float(value)))
+    except ValueError:
+        print(f"ComfyUI-Meshlib: invalid MESHLIB_MEMORY_BUDGET_MB value {value!r}, using auto")
+        return None
+
+
+def set_memory_budget(budget_mb=None, policy=None):
+    """
+    Set the process-wide budget and policy.
+    
+    Args:
+        budget_mb: Budget in MiB, 0 to disable the checks, None for auto
+        policy: One of MEMORY_POLICIES, None to keep the current one
+    """
+    global _budget_mb, _policy
+    
+    if policy is not None and policy not in MEMORY_POLICIES:
+        raise ValueError(f"Unknown memory policy {policy!r}, expected one of {MEMORY_POLICIES}")
+    with _condition:
+        _budget_mb = budget_mb
+        if policy is not None:
+            _policy = policy
+        _condition.notify_all()
+
+
+def memory_policy():
+    """The active policy: "auto", "reduce" or "fail"."""
+    if _policy is not None:
+        return _policy
+    policy = os.environ.get("MESHLIB_MEMORY_POLICY", "auto").strip().lower()
+    if policy not in MEMORY_POLICIES:
+        print(f"ComfyUI-Meshlib: unknown MESHLIB_MEMORY_POLICY value {policy!r}, using auto")
+        return "auto"
+    return policy
+
+
+def memory_budget():
+    """
+    The budget in bytes, or None when the checks are disabled.
+    
+    In auto mode it is a share of the currently available memory plus what
+    running Meshlib jobs have reserved but may not have allocated yet.
+    """
+    budget_mb = _budget_mb
+    if budget_mb is None:
+        budget_mb = _parse_budget(os.environ.get("MESHLIB_MEMORY_BUDGET_MB", "auto"))
+    if budget_mb == 0:
+        return None
+    if budget_mb is not None:
+        return budget_mb << 20
+    
+    available = available_memory()
+    if available is None:
+        return None
+    return int(AUTO_BUDGET_FRACTION * available) + _reserved
+
+
+def _mesh_faces(mesh):
+    return mesh.topology.numValidFaces()
+
+
+def estimate_decimate(mesh):
+    """Peak bytes of decimating a copy of mesh."""
+    return BASE_BYTES + DECIMATE_BYTES_PER_FACE * _mesh_faces(mesh)
+
+
+def estimate_boolean(mesh_a, mesh_b):
+    """Peak bytes of an exact boolean of two meshes."""
+    return BASE_BYTES + BOOLEAN_BYTES_PER_FACE * (_mesh_faces(mesh_a) + _mesh_faces(mesh_b))
+
+
+def estimate_voxel_boolean(mesh_a, mesh_b, voxel_count):
+    """Peak bytes of a voxel boolean on a dense grid of voxel_count voxels."""
+    faces = _mesh_faces(mesh_a) + _mesh_faces(mesh_b)
+    return BASE_BYTES + VOXEL_BOOLEAN_BYTES_PER_VOXEL * voxel_count + VOXEL_BOOLEAN_BYTES_PER_FACE * faces
+
+
+def estimate_offset(mesh, offset, voxel_count, area=None):
+    """
+    Peak bytes of offsetMesh with a voxel size suggested for voxel_count.
+    
+    The distance field is a narrow band of about OFFSET_BAND_VOXELS plus the
+    offset distance on either side of the surface, so memory follows the
+    surface area over the squared voxel size (never more than the whole grid).
+    
+    Args:
+        mesh: meshlib.mrmeshpy.Mesh
+        offset: Offset distance
+        voxel_count: Voxel count the voxel size is derived from
+        area: Surface area of mesh when already known
+    """
+    size = mesh.computeBoundingBox().size()
+    extent = [max(size.x, 1e-12), max(size.y, 1e-12), max(size.z, 1e-12)]
+    voxel_size = (math.prod(extent) / voxel_count) ** (1.0 / 3.0)
+    if area is None:
+        area = mesh.area()
+    
+    width = 2 * (abs(offset) / voxel_size + OFFSET_BAND_VOXELS)
+    band = area / voxel_size ** 2 * width
+    # The grid grows with a positive offset on every side
+    grid = math.prod(length + 2 * max(offset, 0.0) for length in extent) / voxel_size ** 3
+    band = min(band, grid)
+    
+    return int(BASE_BYTES + OFFSET_BYTES_PER_BAND_VOXEL * band + OFFSET_BYTES_PER_FACE * _mesh_faces(mesh))
+
+
+def estimate_triangulation(num_points):
+    """Peak bytes of triangulating num_points points."""
+    return BASE_BYTES + TRIANGULATION_BYTES_PER_POINT * num_points
+
+
+def estimate_tiled_triangulation(num_points, tile_points, workers):
+    """Peak bytes of triangulating num_points points in tiles, workers tiles at a time."""
+    in_flight = min(num_points, tile_points * max(workers, 1))
+    # The stitched result has about two faces per point
+    return BASE_BYTES + TRIANGULATION_BYTES_PER_POINT * in_flight + 2 * MESH_BYTES_PER_FACE * num_points
+
+
+def reserve_memory(nbytes):
+    """
+    Context manager holding nbytes of the budget while a job runs.
+    
+    Waits while other running jobs hold so much that nbytes would not fit;
+    a job alone always runs (it was checked against the budget before).
+    """
+    return _Reservation(nbytes)
+
+
+class _Reservation:
+    def __init__(self, nbytes):
+        self.nbytes = nbytes
+    
+    def __enter__(self):
+        global _reserved
+        
+        with _condition:
+            while _reserved > 0:
+                budget = memory_budget()
+                if budget is None or _reserved + self.nbytes <= budget:
+                    break
+                _condition.wait(1.0)
+            _reserved += self.nbytes
+        return self
+    
+    def __exit__(self, *exc_info):
+        global _reserved
+        
+        with _condition:
+            _reserved -= self.nbytes
+            _condition.notify_all()
+        return False
+
+
+def check_memory(operation, estimate):
+    """
+    Fail fast when a job without a cheaper alternative does not fit.
+    
+    Args:
+        operation: Name of the job for the message
+        estimate: Predicted peak bytes
+    
+    Raises:
+        MemoryBudgetError: If estimate exceeds the budget
+    """
+    budget = memory_budget()
+    if budget is not None and estimate > budget:
+        raise MemoryBudgetError(
+            f"{operation} would need about {format_bytes(estimate)} of memory, more than the budget of "
+            f"{format_bytes(budget)}. Use a smaller input, or raise MESHLIB_MEMORY_BUDGET_MB "
+            f"(Memory Settings node) if the machine has the memory."
+        )
+
+
+def fits_memory(estimate):
+    """Whether estimate bytes fit the budget."""
+    budget = memory_budget()
+    return budget is None or estimate <= budget
+
+
+def fit_voxel_count(operation, estimate, voxel_count, minimum=100000):
+    """
+    Largest voxel count up to voxel_count whose estimate fits the budget.
+    
+    Args:
+        operation: Name of the job for messages
+        estimate: Function voxel_count -> predicted peak bytes
+        voxel_count: Requested voxel count
+        minimum: Lowest voxel count worth running
+    
+    Returns:
+        The voxel count to use (voxel_count itself when it fits)
+    
+    Raises:
+        MemoryBudgetError: If the policy is "fail", or even minimum does not fit
+    """
+    budget = memory_budget()
+    requested = estimate(voxel_count)
+    if budget is None or requested <= budget:
+        return voxel_count
+    
+    if memory_policy() == "fail" or estimate(minimum) > budget:
+        raise MemoryBudgetError(
+            f"{operation} with {voxel_count:,} voxels would need about {format_bytes(requested)} of memory, "
+            f"more than the budget of {format_bytes(budget)}. Lower voxel_count, or raise "
+            f"MESHLIB_MEMORY_BUDGET_MB (Memory Settings node) if the machine has the memory."
+        )
+    
+    # Estimates grow monotonically with the voxel count; bisect in log space
+    low, high = math.log(minimum), math.log(voxel_count)
+    for _ in range(20):
+        middle = (low + high) / 2
+        if estimate(int(math.exp(middle))) <= budget:
+            low = middle
+        else:
+            high = middle
+    fitted = int(math.exp(low))
+    
+    print(f"ComfyUI-Meshlib: {operation}: voxel_count lowered from {voxel_count:,} to {fitted:,} to fit the "
+          f"memory budget of {format_bytes(budget)} (estimated {format_bytes(requested)})")
+    return fitted
@@ -8,6 +8,10 @@ from .io_nodes import (
     MeshlibSavePoints,
     MeshlibFromTrimesh,
     MeshlibToTrimesh,
+    MeshlibMeshToArrays,
+    MeshlibMeshFromArrays,
+    MeshlibPointCloudToArrays,
+    MeshlibPointCloudFromArrays,
     MeshlibCopyMesh,
 )
 
@@ -20,6 +24,7 @@ from .primitive_nodes import (
 
 from .boolean_nodes import (
     MeshlibBoolean,
+    MeshlibBooleanMany,
 )
 
 from .modification_nodes import (
@@ -28,6 +33,7 @@ from .modification_nodes import (
     MeshlibOffset,
     MeshlibRelax,
     MeshlibTransform,
+    MeshlibReorderMesh,
 )
 
 from .repair_nodes import (
@@ -40,6 +46,7 @@ from .repair_nodes import (
 from .deformation_nodes import (
     MeshlibFreeFormDeform,
     MeshlibLaplacianDeform,
+    MeshlibDeformSequence,
 )
 
 from .analysis_nodes import (
@@ -56,6 +63,9 @@ from .pointcloud_nodes import (
     MeshlibTriangulatePointCloud,
     MeshlibPointSampling,
     MeshlibPointCloudFromMesh,
+    MeshlibDownsamplePointCloud,
+    MeshlibRemoveOutliers,
+    MeshlibEstimateNormals,
 )
 
 from .noise_nodes import (
@@ -63,6 +73,26 @@ from .noise_nodes import (
     MeshlibDenoise,
 )
 
+from .component_nodes import (
+    MeshlibSplitComponents,
+    MeshlibMapComponents,
+)
+
+from .partition_nodes import (
+    MeshlibOctreePartition,
+    MeshlibOctreeProcess,
+    MeshlibOctreeMerge,
+)
+
+from .profiler_nodes import (
+    MeshlibProfilerReport,
+)
+
+from .settings_nodes import (
+    MeshlibThreadSettings,
+    MeshlibMemorySettings,
+)
+
 # Export all node classes
 NODE_CLASS_MAPPINGS = {
     # I/O Nodes
@@ -72,6 +102,10 @@ NODE_CLASS_MAPPINGS = {
     "MeshlibSavePoints": MeshlibSavePoints,
     "MeshlibFromTrimesh": MeshlibFromTrimesh,
     "MeshlibToTrimesh": MeshlibToTrimesh,
+    "MeshlibMeshToArrays": MeshlibMeshToArrays,
+    "MeshlibMeshFromArrays": MeshlibMeshFromArrays,
+    "MeshlibPointCloudToArrays": MeshlibPointCloudToArrays,
+    "MeshlibPointCloudFromArrays": MeshlibPointCloudFromArrays,
     "MeshlibCopyMesh": MeshlibCopyMesh,
     
     # Primitive Nodes
@@ -82,6 +116,7 @@ NODE_CLASS_MAPPINGS = {
     
     # Boolean Nodes
     "MeshlibBoolean": MeshlibBoolean,
+    "MeshlibBooleanMany": MeshlibBooleanMany,
     
     # Modification Nodes
     "MeshlibDecimate": MeshlibDecimate,
@@ -89,6 +124,7 @@ NODE_CLASS_MAPPINGS = {
     "MeshlibOffset": MeshlibOffset,
     "MeshlibRelax": MeshlibRelax,
     "MeshlibTransform": MeshlibTransform,
+    "MeshlibReorderMesh": MeshlibReorderMesh,
     
     # Repair Nodes
     "MeshlibFillHoles": MeshlibFillHoles,
@@ -99,6 +135,7 @@ NODE_CLASS_MAPPINGS = {
     # Deformation Nodes
     "MeshlibFreeFormDeform": MeshlibFreeFormDeform,
     "MeshlibLaplacianDeform": MeshlibLaplacianDeform,
+    "MeshlibDeformSequence": MeshlibDeformSequence,
     
     # Analysis Nodes
     "MeshlibSignedDistance": MeshlibSignedDistance,
@@ -112,10 +149,29 @@ NODE_CLASS_MAPPINGS = {
     "MeshlibTriangulatePointCloud": MeshlibTriangulatePointCloud,
     "MeshlibPointSampling": MeshlibPointSampling,
     "MeshlibPointCloudFromMesh": MeshlibPointCloudFromMesh,
+    "MeshlibDownsamplePointCloud": MeshlibDownsamplePointCloud,
+    "MeshlibRemoveOutliers": MeshlibRemoveOutliers,
+    "MeshlibEstimateNormals": MeshlibEstimateNormals,
     
     # Noise Nodes
     "MeshlibAddNoise": MeshlibAddNoise,
     "MeshlibDenoise": MeshlibDenoise,
+    
+    # Component Nodes
+    "MeshlibSplitComponents": MeshlibSplitComponents,
+    "MeshlibMapComponents": MeshlibMapComponents,
+    
+    # Partition Nodes
+    "MeshlibOctreePartition": MeshlibOctreePartition,
+    "MeshlibOctreeProcess": MeshlibOctreeProcess,
+    "MeshlibOctreeMerge": MeshlibOctreeMerge,
+    
+    # Profiler Nodes
+    "MeshlibProfilerReport": MeshlibProfilerReport,
+    
+    # Settings Nodes
+    "MeshlibThreadSettings": MeshlibThreadSettings,
+    "MeshlibMemorySettings": MeshlibMemorySettings,
 }
 
 NODE_DISPLAY_NAME_MAPPINGS = {
@@ -126,6 +182,10 @@ NODE_DISPLAY_NAME_MAPPINGS = {
     "MeshlibSavePoints": "Meshlib - Save Points",
     "MeshlibFromTrimesh": "Meshlib - From Trimesh",
     "MeshlibToTrimesh": "Meshlib - To Trimesh",
+    "MeshlibMeshToArrays": "Meshlib - Mesh To Arrays",
+    "MeshlibMeshFromArrays": "Meshlib - Mesh From Arrays",
+    "MeshlibPointCloudToArrays": "Meshlib - Point Cloud To Arrays",
+    "MeshlibPointCloudFromArrays": "Meshlib - Point Cloud From Arrays",
     "MeshlibCopyMesh": "Meshlib - Copy Mesh",
     
     # Primitive Nodes
@@ -136,6 +196,7 @@ NODE_DISPLAY_NAME_MAPPINGS = {
     
     # Boolean Nodes
     "MeshlibBoolean": "Meshlib - Boolean",
+    "MeshlibBooleanMany": "Meshlib - Boolean (Many)",
     
     # Modification Nodes
     "MeshlibDecimate": "Meshlib - Decimate",
@@ -143,6 +204,7 @@ NODE_DISPLAY_NAME_MAPPINGS = {
     "MeshlibOffset": "Meshlib - Offset",
     "MeshlibRelax": "Meshlib - Relax",
     "MeshlibTransform": "Meshlib - Transform",
+    "MeshlibReorderMesh": "Meshlib - Reorder Mesh",
     
     # Repair Nodes
     "MeshlibFillHoles": "Meshlib - Fill Holes",
@@ -153,6 +215,7 @@ NODE_DISPLAY_NAME_MAPPINGS = {
     # Deformation Nodes
     "MeshlibFreeFormDeform": "Meshlib - Free Form Deform",
     "MeshlibLaplacianDeform": "Meshlib - Laplacian Deform",
+    "MeshlibDeformSequence": "Meshlib - Deform Sequence",
     
     # Analysis Nodes
     "MeshlibSignedDistance": "Meshlib - Signed Distance",
@@ -166,8 +229,27 @@ NODE_DISPLAY_NAME_MAPPINGS = {
     "MeshlibTriangulatePointCloud": "Meshlib - Triangulate Point Cloud",
     "MeshlibPointSampling": "Meshlib - Point Sampling",
     "MeshlibPointCloudFromMesh": "Meshlib - Point Cloud From Mesh",
+    "MeshlibDownsamplePointCloud": "Meshlib - Downsample Point Cloud",
+    "MeshlibRemoveOutliers": "Meshlib - Remove Outliers",
+    "MeshlibEstimateNormals": "Meshlib - Estimate Normals",
     
     # Noise Nodes
     "MeshlibAddNoise": "Meshlib - Add Noise",
     "MeshlibDenoise": "Meshlib - Denoise",
+    
+    # Component Nodes
+    "MeshlibSplitComponents": "Meshlib - Split Components",
+    "MeshlibMapComponents": "Meshlib - Map Over Components",
+    
+    # Partition Nodes
+    "MeshlibOctreePartition": "Meshlib - Octree Partition",
+    "MeshlibOctreeProcess": "Meshlib - Octree Process",
+    "MeshlibOctreeMerge": "Meshlib - Octree Merge",
+    
+    # Profiler Nodes
+    "MeshlibProfilerReport": "Meshlib - Profiler Report",
+    
+    # Settings Nodes
+    "MeshlibThreadSettings": "Meshlib - Thread Settings",
+    "MeshlibMemorySettings": "Meshlib - Memory Settings",
 }
@@ -3,6 +3,9 @@ Alignment Nodes for ComfyUI-Meshlib
 Mesh alignment using ICP (Iterative Closest Point)
 """
 
+from ..thread_control import thread_limit
+from ..utils import NodeProgress
+
 
 class MeshlibICP:
     """Align two meshes using Iterative Closest Point algorithm"""
@@ -44,6 +47,14 @@ class MeshlibICP:
                     "max": 1000,
                     "tooltip": "Maximum number of ICP iterations"
                 }),
+            },
+            "optional": {
+                "max_threads": ("INT", {
+                    "default": 0,
+                    "min": 0,
+                    "max": 1024,
+                    "tooltip": "Maximum native threads for this node (0 = global setting); can only lower the global limit"
+                }),
             }
         }
     
@@ -55,7 +66,7 @@ class MeshlibICP:
 The floating mesh is transformed to best match the fixed mesh."""
 
     def process(self, mesh_floating, mesh_fixed, sampling_factor, 
-                distance_threshold_factor, exit_distance_factor, max_iterations):
+                distance_threshold_factor, exit_distance_factor, max_iterations, max_threads=0):
         import meshlib.mrmeshpy as mrmeshpy
         
         mesh_floating = mrmeshpy.copyMesh(mesh_floating)
@@ -74,7 +85,11 @@ The floating mesh is transformed to best match the fixed mesh."""
             icp_sampling_voxel_size
         )
         icp.setParams(icp_params)
-        xf = icp.calculateTransformation()
+        # MeshLib's ICP takes no progress callback: the interrupt is only checked around it
+        with thread_limit(max_threads), NodeProgress(1) as progress:
+            progress.check()
+            xf = icp.calculateTransformation()
+            progress.update()
         
         mesh_floating.transform(xf)
         
@@ -3,6 +3,8 @@ Analysis Nodes for ComfyUI-Meshlib
 Mesh analysis: signed distance, collision detection, mesh info
 """
 
+from ..utils import map_batch, topology_summary
+
 
 class MeshlibSignedDistance:
     """Calculate signed distance between two meshes"""
@@ -81,24 +83,38 @@ class MeshlibGetMeshInfo:
         return {
             "required": {
                 "mesh": ("MESHLIB_MESH",),
+            },
+            "optional": {
+                "max_workers": ("INT", {
+                    "default": 4,
+                    "min": 1,
+                    "max": 64,
+                    "tooltip": "Maximum number of list items processed concurrently"
+                }),
             }
         }
     
+    INPUT_IS_LIST = True
     RETURN_TYPES = ("INT", "INT", "INT", "FLOAT", "FLOAT", "FLOAT", "STRING")
     RETURN_NAMES = ("num_vertices", "num_faces", "num_holes", "surface_area", "volume", "bbox_diagonal", "info_string")
+    OUTPUT_IS_LIST = (True, True, True, True, True, True, True)
     FUNCTION = "process"
+    ITEM_FUNCTION = "process_item"
     CATEGORY = "Meshlib/Analysis"
     DESCRIPTION = "Get detailed information about a mesh including vertex/face counts, surface area, volume, and bounding box."
 
-    def process(self, mesh):
+    def process(self, mesh, max_workers=(4,)):
+        inputs = dict(mesh=mesh)
+        return map_batch(self.process_item, inputs, len(self.RETURN_TYPES), max_workers[0])
+    
+    def process_item(self, mesh):
         import meshlib.mrmeshpy as mrmeshpy
         
         num_verts = mesh.topology.numValidVerts()
         num_faces = mesh.topology.numValidFaces()
         
-        # Count holes
-        hole_edges = mesh.topology.findHoleRepresentiveEdges()
-        num_holes = len(hole_edges)
+        # Count holes (cached, shared with Fill Holes and Offset)
+        num_holes = topology_summary(mesh).holes
         
         # Compute bounding box
         bbox = mesh.computeBoundingBox()
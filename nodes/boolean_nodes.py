@@ -3,6 +3,223 @@ Boolean Nodes for ComfyUI-Meshlib
 Boolean operations on meshes
 """
 
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from ..memory_budget import (check_memory, estimate_boolean, estimate_voxel_boolean, fit_voxel_count, fits_memory,
+                             memory_policy, reserve_memory)
+from ..thread_control import thread_limit
+from ..utils import merge_meshes, throw_if_interrupted, NodeProgress
+
+
+def _mesh_box(mesh):
+    """Bounding box of a mesh as a [2, 3] array (min, max)."""
+    box = mesh.computeBoundingBox()
+    return np.array([[box.min.x, box.min.y, box.min.z],
+                     [box.max.x, box.max.y, box.max.z]], dtype=np.float64)
+
+
+def _group_disjoint(boxes):
+    """
+    Greedily group operands whose bounding boxes are pairwise disjoint.
+    
+    Args:
+        boxes: Array of bounding boxes [N, 2, 3]
+    
+    Returns:
+        List of index lists
+    """
+    groups = []
+    for i, box in enumerate(boxes):
+        for group in groups:
+            others = boxes[group]
+            overlap = np.all((others[:, 0] <= box[1]) & (box[0] <= others[:, 1]), axis=1)
+            if not overlap.any():
+                group.append(i)
+                break
+        else:
+            groups.append([i])
+    
+    return groups
+
+
+def _voxel_boolean(mesh_a, mesh_b, operation, voxel_count, callback=None):
+    """
+    Boolean of two meshes through their signed distance fields.
+    
+    Both meshes are rasterized (winding rule sign, so open and
+    self-intersecting inputs are fine) on one grid of about voxel_count voxels
+    covering the region the result can occupy. The fields are combined per
+    cell (min for union, max for intersection, max with the negated field for
+    differences) and the zero level is extracted with marching cubes. Cost is
+    bounded by the voxel count rather than by the topology of the inputs.
+    callback (a MeshLib ProgressCallback) receives the overall progress.
+    """
+    import meshlib.mrmeshpy as mrmeshpy
+    import meshlib.mrmeshnumpy as mrmeshnumpy
+    
+    box_a, box_b = _mesh_box(mesh_a), _mesh_box(mesh_b)
+    if operation == "Union":
+        box = np.stack([np.minimum(box_a[0], box_b[0]), np.maximum(box_a[1], box_b[1])])
+    elif operation == "Intersection":
+        box = np.stack([np.maximum(box_a[0], box_b[0]), np.minimum(box_a[1], box_b[1])])
+        if np.any(box[0] > box[1]):
+            return mrmeshpy.Mesh()
+    elif operation == "DifferenceAB":
+        box = box_a
+    else:
+        box = box_b
+    
+    voxel_size = float(np.cbrt(np.prod(np.maximum(box[1] - box[0], 1e-6)) / voxel_count))
+    origin = box[0] - 2 * voxel_size
+    dims = np.ceil((box[1] - origin) / voxel_size).astype(np.int64) + 3
+    
+    params = mrmeshpy.MeshToDistanceVolumeParams()
+    params.vol.origin = mrmeshpy.Vector3f(*origin.tolist())
+    params.vol.voxelSize = mrmeshpy.Vector3f(voxel_size, voxel_size, voxel_size)
+    params.vol.dimensions = mrmeshpy.Vector3i(*dims.tolist())
+    params.dist.signMode = mrmeshpy.SignDetectionMode.WindingRule
+    # Narrow band: farther cells are clamped to +-band and keep their sign
+    params.dist.maxDistSq = (3 * voxel_size) ** 2
+    params.dist.nullOutsideMinMax = False
+    
+    def stage(start, end):
+        return lambda fraction: callback(start + (end - start) * fraction)
+    
+    if callback is not None:
+        params.vol.cb = stage(0.0, 0.4)
+    dist_a = mrmeshnumpy.getNumpy3Darray(mrmeshpy.meshToDistanceVolume(mesh_a, params))
+    if callback is not None:
+        params.vol.cb = stage(0.4, 0.8)
+    dist_b = mrmeshnumpy.getNumpy3Darray(mrmeshpy.meshToDistanceVolume(mesh_b, params))
+    
+    if operation == "Union":
+        dist = np.minimum(dist_a, dist_b)
+    elif operation == "Intersection":
+        dist = np.maximum(dist_a, dist_b)
+    elif operation == "DifferenceAB":
+        dist = np.maximum(dist_a, -dist_b)
+    else:
+        dist = np.maximum(dist_b, -dist_a)
+    
+    volume = mrmeshnumpy.simpleVolumeFrom3Darray(dist)
+    volume.voxelSize = params.vol.voxelSize
+    
+    mc_params = mrmeshpy.MarchingCubesParams()
+    mc_params.origin = params.vol.origin
+    mc_params.iso = 0.0
+    mc_params.lessInside = True
+    if callback is not None:
+        mc_params.cb = stage(0.8, 1.0)
+    
+    return mrmeshpy.marchingCubes(volume, mc_params)
+
+
+def _run_boolean(mesh_a, mesh_b, operation, mode="exact", voxel_count=5000000, callback=None):
+    """
+    Boolean of two meshes with the selected method.
+    
+    Both methods are checked against the memory budget first. With the
+    "auto" memory policy, an exact boolean that does not fit runs as a voxel
+    boolean instead, and the voxel count is lowered until the voxel boolean
+    fits.
+    
+    Args:
+        mesh_a: First meshlib.mrmeshpy.Mesh
+        mesh_b: Second meshlib.mrmeshpy.Mesh
+        operation: "Union", "Intersection", "DifferenceAB" or "DifferenceBA"
+        mode: "exact" (mrmeshpy.boolean), "voxel" or "auto" (exact, voxel if it fails)
+        voxel_count: Voxel budget of the voxel method
+        callback: Optional MeshLib ProgressCallback (fraction -> keep going)
+    
+    Returns:
+        Tuple of (mesh, note) where note describes a fallback, or is None
+    
+    Raises:
+        ValueError: If the exact boolean fails in "exact" mode
+        MemoryBudgetError: If the boolean does not fit the memory budget
+    """
+    import meshlib.mrmeshpy as mrmeshpy
+    
+    note = None
+    if mode != "voxel":
+        estimate = estimate_boolean(mesh_a, mesh_b)
+        if mode == "auto" and memory_policy() == "auto" and not fits_memory(estimate):
+            note = "Exact boolean exceeds the memory budget, used voxel boolean"
+        else:
+            check_memory("Exact boolean", estimate)
+            
+            params = mrmeshpy.BooleanParameters()
+            if callback is not None:
+                params.cb = callback
+            with reserve_memory(estimate):
+                result = mrmeshpy.boolean(mesh_a, mesh_b, getattr(mrmeshpy.BooleanOperation, operation), params)
+            if result.valid():
+                return result.mesh, None
+            
+            # An interrupted boolean fails too; don't fall back to the voxel method then
+            throw_if_interrupted()
+            
+            if mode == "exact":
+                raise ValueError(f"Boolean operation failed: {result.errorString}")
+            note = f"Exact boolean failed ({result.errorString}), used voxel boolean"
+    
+    fitted = fit_voxel_count("Voxel boolean", lambda count: estimate_voxel_boolean(mesh_a, mesh_b, count),
+                             voxel_count)
+    if fitted < voxel_count:
+        lowered = f"{fitted:,} voxels to fit the memory budget"
+        note = f"{note} at {lowered}" if note else f"Voxel boolean at {lowered}"
+    
+    with reserve_memory(estimate_voxel_boolean(mesh_a, mesh_b, fitted)):
+        return _voxel_boolean(mesh_a, mesh_b, operation, fitted, callback), note
+
+
+def _reduce_balanced(meshes, operation, mode, voxel_count, max_workers, log, progress):
+    """
+    Reduce meshes with a boolean operation as a balanced binary tree.
+    
+    The booleans of one tree level are independent and run concurrently.
+    A union pair whose exact boolean fails is retried as a voxel boolean;
+    any other failure raises. Per-level timings and failures go to log.
+    progress (a NodeProgress) advances by one per boolean.
+    """
+    def run_pair(pair):
+        try:
+            try:
+                return _run_boolean(pair[0], pair[1], operation, mode, voxel_count, progress.keep_going), False
+            except ValueError as e:
+                if operation != "Union" or mode != "exact":
+                    raise
+                mesh, note = _run_boolean(pair[0], pair[1], operation, "voxel", voxel_count, progress.keep_going)
+                return (mesh, f"Exact union failed ({e}), used voxel boolean" + (f"; {note}" if note else "")), True
+        finally:
+            progress.update()
+    
+    level = 0
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        while len(meshes) > 1:
+            start = time.perf_counter()
+            pairs = [(meshes[i], meshes[i + 1]) for i in range(0, len(meshes) - 1, 2)]
+            results = list(pool.map(run_pair, pairs))
+            
+            reduced = []
+            failures = 0
+            for (mesh, note), failed in results:
+                if note:
+                    log.append(f"  level {level}: {note}")
+                failures += failed
+                reduced.append(mesh)
+            if len(meshes) % 2:
+                reduced.append(meshes[-1])
+            
+            log.append(f"Level {level}: {len(pairs)} booleans, {failures} failed, {time.perf_counter() - start:.3f}s")
+            meshes = reduced
+            level += 1
+    
+    return meshes[0]
+
 
 class MeshlibBoolean:
     """Perform boolean operations on two meshes"""
@@ -22,33 +239,171 @@ class MeshlibBoolean:
                     "default": "Union",
                     "tooltip": "Boolean operation to perform"
                 }),
+            },
+            "optional": {
+                "mode": (["auto", "exact", "voxel"], {
+                    "default": "auto",
+                    "tooltip": "exact: mesh boolean; voxel: distance field boolean (robust, resolution limited); auto: exact, voxel if exact fails"
+                }),
+                "voxel_count": ("INT", {
+                    "default": 5000000,
+                    "min": 100000,
+                    "max": 50000000,
+                    "tooltip": "Approximate number of voxels for the voxel boolean (higher = more detail)"
+                }),
+                "max_threads": ("INT", {
+                    "default": 0,
+                    "min": 0,
+                    "max": 1024,
+                    "tooltip": "Maximum native threads for this node (0 = global setting); can only lower the global limit"
+                }),
             }
         }
     
-    RETURN_TYPES = ("MESHLIB_MESH",)
-    RETURN_NAMES = ("mesh",)
+    RETURN_TYPES = ("MESHLIB_MESH", "STRING")
+    RETURN_NAMES = ("mesh", "info")
     FUNCTION = "process"
     CATEGORY = "Meshlib/Boolean"
     DESCRIPTION = """Perform boolean operations on two meshes.
-    
+
 - Union: Combine both meshes
 - Intersection: Keep only overlapping parts
 - DifferenceAB: Subtract B from A
-- DifferenceBA: Subtract A from B"""
+- DifferenceBA: Subtract A from B
 
-    def process(self, mesh_a, mesh_b, operation):
-        import meshlib.mrmeshpy as mrmeshpy
+The voxel mode combines signed distance fields; it handles open and self-intersecting meshes
+with runtime and memory bounded by the voxel count. Auto mode falls back to it when the exact boolean fails."""
+
+    def process(self, mesh_a, mesh_b, operation, mode="auto", voxel_count=5000000, max_threads=0):
+        with thread_limit(max_threads), NodeProgress() as progress:
+            mesh, note = _run_boolean(mesh_a, mesh_b, operation, mode, voxel_count, progress)
+        
+        info = note or f"{operation} ({'voxel' if mode == 'voxel' else 'exact'})"
         
-        op_map = {
-            "Union": mrmeshpy.BooleanOperation.Union,
-            "Intersection": mrmeshpy.BooleanOperation.Intersection,
-            "DifferenceAB": mrmeshpy.BooleanOperation.DifferenceAMinusB,
-            "DifferenceBA": mrmeshpy.BooleanOperation.DifferenceBMinusA,
+        return (mesh, info)
+
+
+class MeshlibBooleanMany:
+    """Perform a boolean operation on a list of meshes"""
+    
+    @classmethod
+    def INPUT_TYPES(s):
+        return {
+            "required": {
+                "meshes": ("MESHLIB_MESH", {"tooltip": "Meshes to combine (a list, e.g. from a batch or split node)"}),
+                "operation": ([
+                    "Union",
+                    "Intersection",
+                    "Difference",  # first - all others
+                ], {
+                    "default": "Union",
+                    "tooltip": "Boolean operation to perform"
+                }),
+                "group_disjoint": ("BOOLEAN", {
+                    "default": True,
+                    "tooltip": "Concatenate operands with non-overlapping bounding boxes instead of running booleans on them"
+                }),
+                "max_workers": ("INT", {
+                    "default": 4,
+                    "min": 1,
+                    "max": 64,
+                    "tooltip": "Maximum number of booleans running concurrently"
+                }),
+            },
+            "optional": {
+                "mode": (["auto", "exact", "voxel"], {
+                    "default": "auto",
+                    "tooltip": "exact: mesh boolean; voxel: distance field boolean (robust, resolution limited); auto: exact, voxel if exact fails"
+                }),
+                "voxel_count": ("INT", {
+                    "default": 5000000,
+                    "min": 100000,
+                    "max": 50000000,
+                    "tooltip": "Approximate number of voxels per voxel boolean"
+                }),
+                "max_threads": ("INT", {
+                    "default": 0,
+                    "min": 0,
+                    "max": 1024,
+                    "tooltip": "Maximum native threads for this node (0 = global setting); can only lower the global limit"
+                }),
+            }
         }
+    
+    INPUT_IS_LIST = True
+    RETURN_TYPES = ("MESHLIB_MESH", "STRING")
+    RETURN_NAMES = ("mesh", "info")
+    FUNCTION = "process"
+    CATEGORY = "Meshlib/Boolean"
+    DESCRIPTION = """Perform a boolean operation on any number of meshes.
+
+- Union: Combine all meshes
+- Intersection: Keep only the part common to all meshes
+- Difference: Subtract all other meshes from the first one
+
+Operands are reduced in a balanced tree (independent booleans run in parallel) instead of a linear chain.
+For unions, spatially disjoint operands are first merged by concatenation."""
+
+    def process(self, meshes, operation, group_disjoint, max_workers, mode=("auto",), voxel_count=(5000000,),
+                max_threads=(0,)):
+        import meshlib.mrmeshpy as mrmeshpy
+        
+        operation = operation[0]
+        group_disjoint = group_disjoint[0]
+        max_workers = max_workers[0]
+        mode = mode[0]
+        voxel_count = voxel_count[0]
+        max_threads = max_threads[0]
+        
+        if not meshes:
+            raise ValueError("No meshes to combine.")
+        
+        start = time.perf_counter()
+        inputs = meshes
+        boxes = np.stack([_mesh_box(mesh) for mesh in meshes])
+        log = [f"{operation} of {len(meshes)} meshes"]
+        
+        if operation == "Intersection":
+            common_min = boxes[:, 0].max(axis=0)
+            common_max = boxes[:, 1].min(axis=0)
+            if np.any(common_min > common_max):
+                log.append("Bounding boxes have no common region: result is empty")
+                return (mrmeshpy.Mesh(), "\n".join(log))
+            operands = list(meshes)
+        else:
+            base = None
+            if operation == "Difference":
+                base, base_box = meshes[0], boxes[0]
+                overlap = np.all((boxes[1:, 0] <= base_box[1]) & (base_box[0] <= boxes[1:, 1]), axis=1)
+                log.append(f"{int((~overlap).sum())} subtrahends do not touch the first mesh and are skipped")
+                meshes = [mesh for mesh, keep in zip(meshes[1:], overlap) if keep]
+                boxes = boxes[1:][overlap]
+                if not meshes:
+                    return (mrmeshpy.copyMesh(base), "\n".join(log))
+            
+            if group_disjoint:
+                groups = _group_disjoint(boxes)
+                operands = [merge_meshes([meshes[i] for i in group]) if len(group) > 1 else meshes[group[0]]
+                            for group in groups]
+                log.append(f"Grouped into {len(groups)} operands with disjoint bounding boxes")
+            else:
+                operands = list(meshes)
+        
+        reduce_operation = "Intersection" if operation == "Intersection" else "Union"
+        booleans = len(operands) - 1 + (operation == "Difference")
+        with thread_limit(max_threads), NodeProgress(max(booleans, 1)) as progress:
+            result = _reduce_balanced(operands, reduce_operation, mode, voxel_count, max_workers, log, progress)
+            
+            if operation == "Difference":
+                result, note = _run_boolean(base, result, "DifferenceAB", mode, voxel_count, progress.keep_going)
+                progress.update()
+                if note:
+                    log.append(note)
         
-        result = mrmeshpy.boolean(mesh_a, mesh_b, op_map[operation])
+        # A single operand comes back unchanged; never hand out an input
+        if any(result is mesh for mesh in inputs):
+            result = mrmeshpy.copyMesh(result)
         
-        if not result.valid():
-            raise ValueError(f"Boolean operation failed: {result.errorString}")
+        log.append(f"Total: {time.perf_counter() - start:.3f}s, {result.topology.numValidFaces()} faces")
         
-        return (result.mesh,)
+        return (result, "\n".join(log))
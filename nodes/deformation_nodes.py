@@ -3,6 +3,203 @@ Deformation Nodes for ComfyUI-Meshlib
 Free-form and Laplacian mesh deformation
 """
 
+import re
+import threading
+from collections import OrderedDict
+from math import comb
+
+import numpy as np
+
+from ..utils import mesh_to_numpy, set_mesh_points, get_object_cache, to_numpy_array, mesh_fingerprint, get_output_path
+
+
+# Largest dense (vertices x control points) weight matrix kept in the cache
+FFD_DENSE_WEIGHTS_LIMIT = 64 * 1024 * 1024
+
+# Number of initialized (factorized) Laplacian solvers kept alive
+LAPLACIAN_CACHE_SIZE = 4
+
+_laplacian_cache = OrderedDict()
+_laplacian_cache_lock = threading.Lock()
+
+
+def _bernstein_basis(t, degree):
+    """Bernstein polynomials of the given degree evaluated at t, shape [len(t), degree + 1]."""
+    i = np.arange(degree + 1)
+    coeffs = np.array([comb(degree, k) for k in i], dtype=np.float64)
+    t = np.clip(t.astype(np.float64), 0.0, 1.0)[:, None]
+    return (coeffs * t ** i * (1.0 - t) ** (degree - i)).astype(np.float32)
+
+
+def _ffd_weights(mesh, resolution):
+    """
+    Per-vertex free-form deformation weights of a mesh for a control grid.
+    
+    The grid spans the mesh bounding box, like mrmeshpy.FreeFormDeformer. The
+    weights only depend on the rest shape, so they are cached on the mesh:
+    deforming the same mesh again (e.g. once per animation frame) is a single
+    product with the control point displacements.
+    
+    Args:
+        mesh: meshlib.mrmeshpy.Mesh object
+        resolution: Control points per axis (nx, ny, nz)
+        
+    Returns:
+        Tuple of (rest vertices [V, 3], weights) where weights is either a dense
+        [V, nx * ny * nz] matrix or the per-axis bases (bx, by, bz) when the
+        dense matrix would be too large
+    """
+    resolution = tuple(int(n) for n in resolution)
+    cache = get_object_cache(mesh)
+    key = ("ffd_weights", resolution)
+    if key in cache:
+        return cache[key]
+    
+    vertices, _ = mesh_to_numpy(mesh)
+    box = mesh.computeBoundingBox()
+    box_min = np.array([box.min.x, box.min.y, box.min.z], dtype=np.float32)
+    box_size = np.maximum(np.array([box.max.x, box.max.y, box.max.z], dtype=np.float32) - box_min, 1e-12)
+    t = (vertices - box_min) / box_size
+    
+    bases = tuple(_bernstein_basis(t[:, axis], resolution[axis] - 1) for axis in range(3))
+    
+    if len(vertices) * np.prod(resolution) <= FFD_DENSE_WEIGHTS_LIMIT:
+        weights = np.einsum("vi,vj,vk->vijk", *bases).reshape(len(vertices), -1)
+    else:
+        weights = bases
+    
+    cache[key] = (vertices, weights)
+    return cache[key]
+
+
+def _ffd_deform(mesh, displacements):
+    """
+    Deformed vertex positions for control point displacements of shape [nx, ny, nz, 3].
+    
+    Bernstein weights sum to one and reproduce the undeformed grid, so the
+    result is the rest shape plus the weighted displacements.
+    """
+    vertices, weights = _ffd_weights(mesh, displacements.shape[:3])
+    
+    if isinstance(weights, np.ndarray):
+        return vertices + weights @ displacements.reshape(-1, 3)
+    
+    # Contract one axis at a time in chunks to bound the temporaries
+    bx, by, bz = weights
+    result = np.empty_like(vertices)
+    for start in range(0, len(vertices), 65536):
+        stop = start + 65536
+        partial = np.einsum("vi,ijkc->vjkc", bx[start:stop], displacements)
+        partial = np.einsum("vj,vjkc->vkc", by[start:stop], partial)
+        result[start:stop] = vertices[start:stop] + np.einsum("vk,vkc->vc", bz[start:stop], partial)
+    
+    return result
+
+
+def _parse_vertex_indices(text):
+    """Parse vertex indices like "1, 2 5-9" into a sorted unique int array."""
+    indices = []
+    for token in re.split(r"[\s,;]+", text.strip()):
+        if not token:
+            continue
+        if "-" in token:
+            first, last = token.split("-", 1)
+            indices.extend(range(int(first), int(last) + 1))
+        else:
+            indices.append(int(token))
+    
+    return np.unique(np.array(indices, dtype=np.int64))
+
+
+def _get_laplacian(mesh, anchors, influence_radius, edge_weights):
+    """
+    Initialized Laplacian deformer for a mesh and a set of anchor vertices.
+    
+    Initializing a Laplacian (cotan weights and matrix factorization) is the
+    expensive part and only depends on the mesh, the free region and the
+    weights. Initialized solvers are kept in a small LRU cache keyed by mesh
+    fingerprint, anchors, region size and weights, so changing only the
+    targets costs a back-substitution.
+    
+    Args:
+        mesh: meshlib.mrmeshpy.Mesh object (not modified)
+        anchors: Vertex indices [K]
+        influence_radius: Expansion iterations of the free region around the anchors
+        edge_weights: Name of a mrmeshpy.EdgeWeights member
+        
+    Returns:
+        Tuple of (working mesh, mrmeshpy.Laplacian, lock). The working mesh is
+        private to the solver; hold the lock while solving and copying it.
+    """
+    import meshlib.mrmeshpy as mrmeshpy
+    
+    key = (mesh_fingerprint(mesh), anchors.tobytes(), influence_radius, edge_weights)
+    
+    with _laplacian_cache_lock:
+        entry = _laplacian_cache.pop(key, None)
+        if entry is None:
+            work_mesh = mrmeshpy.copyMesh(mesh)
+            laplacian = mrmeshpy.Laplacian(work_mesh)
+            
+            # Mark anchor points in free area and expand it
+            free_verts = mrmeshpy.VertBitSet()
+            free_verts.resize(work_mesh.topology.getValidVerts().size())
+            for v in anchors:
+                free_verts.set(mrmeshpy.VertId(int(v)), True)
+            mrmeshpy.expand(work_mesh.topology, free_verts, influence_radius)
+            
+            laplacian.init(free_verts, getattr(mrmeshpy.EdgeWeights, edge_weights), mrmeshpy.VertexMass.NeiArea)
+            entry = (work_mesh, laplacian, threading.Lock())
+        
+        _laplacian_cache[key] = entry
+        while len(_laplacian_cache) > LAPLACIAN_CACHE_SIZE:
+            _laplacian_cache.popitem(last=False)
+    
+    return entry
+
+
+def _resolve_anchors(mesh, anchor_indices, anchor_vertex_index=0):
+    """Anchor vertex indices from an index string, falling back to a single vertex."""
+    import meshlib.mrmeshpy as mrmeshpy
+    
+    if anchor_indices.strip():
+        anchors = _parse_vertex_indices(anchor_indices)
+    else:
+        anchors = np.array([anchor_vertex_index], dtype=np.int64)
+    
+    valid_verts = mesh.topology.getValidVerts()
+    if len(anchors) == 0 or anchors.min() < 0 or not all(valid_verts.test(mrmeshpy.VertId(int(v))) for v in anchors):
+        raise ValueError(f"Anchor vertex index out of range or deleted. "
+                         f"Mesh has {mesh.topology.numValidVerts()} vertices.")
+    
+    return anchors
+
+
+def _laplacian_apply(work_mesh, laplacian, anchors, targets):
+    """Move the anchors to the target positions [K, 3] and solve for the free region."""
+    import meshlib.mrmeshpy as mrmeshpy
+    
+    for v, pos in zip(anchors, targets):
+        laplacian.fixVertex(mrmeshpy.VertId(int(v)), mrmeshpy.Vector3f(*(float(x) for x in pos)))
+    laplacian.apply()
+    work_mesh.invalidateCaches()
+
+
+def _ffd_displacement_grid(value):
+    """Normalize a MESHLIB_ARRAY of control point displacements to shape [nx, ny, nz, 3]."""
+    displacements = to_numpy_array(value)
+    
+    if displacements.ndim == 2 and displacements.shape[1] == 3:
+        n = int(round(len(displacements) ** (1.0 / 3.0)))
+        if n ** 3 != len(displacements):
+            raise ValueError(f"Cannot infer a cubic grid from {len(displacements)} control point displacements.")
+        displacements = displacements.reshape(n, n, n, 3)
+    
+    if displacements.ndim != 4 or displacements.shape[3] != 3 or min(displacements.shape[:3]) < 2:
+        raise ValueError(f"Displacements must have shape (Nx, Ny, Nz, 3) with N >= 2, got {displacements.shape}.")
+    
+    return displacements
+
 
 class MeshlibFreeFormDeform:
     """Apply free-form deformation to a mesh using a control grid"""
@@ -40,6 +237,11 @@ class MeshlibFreeFormDeform:
                     "step": 0.1,
                     "tooltip": "Strength of the deformation"
                 }),
+            },
+            "optional": {
+                "displacements": ("MESHLIB_ARRAY", {
+                    "tooltip": "Control point displacements, shape (Nx, Ny, Nz, 3) or (N^3, 3). Overrides grid_resolution and the center offsets"
+                }),
             }
         }
     
@@ -48,69 +250,31 @@ class MeshlibFreeFormDeform:
     FUNCTION = "process"
     CATEGORY = "Meshlib/Deformation"
     DESCRIPTION = """Apply free-form deformation using a control grid. 
-The center control points are moved according to the deform offsets."""
+The center control points are moved according to the deform offsets,
+or every control point is moved by the optional displacements array (scaled by deform_strength).
+Deformation weights are cached per mesh and grid, so re-deforming the same mesh is a single matrix product."""
 
     def process(self, mesh, grid_resolution, deform_center_x, deform_center_y, 
-                deform_center_z, deform_strength):
+                deform_center_z, deform_strength, displacements=None):
         import meshlib.mrmeshpy as mrmeshpy
         
-        mesh = mrmeshpy.copyMesh(mesh)
-        
-        # Construct deformer on mesh vertices
-        ffDeformer = mrmeshpy.FreeFormDeformer(mesh.points, mesh.topology.getValidVerts())
-        
-        # Compute mesh bounding box
-        box = mesh.computeBoundingBox()
-        
-        # Init deformer with NxNxN grid on mesh box
-        ffDeformer.init(mrmeshpy.Vector3i.diagonal(grid_resolution), box)
-        
-        # Calculate center index
-        center = grid_resolution // 2
-        
-        # Calculate target position (center of box + offset)
-        box_center = box.center()
-        offset = mrmeshpy.Vector3f(
-            deform_center_x * deform_strength,
-            deform_center_y * deform_strength,
-            deform_center_z * deform_strength
-        )
-        target = mrmeshpy.Vector3f(
-            box_center.x + offset.x,
-            box_center.y + offset.y,
-            box_center.z + offset.z
-        )
-        
-        # Move center control points toward the target
-        # This creates a "pinch" or "bulge" effect
-        for i in range(grid_resolution):
-            for j in range(grid_resolution):
-                for k in range(grid_resolution):
-                    # Calculate distance from center
-                    di = abs(i - center)
-                    dj = abs(j - center)
-                    dk = abs(k - center)
-                    
-                    # Only move points near the center
-                    if di <= 1 and dj <= 1 and dk <= 1:
-                        weight = 1.0 - (di + dj + dk) / 3.0
-                        if weight > 0:
-                            grid_pos = mrmeshpy.Vector3i(i, j, k)
-                            current_pos = ffDeformer.getRefGridPointPosition(grid_pos)
-                            new_pos = mrmeshpy.Vector3f(
-                                current_pos.x + offset.x * weight,
-                                current_pos.y + offset.y * weight,
-                                current_pos.z + offset.z * weight
-                            )
-                            ffDeformer.setRefGridPointPosition(grid_pos, new_pos)
-        
-        # Apply deformation to mesh vertices
-        ffDeformer.apply()
+        if displacements is not None:
+            grid = _ffd_displacement_grid(displacements) * deform_strength
+        else:
+            # Move the control points around the center toward the offset,
+            # creating a "pinch" or "bulge" effect
+            center = grid_resolution // 2
+            offset = np.array([deform_center_x, deform_center_y, deform_center_z], dtype=np.float32) * deform_strength
+            
+            dist = np.abs(np.indices((grid_resolution,) * 3) - center)
+            weight = 1.0 - dist.sum(axis=0) / 3.0
+            weight[np.any(dist > 1, axis=0) | (weight < 0)] = 0.0
+            grid = weight[..., None].astype(np.float32) * offset
         
-        # Invalidate mesh caches
-        mesh.invalidateCaches()
+        mesh_out = mrmeshpy.copyMesh(mesh)
+        set_mesh_points(mesh_out, _ffd_deform(mesh, grid))
         
-        return (mesh,)
+        return (mesh_out,)
 
 
 class MeshlibLaplacianDeform:
@@ -147,6 +311,19 @@ class MeshlibLaplacianDeform:
                     "max": 50,
                     "tooltip": "Number of expansion iterations for the deformation region"
                 }),
+            },
+            "optional": {
+                "anchor_indices": ("STRING", {
+                    "default": "",
+                    "tooltip": "Several anchor vertices, e.g. '10, 12, 40-55'. Overrides anchor_vertex_index when not empty"
+                }),
+                "anchor_targets": ("MESHLIB_ARRAY", {
+                    "tooltip": "Target positions (K, 3) for the anchors, in anchor order. When omitted, every anchor is moved by (move_x, move_y, move_z)"
+                }),
+                "edge_weights": (["Cotan", "Unit"], {
+                    "default": "Cotan",
+                    "tooltip": "Laplacian edge weights"
+                }),
             }
         }
     
@@ -155,52 +332,133 @@ class MeshlibLaplacianDeform:
     FUNCTION = "process"
     CATEGORY = "Meshlib/Deformation"
     DESCRIPTION = """Apply Laplacian deformation which smoothly deforms a region 
-of the mesh while preserving local shape details."""
+of the mesh while preserving local shape details.
+Initialized solvers are cached: changing only the movement or targets is much faster than the first run."""
 
-    def process(self, mesh, anchor_vertex_index, move_x, move_y, move_z, influence_radius):
+    def process(self, mesh, anchor_vertex_index, move_x, move_y, move_z, influence_radius,
+                anchor_indices="", anchor_targets=None, edge_weights="Cotan"):
         import meshlib.mrmeshpy as mrmeshpy
         
-        mesh = mrmeshpy.copyMesh(mesh)
-        
-        # Construct Laplacian deformer
-        lDeformer = mrmeshpy.Laplacian(mesh)
-        
-        # Get valid vertices
-        valid_verts = mesh.topology.getValidVerts()
-        num_verts = valid_verts.count()
-        
-        if anchor_vertex_index >= num_verts:
-            raise ValueError(f"Anchor vertex index {anchor_vertex_index} out of range. Mesh has {num_verts} vertices.")
+        anchors = _resolve_anchors(mesh, anchor_indices, anchor_vertex_index)
         
-        # Find the actual vertex ID at the given index
-        anchor_v = mrmeshpy.VertId(anchor_vertex_index)
+        if anchor_targets is not None:
+            targets = to_numpy_array(anchor_targets).reshape(-1, 3)
+            if len(targets) != len(anchors):
+                raise ValueError(f"Got {len(targets)} anchor targets for {len(anchors)} anchors.")
+        else:
+            vertices, _ = mesh_to_numpy(mesh)
+            targets = vertices[anchors] + np.array([move_x, move_y, move_z], dtype=np.float32)
         
-        # Mark anchor point in free area
-        freeVerts = mrmeshpy.VertBitSet()
-        freeVerts.resize(valid_verts.size())
-        freeVerts.set(anchor_v, True)
+        work_mesh, laplacian, lock = _get_laplacian(mesh, anchors, influence_radius, edge_weights)
+        with lock:
+            _laplacian_apply(work_mesh, laplacian, anchors, targets)
+            mesh_out = mrmeshpy.copyMesh(work_mesh)
         
-        # Expand free area
-        mrmeshpy.expand(mesh.topology, freeVerts, influence_radius)
-        
-        # Initialize Laplacian
-        lDeformer.init(freeVerts, mrmeshpy.EdgeWeights.Cotan, mrmeshpy.VertexMass.NeiArea)
+        return (mesh_out,)
+
+
+class MeshlibDeformSequence:
+    """Deform a mesh once per animation frame"""
+    
+    @classmethod
+    def INPUT_TYPES(s):
+        return {
+            "required": {
+                "mesh": ("MESHLIB_MESH",),
+                "frames": ("MESHLIB_ARRAY", {
+                    "tooltip": "Per-frame controls. laplacian: anchor targets (F, K, 3) or per-frame anchor offsets (F, 3); "
+                               "free_form: control point displacements (F, Nx, Ny, Nz, 3) or (F, N^3, 3)"
+                }),
+                "method": (["laplacian", "free_form"], {
+                    "default": "laplacian",
+                    "tooltip": "Deformer used for every frame"
+                }),
+                "output_mode": (["vertex_array", "mesh_list"], {
+                    "default": "vertex_array",
+                    "tooltip": "vertex_array: one (F, V, 3) array sharing the topology of the input mesh; mesh_list: one mesh per frame"
+                }),
+            },
+            "optional": {
+                "anchor_indices": ("STRING", {
+                    "default": "0",
+                    "tooltip": "Anchor vertices for the laplacian method, e.g. '10, 12, 40-55'"
+                }),
+                "influence_radius": ("INT", {
+                    "default": 5,
+                    "min": 1,
+                    "max": 50,
+                    "tooltip": "Number of expansion iterations for the laplacian deformation region"
+                }),
+                "edge_weights": (["Cotan", "Unit"], {
+                    "default": "Cotan",
+                    "tooltip": "Laplacian edge weights"
+                }),
+                "stream_prefix": ("STRING", {
+                    "default": "",
+                    "tooltip": "When set, vertex_array frames are written to an .npy file in the output directory as they are computed and the array is memory-mapped from it"
+                }),
+            }
+        }
+    
+    RETURN_TYPES = ("MESHLIB_MESH", "MESHLIB_ARRAY", "MESHLIB_MESH", "STRING")
+    RETURN_NAMES = ("meshes", "vertices", "topology", "file_path")
+    OUTPUT_IS_LIST = (True, False, False, False)
+    FUNCTION = "process"
+    CATEGORY = "Meshlib/Deformation"
+    DESCRIPTION = """Deform a mesh for a whole animation sequence in one node.
+The deformer is set up once (Laplacian factorization or free-form weights) and only re-solved per frame.
+vertex_array mode returns a (frames x vertices x 3) array plus the shared topology mesh instead of a copy per frame,
+optionally streamed to disk."""
+
+    def process(self, mesh, frames, method, output_mode, anchor_indices="0", influence_radius=5,
+                edge_weights="Cotan", stream_prefix=""):
+        import meshlib.mrmeshpy as mrmeshpy
+        import meshlib.mrmeshnumpy as mrmeshnumpy
         
-        # Get current position and compute new position
-        current_pos = mesh.points.vec[anchor_vertex_index]
-        new_pos = mrmeshpy.Vector3f(
-            current_pos.x + move_x,
-            current_pos.y + move_y,
-            current_pos.z + move_z
-        )
+        frames = to_numpy_array(frames)
+        num_frames = len(frames)
+        num_points = mesh.points.vec.size()
         
-        # Fix anchor vertex at new position
-        lDeformer.fixVertex(anchor_v, new_pos)
+        vertices = None
+        file_path = ""
+        meshes = []
+        if output_mode == "vertex_array":
+            if stream_prefix:
+                file_path = get_output_path(stream_prefix, "npy")
+                vertices = np.lib.format.open_memmap(file_path, mode="w+", dtype=np.float32, shape=(num_frames, num_points, 3))
+            else:
+                vertices = np.empty((num_frames, num_points, 3), dtype=np.float32)
         
-        # Apply deformation
-        lDeformer.apply()
+        if method == "laplacian":
+            anchors = _resolve_anchors(mesh, anchor_indices)
+            if frames.ndim == 2 and frames.shape[1] == 3:
+                rest, _ = mesh_to_numpy(mesh)
+                frames = rest[anchors][None, :, :] + frames[:, None, :]
+            frames = frames.reshape(num_frames, -1, 3)
+            if frames.shape[1] != len(anchors):
+                raise ValueError(f"Got {frames.shape[1]} targets per frame for {len(anchors)} anchors.")
+            
+            work_mesh, laplacian, lock = _get_laplacian(mesh, anchors, influence_radius, edge_weights)
+            with lock:
+                for i, targets in enumerate(frames):
+                    _laplacian_apply(work_mesh, laplacian, anchors, targets)
+                    if vertices is not None:
+                        vertices[i] = mrmeshnumpy.getNumpyVerts(work_mesh)
+                    else:
+                        meshes.append(mrmeshpy.copyMesh(work_mesh))
+        else:
+            for i, frame in enumerate(frames):
+                deformed = _ffd_deform(mesh, _ffd_displacement_grid(frame))
+                if vertices is not None:
+                    vertices[i] = deformed
+                else:
+                    mesh_out = mrmeshpy.copyMesh(mesh)
+                    set_mesh_points(mesh_out, deformed)
+                    meshes.append(mesh_out)
         
-        # Invalidate mesh caches
-        mesh.invalidateCaches()
+        if file_path:
+            vertices.flush()
+            del vertices
+            vertices = np.load(file_path, mmap_mode="r")
         
-        return (mesh,)
+        return (meshes, vertices, mesh, file_path)
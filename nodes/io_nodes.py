@@ -3,12 +3,36 @@ I/O Nodes for ComfyUI-Meshlib
 Handles loading and saving meshes and point clouds
 """
 
+import json
+import math
 import os
+import struct
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import numpy as np
 import folder_paths
 
-from ..utils import trimesh_to_meshlib, meshlib_to_trimesh, get_output_path, resolve_input_path
+from ..utils import (
+    trimesh_to_meshlib,
+    meshlib_to_trimesh,
+    get_output_path,
+    get_output_paths,
+    resolve_input_path,
+    reorder_mesh,
+    reorder_on_load,
+    batch_items,
+    map_batch,
+    get_object_cache,
+    coordinate_view,
+    to_numpy_array,
+    to_output_array,
+    set_mesh_points,
+    pointcloud_to_numpy,
+    numpy_to_pointcloud,
+)
 
 
 class MeshlibLoadMesh:
@@ -79,9 +103,257 @@ class MeshlibLoadMesh:
             # Standard mesh loading for non-scene formats
             mesh = mrmeshpy.loadMesh(resolved_path)
         
+        curve = reorder_on_load()
+        if curve is not None:
+            mesh = reorder_mesh(mesh, curve)
+        
         return (mesh,)
 
 
+# Source faces mapped to grid cells per pass when building preview proxies (bounds temporary memory)
+PREVIEW_CHUNK_FACES = 1 << 21
+# Bytes per proxy vertex (uint16 x, y, z padded to 4-byte alignment)
+PREVIEW_VERTEX_BYTES = 8
+# Meshes with more faces get a proxy from a face sample, so its latency doesn't grow with the mesh
+PREVIEW_SOURCE_FACES = 1 << 22
+# Sampled source faces per proxy triangle
+PREVIEW_SAMPLES_PER_TRIANGLE = 4
+
+
+def _cluster(vertices, faces, cell_size):
+    """
+    Vertex clustering of a triangle soup on a grid of cell_size.
+    
+    Vertices in one cell merge into one at the mean of the merged vertices
+    that are still used; faces collapsing to an edge or a point are dropped.
+    Only faces spanning three cells are kept, so after the (linear) cell
+    lookup everything else works on the small output.
+    
+    Returns:
+        Tuple of (vertices float32 [V, 3], faces int64 [F, 3])
+    """
+    origin = vertices.min(axis=0)
+    cells = np.floor((vertices - origin) / cell_size).astype(np.int64)
+    dims = cells.max(axis=0) + 1
+    keys = (cells[:, 0] * dims[1] + cells[:, 1]) * dims[2] + cells[:, 2]
+    
+    kept = []
+    for start in range(0, len(faces), PREVIEW_CHUNK_FACES):
+        chunk = faces[start:start + PREVIEW_CHUNK_FACES]
+        face_keys = keys[chunk]
+        spanning = ((face_keys[:, 0] != face_keys[:, 1]) & (face_keys[:, 1] != face_keys[:, 2])
+                    & (face_keys[:, 0] != face_keys[:, 2]))
+        kept.append(chunk[spanning])
+    kept = np.concatenate(kept) if kept else np.zeros((0, 3), dtype=np.int64)
+    
+    used, vertex_ids = np.unique(kept, return_inverse=True)
+    cell_keys, cluster = np.unique(keys[used], return_inverse=True)
+    counts = np.bincount(cluster, minlength=len(cell_keys))
+    merged = vertices[used]
+    positions = np.stack([np.bincount(cluster, merged[:, axis], len(cell_keys)) / counts for axis in range(3)], axis=1)
+    positions = positions.astype(np.float32)
+    
+    clustered = cluster[vertex_ids.reshape(-1)].reshape(-1, 3)
+    # Same triangle from several source faces: rotate the smallest index first, keep one
+    shift = clustered.argmin(axis=1)
+    rows = np.arange(len(clustered))[:, None]
+    clustered = clustered[rows, (shift[:, None] + np.arange(3)) % 3]
+    clustered = np.unique(clustered, axis=0)
+    
+    return positions, clustered
+
+
+def _sampled_proxy(vertices, faces, target, cell_factor=3.0):
+    """
+    Proxy of a large mesh built from a random sample of its faces.
+    
+    The centroids of about PREVIEW_SAMPLES_PER_TRIANGLE sampled faces per
+    target triangle are averaged per grid cell (with their area weighted
+    normals) and the cell points are triangulated. The cost depends on the
+    target only, not on the size of the source.
+    
+    Returns:
+        Tuple of (vertices float32 [V, 3], faces int64 [F, 3], cell size)
+    """
+    import meshlib.mrmeshpy as mrmeshpy
+    import meshlib.mrmeshnumpy as mrmeshnumpy
+    
+    # Sorted, so the gathers below walk the source arrays in order
+    rng = np.random.default_rng(0)
+    sample = faces[np.sort(rng.integers(len(faces), size=PREVIEW_SAMPLES_PER_TRIANGLE * target))]
+    v0, v1, v2 = (vertices[sample[:, i]] for i in range(3))
+    centroids = (v0 + v1 + v2) / 3
+    normals = np.cross(v1 - v0, v2 - v0)
+    area = 0.5 * float(np.linalg.norm(normals, axis=1).sum()) * len(faces) / len(sample)
+    
+    # The triangulation has about two triangles per cell
+    cell_size = math.sqrt(cell_factor * area / max(target, 1))
+    cells = np.floor((centroids - centroids.min(axis=0)) / max(cell_size, 1e-12)).astype(np.int64)
+    dims = cells.max(axis=0) + 1
+    keys = (cells[:, 0] * dims[1] + cells[:, 1]) * dims[2] + cells[:, 2]
+    _, cluster = np.unique(keys, return_inverse=True)
+    cluster = cluster.reshape(-1)
+    count = cluster.max() + 1
+    points = np.stack([np.bincount(cluster, centroids[:, axis], count) for axis in range(3)], axis=1)
+    points /= np.bincount(cluster, minlength=count)[:, None]
+    cell_normals = np.stack([np.bincount(cluster, normals[:, axis], count) for axis in range(3)], axis=1)
+    cell_normals /= np.maximum(np.linalg.norm(cell_normals, axis=1), 1e-30)[:, None]
+    
+    cloud = mrmeshnumpy.pointCloudFromPoints(points.astype(np.float32), cell_normals.astype(np.float32))
+    proxy = mrmeshpy.triangulatePointCloud(cloud, mrmeshpy.TriangulationParameters())
+    proxy_faces = np.asarray(mrmeshnumpy.getNumpyFaces(proxy.topology), dtype=np.int64)
+    
+    return np.array(mrmeshnumpy.getNumpyVerts(proxy), dtype=np.float32), proxy_faces, cell_size
+
+
+def _preview_proxy(mesh, max_triangles, max_bytes):
+    """
+    Decimated proxy of a mesh within a triangle and a GLB size budget.
+    
+    Meshes of up to PREVIEW_SOURCE_FACES faces are vertex clustered: the
+    first cell size aims at max_triangles from the surface area (about two
+    triangles per surface cell). Larger meshes are rebuilt from a sample of
+    their faces (see _sampled_proxy), which bounds the latency whatever the
+    size of the source. Later rounds coarsen the small proxy itself.
+    
+    Returns:
+        Tuple of (vertices float32 [V, 3], faces int64 [F, 3])
+    """
+    import meshlib.mrmeshnumpy as mrmeshnumpy
+    
+    vertices = coordinate_view(mesh, mesh.points)
+    faces = np.asarray(mrmeshnumpy.getNumpyFaces(mesh.topology))
+    
+    def size_of(vertex_count, face_count):
+        index_bytes = 2 if vertex_count <= 0xffff else 4
+        return PREVIEW_VERTEX_BYTES * vertex_count + 3 * index_bytes * face_count
+    
+    def fits(vertices, faces):
+        return len(faces) <= max_triangles and size_of(len(vertices), len(faces)) <= max_bytes
+    
+    # Byte budget as a triangle count (about half as many vertices as faces)
+    target = min(max_triangles, max_bytes // (3 * 4 + PREVIEW_VERTEX_BYTES // 2))
+    
+    if len(faces) > PREVIEW_SOURCE_FACES:
+        vertices, faces, cell_size = _sampled_proxy(vertices, faces, target)
+    else:
+        faces = faces[faces[:, 0] != faces[:, 1]]
+        if len(faces) == 0:
+            return np.zeros((0, 3), dtype=np.float32), np.zeros((0, 3), dtype=np.int64)
+        if fits(vertices, faces):
+            return np.array(vertices), faces
+        cell_size = math.sqrt(2.0 * mesh.area() / max(target, 1))
+        vertices, faces = _cluster(vertices, faces, cell_size)
+    
+    for _ in range(8):
+        if fits(vertices, faces):
+            break
+        excess = max(len(faces) / max_triangles, size_of(len(vertices), len(faces)) / max_bytes)
+        cell_size *= max(1.1, math.sqrt(excess))
+        vertices, faces = _cluster(vertices, faces, cell_size)
+    
+    return vertices, faces
+
+
+def _quantized_glb(vertices, faces):
+    """
+    Binary glTF of a triangle mesh with 16-bit positions (KHR_mesh_quantization).
+    
+    Positions are stored as unsigned shorts over the bounding box, which the
+    node transform maps back; indices are 16-bit when they fit. There are no
+    normals, so viewers shade flat.
+    """
+    origin = vertices.min(axis=0) if len(vertices) else np.zeros(3, dtype=np.float32)
+    extent = np.maximum(vertices.max(axis=0) - origin, 1e-12) if len(vertices) else np.ones(3, dtype=np.float32)
+    scale = extent / 65535.0
+    
+    quantized = np.zeros((len(vertices), 4), dtype=np.uint16)
+    quantized[:, :3] = np.round((vertices - origin) / scale)
+    index_type, component = (np.uint16, 5123) if len(vertices) <= 0xffff else (np.uint32, 5125)
+    indices = faces.astype(index_type).tobytes()
+    indices += b"\0" * (-len(indices) % 4)
+    positions = quantized.tobytes()
+    
+    document = {
+        "asset": {"version": "2.0", "generator": "ComfyUI-Meshlib preview"},
+        "extensionsUsed": ["KHR_mesh_quantization"],
+        "extensionsRequired": ["KHR_mesh_quantization"],
+        "scene": 0,
+        "scenes": [{"nodes": [0]}],
+        "nodes": [{"mesh": 0, "translation": origin.tolist(), "scale": scale.tolist()}],
+        "meshes": [{"primitives": [{"attributes": {"POSITION": 0}, "indices": 1, "mode": 4}]}],
+        "buffers": [{"byteLength": len(positions) + len(indices)}],
+        "bufferViews": [
+            {"buffer": 0, "byteOffset": 0, "byteLength": len(positions), "byteStride": 8, "target": 34962},
+            {"buffer": 0, "byteOffset": len(positions), "byteLength": len(indices), "target": 34963},
+        ],
+        "accessors": [
+            {"bufferView": 0, "componentType": 5123, "count": len(vertices), "type": "VEC3",
+             "min": quantized[:, :3].min(axis=0).tolist() if len(vertices) else [0, 0, 0],
+             "max": quantized[:, :3].max(axis=0).tolist() if len(vertices) else [0, 0, 0]},
+            {"bufferView": 1, "componentType": component, "count": faces.size, "type": "SCALAR"},
+        ],
+    }
+    
+    header = json.dumps(document, separators=(",", ":")).encode()
+    header += b" " * (-len(header) % 4)
+    binary = positions + indices
+    
+    return b"".join([
+        struct.pack("<III", 0x46546C67, 2, 12 + 8 + len(header) + 8 + len(binary)),
+        struct.pack("<II", len(header), 0x4E4F534A), header,
+        struct.pack("<II", len(binary), 0x004E4942), binary,
+    ])
+
+
+def _write_preview(mesh, output_path, max_triangles, max_bytes):
+    """
+    Write the preview proxy of mesh to the temp folder.
+    
+    Proxies are cached on the mesh, so previewing the same mesh again only
+    writes the file.
+    
+    Returns:
+        ComfyUI "3d" ui entry of the preview file
+    """
+    cache = get_object_cache(mesh)
+    key = ("preview_glb", max_triangles, max_bytes)
+    data = cache.get(key)
+    if data is None:
+        data = cache[key] = _quantized_glb(*_preview_proxy(mesh, max_triangles, max_bytes))
+    
+    temp_dir = folder_paths.get_temp_directory()
+    os.makedirs(temp_dir, exist_ok=True)
+    filename = f"{Path(output_path).stem}_preview_{uuid.uuid4().hex[:8]}.glb"
+    with open(os.path.join(temp_dir, filename), "wb") as f:
+        f.write(data)
+    
+    return {"filename": filename, "subfolder": "", "type": "temp"}
+
+
+def _send_preview(node_id, entries):
+    """
+    Show "3d" ui entries on a node right away, before it finishes executing.
+    
+    Does nothing outside the ComfyUI server; the entries are also part of the
+    node's ui result, which ComfyUI sends once the node returns.
+    """
+    try:
+        from server import PromptServer
+    except ImportError:
+        return
+    
+    server = getattr(PromptServer, "instance", None)
+    if server is None or node_id is None:
+        return
+    server.send_sync("executed", {
+        "node": node_id,
+        "display_node": node_id,
+        "output": {"3d": list(entries)},
+        "prompt_id": getattr(server, "last_prompt_id", None),
+    }, getattr(server, "client_id", None))
+
+
 class MeshlibSaveMesh:
     """Save a mesh to file using MeshLib"""
     
@@ -92,23 +364,100 @@ class MeshlibSaveMesh:
                 "mesh": ("MESHLIB_MESH",),
                 "filename_prefix": ("STRING", {"default": "3D/meshlib"}),
                 "file_format": (["stl", "obj", "ply", "ctm", "glb", "off"],),
+            },
+            "optional": {
+                "max_workers": ("INT", {
+                    "default": 4,
+                    "min": 1,
+                    "max": 64,
+                    "tooltip": "Maximum number of list items processed concurrently"
+                }),
+                "preview": ("BOOLEAN", {
+                    "default": False,
+                    "tooltip": "Show a decimated, quantized GLB proxy of the mesh in the 3D viewer"
+                }),
+                "preview_triangles": ("INT", {
+                    "default": 100000,
+                    "min": 1000,
+                    "max": 2000000,
+                    "tooltip": "Maximum number of triangles of the preview proxy"
+                }),
+                "preview_max_kb": ("INT", {
+                    "default": 2048,
+                    "min": 64,
+                    "max": 65536,
+                    "tooltip": "Maximum size of the preview file in KiB"
+                }),
+            },
+            "hidden": {
+                "unique_id": "UNIQUE_ID",
             }
         }
     
+    INPUT_IS_LIST = True
     RETURN_TYPES = ("STRING",)
     RETURN_NAMES = ("file_path",)
+    OUTPUT_IS_LIST = (True,)
     OUTPUT_NODE = True
     FUNCTION = "process"
     CATEGORY = "Meshlib/IO"
-    DESCRIPTION = "Save a mesh to file. Supports STL, OBJ, PLY, CTM, GLB, and OFF formats."
+    DESCRIPTION = """Save a mesh to file. Supports STL, OBJ, PLY, CTM, GLB, and OFF formats.
+With preview enabled, a decimated proxy within the triangle and size budget is built on a background thread
+while the full-resolution file is written, and shown in the 3D viewer as soon as it is ready, before the save finishes.
+Meshes above 4M faces are previewed from a face sample, so the preview latency doesn't grow with the mesh."""
 
-    def process(self, mesh, filename_prefix, file_format):
+    def process(self, mesh, filename_prefix, file_format, max_workers=(4,), preview=(False,),
+                preview_triangles=(100000,), preview_max_kb=(2048,), unique_id=(None,)):
+        items = batch_items(dict(mesh=mesh, filename_prefix=filename_prefix, file_format=file_format))
+        
+        # Reserve the file names first: saves running concurrently would all get the same counter
+        groups = {}
+        for item in items:
+            groups.setdefault((item["filename_prefix"], item["file_format"]), []).append(item)
+        for (prefix, extension), group in groups.items():
+            for item, output_path in zip(group, get_output_paths(prefix, extension, len(group))):
+                item["output_path"] = output_path
+        
+        inputs = {name: [item[name] for item in items] for name in ("mesh", "output_path")}
+        inputs.update(preview=preview, preview_triangles=preview_triangles, preview_max_kb=preview_max_kb)
+        
+        # Previews of all items shown so far, sent again whenever another one is ready
+        shown = []
+        lock = threading.Lock()
+        
+        def show(entry):
+            with lock:
+                shown.append(entry)
+                _send_preview(unique_id[0], shown)
+        
+        inputs["show_preview"] = [show]
+        return map_batch(self.save, inputs, len(self.RETURN_TYPES), max_workers[0])
+    
+    def save(self, mesh, output_path, preview=False, preview_triangles=100000, preview_max_kb=2048, show_preview=None):
         import meshlib.mrmeshpy as mrmeshpy
         
-        output_path = get_output_path(filename_prefix, file_format)
-        mrmeshpy.saveMesh(mesh, output_path)
+        if not preview:
+            mrmeshpy.saveMesh(mesh, output_path)
+            return (output_path,)
         
-        return (output_path,)
+        def write_preview():
+            entry = _write_preview(mesh, output_path, preview_triangles, preview_max_kb * 1024)
+            if show_preview is not None:
+                show_preview(entry)
+            return entry
+        
+        # The proxy only reads the mesh: it is built and shown while the full file is written.
+        # The node returns once the file is complete, since file_path must point to a finished file
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="meshlib-preview") as pool:
+            proxy = pool.submit(write_preview)
+            mrmeshpy.saveMesh(mesh, output_path)
+        
+        try:
+            entry = proxy.result()
+        except Exception as e:
+            raise ValueError(f"Preview of {output_path} failed (the mesh itself was saved): {e}") from e
+        
+        return {"ui": {"3d": [entry]}, "result": (output_path,)}
 
 
 class MeshlibLoadPoints:
@@ -214,6 +563,187 @@ class MeshlibToTrimesh:
         return (tm,)
 
 
+def _batched(array, name, items_axis_name):
+    """Normalize a (N, 3) or (B, N, 3) array to (B, N, 3)."""
+    if array.ndim == 2:
+        array = array[None]
+    if array.ndim != 3 or array.shape[2] != 3:
+        raise ValueError(f"{name} must have shape ({items_axis_name}, 3) or (B, {items_axis_name}, 3), got {array.shape}.")
+    return array
+
+
+class MeshlibMeshToArrays:
+    """Expose the vertices and faces of a mesh as arrays"""
+    
+    @classmethod
+    def INPUT_TYPES(s):
+        return {
+            "required": {
+                "mesh": ("MESHLIB_MESH",),
+            },
+            "optional": {
+                "output_type": (["numpy", "torch"], {
+                    "default": "numpy",
+                    "tooltip": "NumPy arrays or CPU torch tensors"
+                }),
+                "share_memory": ("BOOLEAN", {
+                    "default": True,
+                    "tooltip": "Vertices are a read-only view of the mesh's own storage instead of a copy (don't modify them in place)"
+                }),
+            }
+        }
+    
+    RETURN_TYPES = ("MESHLIB_ARRAY", "MESHLIB_ARRAY")
+    RETURN_NAMES = ("vertices", "faces")
+    FUNCTION = "process"
+    CATEGORY = "Meshlib/IO"
+    DESCRIPTION = """Convert a mesh to a float32 (V, 3) vertex array and an int32 (F, 3) face array, without building a Trimesh.
+Faces index into vertices; vertices left unused by earlier operations (e.g. decimation) are kept, so indices stay valid.
+With share_memory, the vertices map MeshLib's buffer directly; only the faces are built."""
+
+    def process(self, mesh, output_type="numpy", share_memory=True):
+        import meshlib.mrmeshnumpy as mrmeshnumpy
+        
+        if share_memory:
+            vertices = coordinate_view(mesh, mesh.points)
+        else:
+            vertices = np.array(coordinate_view(mesh, mesh.points))
+        
+        faces = np.asarray(mrmeshnumpy.getNumpyFaces(mesh.topology), dtype=np.int32)
+        # Invalid faces are reported as (0, 0, 0)
+        faces = faces[faces[:, 0] != faces[:, 1]]
+        
+        return (to_output_array(vertices, output_type), to_output_array(faces, output_type))
+
+
+class MeshlibMeshFromArrays:
+    """Build meshes from vertex and face arrays"""
+    
+    @classmethod
+    def INPUT_TYPES(s):
+        return {
+            "required": {
+                "vertices": ("MESHLIB_ARRAY", {
+                    "tooltip": "Vertex positions (V, 3), or a batch (B, V, 3); NumPy array or torch tensor"
+                }),
+                "faces": ("MESHLIB_ARRAY", {
+                    "tooltip": "Vertex indices (F, 3) shared by the whole batch, or one set per item (B, F, 3)"
+                }),
+            }
+        }
+    
+    RETURN_TYPES = ("MESHLIB_MESH",)
+    RETURN_NAMES = ("meshes",)
+    OUTPUT_IS_LIST = (True,)
+    FUNCTION = "process"
+    CATEGORY = "Meshlib/IO"
+    DESCRIPTION = """Build one mesh per batch item from vertex and face arrays or tensors (e.g. from other 3D nodes).
+With shared faces, the topology is built once and copied for the other items, which only get their vertex positions."""
+
+    def process(self, vertices, faces):
+        import meshlib.mrmeshpy as mrmeshpy
+        import meshlib.mrmeshnumpy as mrmeshnumpy
+        
+        vertices = _batched(to_numpy_array(vertices), "vertices", "V")
+        faces = _batched(to_numpy_array(faces, dtype=np.int32), "faces", "F")
+        if len(faces) not in (1, len(vertices)):
+            raise ValueError(f"Got {len(faces)} face sets for a batch of {len(vertices)} vertex sets.")
+        if faces.size and (faces.min() < 0 or faces.max() >= vertices.shape[1]):
+            raise ValueError(f"Face indices must be in [0, {vertices.shape[1]}).")
+        
+        meshes = []
+        for i, item in enumerate(vertices):
+            if len(faces) == 1 and meshes:
+                mesh = mrmeshpy.copyMesh(meshes[0])
+                set_mesh_points(mesh, item)
+            else:
+                mesh = mrmeshnumpy.meshFromFacesVerts(np.ascontiguousarray(faces[min(i, len(faces) - 1)]),
+                                                      np.ascontiguousarray(item))
+            meshes.append(mesh)
+        
+        return (meshes,)
+
+
+class MeshlibPointCloudToArrays:
+    """Expose the points and normals of a point cloud as arrays"""
+    
+    @classmethod
+    def INPUT_TYPES(s):
+        return {
+            "required": {
+                "points": ("MESHLIB_POINTCLOUD",),
+            },
+            "optional": {
+                "output_type": (["numpy", "torch"], {
+                    "default": "numpy",
+                    "tooltip": "NumPy arrays or CPU torch tensors"
+                }),
+                "share_memory": ("BOOLEAN", {
+                    "default": True,
+                    "tooltip": "Return read-only views of the point cloud's own storage instead of copies when all points are valid (don't modify them in place)"
+                }),
+            }
+        }
+    
+    RETURN_TYPES = ("MESHLIB_ARRAY", "MESHLIB_ARRAY")
+    RETURN_NAMES = ("points", "normals")
+    FUNCTION = "process"
+    CATEGORY = "Meshlib/IO"
+    DESCRIPTION = """Convert a point cloud to a float32 (N, 3) point array and a (N, 3) normal array (None without normals).
+Deleted points are dropped, which needs a copy; otherwise share_memory maps MeshLib's buffers directly."""
+
+    def process(self, points, output_type="numpy", share_memory=True):
+        count = points.points.vec.size()
+        if share_memory and points.validPoints.count() == count:
+            coords = coordinate_view(points, points.points)
+            normals = coordinate_view(points, points.normals)[:count] if points.hasNormals() else None
+        else:
+            coords, normals = pointcloud_to_numpy(points)
+        
+        if normals is not None:
+            normals = to_output_array(normals, output_type)
+        
+        return (to_output_array(coords, output_type), normals)
+
+
+class MeshlibPointCloudFromArrays:
+    """Build point clouds from point and normal arrays"""
+    
+    @classmethod
+    def INPUT_TYPES(s):
+        return {
+            "required": {
+                "points": ("MESHLIB_ARRAY", {
+                    "tooltip": "Point positions (N, 3), or a batch (B, N, 3); NumPy array or torch tensor"
+                }),
+            },
+            "optional": {
+                "normals": ("MESHLIB_ARRAY", {
+                    "tooltip": "Normals with the same shape as points"
+                }),
+            }
+        }
+    
+    RETURN_TYPES = ("MESHLIB_POINTCLOUD",)
+    RETURN_NAMES = ("points",)
+    OUTPUT_IS_LIST = (True,)
+    FUNCTION = "process"
+    CATEGORY = "Meshlib/IO"
+    DESCRIPTION = "Build one point cloud per batch item from point (and normal) arrays or tensors."
+
+    def process(self, points, normals=None):
+        points = _batched(to_numpy_array(points), "points", "N")
+        if normals is not None:
+            normals = _batched(to_numpy_array(normals), "normals", "N")
+            if normals.shape != points.shape:
+                raise ValueError(f"normals must have the shape of points {points.shape}, got {normals.shape}.")
+        
+        clouds = [numpy_to_pointcloud(item, normals[i] if normals is not None else None)
+                  for i, item in enumerate(points)]
+        
+        return (clouds,)
+
+
 class MeshlibCopyMesh:
     """Create a copy of a MeshLib mesh"""
     
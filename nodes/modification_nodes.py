@@ -1,10 +1,14 @@
 """
 Modification Nodes for ComfyUI-Meshlib
-Mesh modification operations: decimation, subdivision, offset, relax, transform
+Mesh modification operations: decimation, subdivision, offset, relax, transform, reorder
 """
 
 import math
 
+from ..memory_budget import check_memory, estimate_decimate, estimate_offset, fit_voxel_count, reserve_memory
+from ..thread_control import thread_limit
+from ..utils import reorder_mesh, map_batch, topology_summary, NodeProgress, SPACE_FILLING_CURVES
+
 
 class MeshlibDecimate:
     """Decimate (simplify) a mesh by reducing triangle count"""
@@ -33,18 +37,44 @@ class MeshlibDecimate:
                     "max": 256,
                     "tooltip": "Number of parallel processing parts (higher = faster but slightly lower quality)"
                 }),
+            },
+            "optional": {
+                "max_threads": ("INT", {
+                    "default": 0,
+                    "min": 0,
+                    "max": 1024,
+                    "tooltip": "Maximum native threads for this node (0 = global setting); can only lower the global limit"
+                }),
+                "max_workers": ("INT", {
+                    "default": 4,
+                    "min": 1,
+                    "max": 64,
+                    "tooltip": "Maximum number of list items processed concurrently"
+                }),
             }
         }
     
+    INPUT_IS_LIST = True
     RETURN_TYPES = ("MESHLIB_MESH", "INT", "INT")
     RETURN_NAMES = ("mesh", "verts_deleted", "faces_deleted")
+    OUTPUT_IS_LIST = (True, True, True)
     FUNCTION = "process"
+    ITEM_FUNCTION = "process_item"
     CATEGORY = "Meshlib/Modification"
     DESCRIPTION = "Decimate a mesh by reducing the number of triangles while preserving shape."
 
-    def process(self, mesh, target_faces, max_error, subdivide_parts):
+    def process(self, mesh, target_faces, max_error, subdivide_parts, max_threads=(0,), max_workers=(4,)):
+        inputs = dict(mesh=mesh, target_faces=target_faces, max_error=max_error, subdivide_parts=subdivide_parts,
+                      max_threads=max_threads)
+        return map_batch(self.process_item, inputs, len(self.RETURN_TYPES), max_workers[0])
+    
+    def process_item(self, mesh, target_faces, max_error, subdivide_parts, max_threads=0):
         import meshlib.mrmeshpy as mrmeshpy
         
+        # There is no lower resolution to fall back to: fail before copying
+        estimate = estimate_decimate(mesh)
+        check_memory("Decimation", estimate)
+        
         # Work on a copy to avoid modifying original
         mesh = mrmeshpy.copyMesh(mesh)
         mesh.packOptimally()
@@ -57,7 +87,9 @@ class MeshlibDecimate:
         settings.maxError = max_error
         settings.subdivideParts = subdivide_parts
         
-        result = mrmeshpy.decimateMesh(mesh, settings)
+        with reserve_memory(estimate), thread_limit(max_threads), NodeProgress() as progress:
+            settings.progressCallback = progress
+            result = mrmeshpy.decimateMesh(mesh, settings)
         
         return (mesh, result.vertsDeleted, result.facesDeleted)
 
@@ -109,7 +141,9 @@ class MeshlibSubdivide:
         settings.maxDeviationAfterFlip = max_deviation_after_flip
         settings.maxEdgeSplits = max_splits
         
-        splits = mrmeshpy.subdivideMesh(mesh, settings)
+        with NodeProgress() as progress:
+            settings.progressCallback = progress
+            splits = mrmeshpy.subdivideMesh(mesh, settings)
         
         return (mesh, splits)
 
@@ -135,26 +169,53 @@ class MeshlibOffset:
                     "max": 50000000,
                     "tooltip": "Approximate number of voxels for the operation (higher = more detail)"
                 }),
+            },
+            "optional": {
+                "max_threads": ("INT", {
+                    "default": 0,
+                    "min": 0,
+                    "max": 1024,
+                    "tooltip": "Maximum native threads for this node (0 = global setting); can only lower the global limit"
+                }),
+                "max_workers": ("INT", {
+                    "default": 4,
+                    "min": 1,
+                    "max": 64,
+                    "tooltip": "Maximum number of list items processed concurrently"
+                }),
             }
         }
     
+    INPUT_IS_LIST = True
     RETURN_TYPES = ("MESHLIB_MESH",)
     RETURN_NAMES = ("mesh",)
+    OUTPUT_IS_LIST = (True,)
     FUNCTION = "process"
+    ITEM_FUNCTION = "process_item"
     CATEGORY = "Meshlib/Modification"
     DESCRIPTION = "Create an offset surface from a mesh. Positive offset expands, negative shrinks."
 
-    def process(self, mesh, offset, voxel_count):
+    def process(self, mesh, offset, voxel_count, max_threads=(0,), max_workers=(4,)):
+        inputs = dict(mesh=mesh, offset=offset, voxel_count=voxel_count, max_threads=max_threads)
+        return map_batch(self.process_item, inputs, len(self.RETURN_TYPES), max_workers[0])
+    
+    def process_item(self, mesh, offset, voxel_count, max_threads=0):
         import meshlib.mrmeshpy as mrmeshpy
         
+        area = mesh.area()
+        voxel_count = fit_voxel_count("Offset", lambda count: estimate_offset(mesh, offset, count, area), voxel_count)
+        
         params = mrmeshpy.OffsetParameters()
         params.voxelSize = mrmeshpy.suggestVoxelSize(mesh, voxel_count)
         
         # Check if mesh has holes and adjust sign detection
-        if not mrmeshpy.findRightBoundary(mesh.topology).empty():
+        if not topology_summary(mesh).closed:
             params.signDetectionMode = mrmeshpy.SignDetectionMode.HoleWindingRule
         
-        result = mrmeshpy.offsetMesh(mesh, offset, params)
+        estimate = estimate_offset(mesh, offset, voxel_count, area)
+        with reserve_memory(estimate), thread_limit(max_threads), NodeProgress() as progress:
+            params.callBack = progress
+            result = mrmeshpy.offsetMesh(mesh, offset, params)
         
         return (result,)
 
@@ -180,16 +241,31 @@ class MeshlibRelax:
                     "step": 0.1,
                     "tooltip": "Relaxation strength (0-1)"
                 }),
+            },
+            "optional": {
+                "max_workers": ("INT", {
+                    "default": 4,
+                    "min": 1,
+                    "max": 64,
+                    "tooltip": "Maximum number of list items processed concurrently"
+                }),
             }
         }
     
+    INPUT_IS_LIST = True
     RETURN_TYPES = ("MESHLIB_MESH",)
     RETURN_NAMES = ("mesh",)
+    OUTPUT_IS_LIST = (True,)
     FUNCTION = "process"
+    ITEM_FUNCTION = "process_item"
     CATEGORY = "Meshlib/Modification"
     DESCRIPTION = "Smooth a mesh by relaxing vertex positions."
 
-    def process(self, mesh, iterations, force):
+    def process(self, mesh, iterations, force, max_workers=(4,)):
+        inputs = dict(mesh=mesh, iterations=iterations, force=force)
+        return map_batch(self.process_item, inputs, len(self.RETURN_TYPES), max_workers[0])
+    
+    def process_item(self, mesh, iterations, force):
         import meshlib.mrmeshpy as mrmeshpy
         
         mesh = mrmeshpy.copyMesh(mesh)
@@ -242,17 +318,34 @@ class MeshlibTransform:
                     "step": 0.1,
                     "tooltip": "Uniform scale factor"
                 }),
+            },
+            "optional": {
+                "max_workers": ("INT", {
+                    "default": 4,
+                    "min": 1,
+                    "max": 64,
+                    "tooltip": "Maximum number of list items processed concurrently"
+                }),
             }
         }
     
+    INPUT_IS_LIST = True
     RETURN_TYPES = ("MESHLIB_MESH",)
     RETURN_NAMES = ("mesh",)
+    OUTPUT_IS_LIST = (True,)
     FUNCTION = "process"
+    ITEM_FUNCTION = "process_item"
     CATEGORY = "Meshlib/Modification"
     DESCRIPTION = "Apply translation, rotation, and scaling to a mesh."
 
-    def process(self, mesh, translate_x, translate_y, translate_z, 
-                rotate_x, rotate_y, rotate_z, scale_uniform):
+    def process(self, mesh, translate_x, translate_y, translate_z,
+                rotate_x, rotate_y, rotate_z, scale_uniform, max_workers=(4,)):
+        inputs = dict(mesh=mesh, translate_x=translate_x, translate_y=translate_y, translate_z=translate_z,
+                      rotate_x=rotate_x, rotate_y=rotate_y, rotate_z=rotate_z, scale_uniform=scale_uniform)
+        return map_batch(self.process_item, inputs, len(self.RETURN_TYPES), max_workers[0])
+    
+    def process_item(self, mesh, translate_x, translate_y, translate_z, 
+                     rotate_x, rotate_y, rotate_z, scale_uniform):
         import meshlib.mrmeshpy as mrmeshpy
         
         mesh = mrmeshpy.copyMesh(mesh)
@@ -284,3 +377,31 @@ class MeshlibTransform:
             mesh.transform(mrmeshpy.AffineXf3f.translation(trans))
         
         return (mesh,)
+
+
+class MeshlibReorderMesh:
+    """Sort the vertices and faces of a mesh for cache locality"""
+    
+    @classmethod
+    def INPUT_TYPES(s):
+        return {
+            "required": {
+                "mesh": ("MESHLIB_MESH",),
+                "curve": (list(SPACE_FILLING_CURVES), {
+                    "default": "morton",
+                    "tooltip": "Space filling curve used to order vertices and faces"
+                }),
+            }
+        }
+    
+    RETURN_TYPES = ("MESHLIB_MESH",)
+    RETURN_NAMES = ("mesh",)
+    FUNCTION = "process"
+    CATEGORY = "Meshlib/Modification"
+    DESCRIPTION = """Reorder vertices and faces along a Morton (Z-order) or Hilbert curve.
+The geometry is unchanged; spatially close elements become close in memory,
+which speeds up later AABB builds, relaxation, collision tests and booleans.
+Vertex and face indices change."""
+
+    def process(self, mesh, curve):
+        return (reorder_mesh(mesh, curve),)
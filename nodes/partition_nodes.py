@@ -0,0 +1,369 @@
+"""
+Partition Nodes for ComfyUI-Meshlib
+Octree partitioning of large meshes into chunks processed out of core
+"""
+
+import math
+import os
+import shutil
+import time
+import uuid
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from ..utils import mesh_to_numpy
+
+
+def _octree_leaves(centroids, max_faces, max_depth=21):
+    """
+    Partition faces into octree leaves of at most max_faces faces.
+    
+    Args:
+        centroids: Face centroids [F, 3]
+        max_faces: Maximum number of faces per leaf
+        max_depth: Depth limit (leaves at this depth may be larger)
+    
+    Returns:
+        List of face index arrays
+    """
+    box_min = centroids.min(axis=0)
+    size = float((centroids.max(axis=0) - box_min).max()) or 1.0
+    
+    leaves = []
+    stack = [(np.arange(len(centroids)), box_min, size, 0)]
+    while stack:
+        indices, cell_min, cell_size, depth = stack.pop()
+        if len(indices) <= max_faces or depth >= max_depth:
+            leaves.append(indices)
+            continue
+        
+        half = cell_size / 2
+        bits = centroids[indices] >= cell_min + half
+        octant = bits[:, 0] * 4 + bits[:, 1] * 2 + bits[:, 2]
+        order = np.argsort(octant, kind="stable")
+        counts = np.bincount(octant, minlength=8)
+        for code, part in enumerate(np.split(indices[order], np.cumsum(counts)[:-1])):
+            if len(part):
+                offset = np.array([(code >> 2) & 1, (code >> 1) & 1, code & 1]) * half
+                stack.append((part, cell_min + offset, half, depth + 1))
+    
+    return leaves
+
+
+def _chunk_directory():
+    import folder_paths
+    
+    directory = os.path.join(folder_paths.get_temp_directory(), "meshlib_chunks", uuid.uuid4().hex)
+    os.makedirs(directory, exist_ok=True)
+    return directory
+
+
+class ChunkSet(dict):
+    """
+    MESHLIB_CHUNKS value: a dict with the chunk directory, the chunk entries
+    and the number of shared vertices.
+    
+    The directory is deleted once the ChunkSet is garbage collected, i.e. when
+    ComfyUI no longer caches the node output holding it (or at exit).
+    """
+    
+    def __init__(self, directory, chunks, num_shared):
+        super().__init__(directory=directory, chunks=chunks, num_shared=num_shared)
+        weakref.finalize(self, shutil.rmtree, directory, True)
+
+
+def _write_chunk(directory, index, vertices, faces, vertex_ids):
+    """
+    Store one chunk as .npy files, dropping vertices no face uses.
+    
+    vertex_ids holds the global id of every locked (shared) vertex and -1 for
+    vertices private to the chunk.
+    """
+    used, local_faces = np.unique(faces, return_inverse=True)
+    entry = {
+        "vertices": os.path.join(directory, f"{index}_vertices.npy"),
+        "faces": os.path.join(directory, f"{index}_faces.npy"),
+        "vertex_ids": os.path.join(directory, f"{index}_ids.npy"),
+        "num_faces": len(faces),
+    }
+    np.save(entry["vertices"], np.ascontiguousarray(vertices[used], dtype=np.float32))
+    np.save(entry["faces"], local_faces.reshape(-1, 3).astype(np.int32))
+    np.save(entry["vertex_ids"], np.ascontiguousarray(vertex_ids[used], dtype=np.int64))
+    return entry
+
+
+def _read_chunk(entry):
+    """Memory-map the arrays of a chunk."""
+    return (np.load(entry["vertices"], mmap_mode="r"),
+            np.load(entry["faces"], mmap_mode="r"),
+            np.load(entry["vertex_ids"], mmap_mode="r"))
+
+
+def partition_mesh(mesh, max_faces):
+    """
+    Split a mesh into octree chunks spilled to disk.
+    
+    Every face goes to the leaf containing its centroid. Vertices used by
+    faces of several chunks are shared: they get a global id and stay locked
+    while chunks are processed, so the chunks can be welded back exactly.
+    
+    Args:
+        mesh: meshlib.mrmeshpy.Mesh object
+        max_faces: Maximum number of faces per chunk
+    
+    Returns:
+        ChunkSet (MESHLIB_CHUNKS)
+    """
+    vertices, faces = mesh_to_numpy(mesh)
+    leaves = _octree_leaves(vertices[faces].mean(axis=1), max_faces)
+    
+    face_chunk = np.empty(len(faces), dtype=np.int64)
+    for index, leaf in enumerate(leaves):
+        face_chunk[leaf] = index
+    
+    # A vertex is shared when its faces belong to more than one chunk
+    first = np.full(len(vertices), len(leaves), dtype=np.int64)
+    last = np.full(len(vertices), -1, dtype=np.int64)
+    corner_chunks = np.repeat(face_chunk, 3)
+    np.minimum.at(first, faces.ravel(), corner_chunks)
+    np.maximum.at(last, faces.ravel(), corner_chunks)
+    vertex_ids = np.where((last >= 0) & (first != last), np.arange(len(vertices)), -1)
+    
+    # Owned by the ChunkSet as soon as it exists, so an error meanwhile mustn't leave the directory behind
+    result = ChunkSet(_chunk_directory(), [], int((vertex_ids >= 0).sum()))
+    result["chunks"] = [_write_chunk(result["directory"], index, vertices, faces[leaf], vertex_ids)
+                        for index, leaf in enumerate(leaves)]
+    
+    return result
+
+
+def _process_chunk(entry, operation, params, directory, index):
+    """Load a chunk, run the operation with its shared vertices locked and store the result."""
+    import meshlib.mrmeshpy as mrmeshpy
+    import meshlib.mrmeshnumpy as mrmeshnumpy
+    
+    vertices, faces, vertex_ids = _read_chunk(entry)
+    mesh = mrmeshnumpy.meshFromFacesVerts(np.asarray(faces), np.asarray(vertices))
+    
+    if operation == "decimate":
+        num_faces = mesh.topology.numValidFaces()
+        settings = mrmeshpy.DecimateSettings()
+        settings.maxDeletedFaces = num_faces - max(4, int(round(num_faces * params["decimate_ratio"])))
+        settings.maxError = params["max_error"]
+        # Chunk borders (which contain all shared vertices) keep their vertices
+        settings.touchBdVerts = False
+        settings.touchNearBdEdges = False
+        mrmeshpy.decimateMesh(mesh, settings)
+    elif operation == "relax":
+        locked = np.zeros(mesh.topology.vertSize(), dtype=bool)
+        locked[:len(vertex_ids)] = np.asarray(vertex_ids) >= 0
+        free = mrmeshnumpy.vertBitSetFromBools(~locked)
+        free &= mesh.topology.getValidVerts()
+        params_relax = mrmeshpy.MeshRelaxParams()
+        params_relax.iterations = params["iterations"]
+        params_relax.force = params["force"]
+        params_relax.region = free
+        mrmeshpy.relax(mesh, params_relax)
+    else:
+        settings = mrmeshpy.SubdivideSettings()
+        settings.maxEdgeLen = params["max_edge_length"]
+        settings.maxDeviationAfterFlip = params["max_deviation_after_flip"]
+        # Border edges stay whole so neighbouring chunks still match. A long
+        # border edge would then have its triangle split into ever thinner
+        # slivers, so such triangles are left alone and the splits are capped
+        # at about twice what covering the chunk with max_edge_length edges needs
+        settings.subdivideBorder = False
+        settings.maxSplittableTriAspectRatio = 20
+        settings.maxEdgeSplits = int(math.ceil(4 * mesh.area() / params["max_edge_length"] ** 2))
+        mrmeshpy.subdivideMesh(mesh, settings)
+    
+    new_vertices, new_faces = mesh_to_numpy(mesh)
+    # Surviving original vertices keep their index; new ones are private
+    new_ids = np.full(len(new_vertices), -1, dtype=np.int64)
+    new_ids[:len(vertex_ids)] = vertex_ids
+    
+    return _write_chunk(directory, index, new_vertices, new_faces, new_ids)
+
+
+def merge_chunks(chunks):
+    """
+    Weld chunks back into one mesh; shared vertices are merged by global id.
+    
+    Args:
+        chunks: MESHLIB_CHUNKS dict
+    
+    Returns:
+        meshlib.mrmeshpy.Mesh object
+    """
+    import meshlib.mrmeshnumpy as mrmeshnumpy
+    
+    arrays = [_read_chunk(entry) for entry in chunks["chunks"]]
+    vertices = np.concatenate([v for v, _, _ in arrays])
+    vertex_ids = np.concatenate([ids for _, _, ids in arrays])
+    offsets = np.cumsum([0] + [len(v) for v, _, _ in arrays[:-1]])
+    faces = np.concatenate([np.asarray(f) + offset for (_, f, _), offset in zip(arrays, offsets)])
+    
+    # Shared vertices map to their first copy, private ones to themselves
+    target = np.arange(len(vertices))
+    shared = np.flatnonzero(vertex_ids >= 0)
+    _, first, inverse = np.unique(vertex_ids[shared], return_index=True, return_inverse=True)
+    target[shared] = shared[first][inverse]
+    
+    used, remapped = np.unique(target[faces], return_inverse=True)
+    return mrmeshnumpy.meshFromFacesVerts(remapped.reshape(-1, 3).astype(np.int32), vertices[used])
+
+
+class MeshlibOctreePartition:
+    """Split a mesh into octree chunks stored on disk"""
+    
+    @classmethod
+    def INPUT_TYPES(s):
+        return {
+            "required": {
+                "mesh": ("MESHLIB_MESH",),
+                "max_faces_per_chunk": ("INT", {
+                    "default": 1000000,
+                    "min": 1000,
+                    "max": 100000000,
+                    "tooltip": "Maximum number of faces per chunk; bounds the memory used per chunk while processing"
+                }),
+            }
+        }
+    
+    RETURN_TYPES = ("MESHLIB_CHUNKS", "STRING")
+    RETURN_NAMES = ("chunks", "info")
+    FUNCTION = "process"
+    CATEGORY = "Meshlib/Partition"
+    DESCRIPTION = """Split a mesh into octree chunks spilled to disk as memory-mapped arrays.
+Vertices shared between chunks are locked during processing so the chunks weld back exactly."""
+
+    def process(self, mesh, max_faces_per_chunk):
+        start = time.perf_counter()
+        chunks = partition_mesh(mesh, max_faces_per_chunk)
+        
+        sizes = [entry["num_faces"] for entry in chunks["chunks"]]
+        info = (f"{len(sizes)} chunks ({min(sizes)}-{max(sizes)} faces), {chunks['num_shared']} shared vertices, "
+                f"{time.perf_counter() - start:.3f}s")
+        
+        return (chunks, info)
+
+
+class MeshlibOctreeProcess:
+    """Run an operation on every chunk of a partitioned mesh"""
+    
+    @classmethod
+    def INPUT_TYPES(s):
+        return {
+            "required": {
+                "chunks": ("MESHLIB_CHUNKS",),
+                "operation": (["decimate", "relax", "subdivide"], {
+                    "default": "decimate",
+                    "tooltip": "Operation applied to each chunk"
+                }),
+                "max_workers": ("INT", {
+                    "default": 2,
+                    "min": 1,
+                    "max": 64,
+                    "tooltip": "Number of chunks in memory and processed at the same time"
+                }),
+            },
+            "optional": {
+                "decimate_ratio": ("FLOAT", {
+                    "default": 0.5,
+                    "min": 0.0,
+                    "max": 1.0,
+                    "step": 0.01,
+                    "tooltip": "decimate: fraction of the faces kept"
+                }),
+                "max_error": ("FLOAT", {
+                    "default": 0.001,
+                    "min": 0.0,
+                    "max": 1.0,
+                    "step": 0.0001,
+                    "tooltip": "decimate: maximum geometric error allowed"
+                }),
+                "iterations": ("INT", {
+                    "default": 5,
+                    "min": 1,
+                    "max": 100,
+                    "tooltip": "relax: number of relaxation iterations"
+                }),
+                "force": ("FLOAT", {
+                    "default": 0.5,
+                    "min": 0.0,
+                    "max": 1.0,
+                    "step": 0.1,
+                    "tooltip": "relax: relaxation strength (0-1)"
+                }),
+                "max_edge_length": ("FLOAT", {
+                    "default": 0.1,
+                    "min": 0.0001,
+                    "max": 100.0,
+                    "step": 0.01,
+                    "tooltip": "subdivide: maximum edge length after subdivision"
+                }),
+                "max_deviation_after_flip": ("FLOAT", {
+                    "default": 0.5,
+                    "min": 0.0,
+                    "max": 10.0,
+                    "step": 0.1,
+                    "tooltip": "subdivide: maximum deviation allowed when flipping edges"
+                }),
+            }
+        }
+    
+    RETURN_TYPES = ("MESHLIB_CHUNKS", "STRING")
+    RETURN_NAMES = ("chunks", "info")
+    FUNCTION = "process"
+    CATEGORY = "Meshlib/Partition"
+    DESCRIPTION = """Stream every chunk through decimate, relax or subdivide with bounded concurrency.
+Only max_workers chunks are in memory at once. Shared chunk borders are left untouched,
+so results can be chained and merged without seams."""
+
+    def process(self, chunks, operation, max_workers, decimate_ratio=0.5, max_error=0.001,
+                iterations=5, force=0.5, max_edge_length=0.1, max_deviation_after_flip=0.5):
+        start = time.perf_counter()
+        params = {
+            "decimate_ratio": decimate_ratio,
+            "max_error": max_error,
+            "iterations": iterations,
+            "force": force,
+            "max_edge_length": max_edge_length,
+            "max_deviation_after_flip": max_deviation_after_flip,
+        }
+        
+        result = ChunkSet(_chunk_directory(), [], chunks["num_shared"])
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            result["chunks"] = list(pool.map(
+                lambda item: _process_chunk(item[1], operation, params, result["directory"], item[0]),
+                enumerate(chunks["chunks"]),
+            ))
+        
+        before = sum(entry["num_faces"] for entry in chunks["chunks"])
+        after = sum(entry["num_faces"] for entry in result["chunks"])
+        info = f"{operation} on {len(result['chunks'])} chunks: faces {before} -> {after}, {time.perf_counter() - start:.3f}s"
+        
+        return (result, info)
+
+
+class MeshlibOctreeMerge:
+    """Weld the chunks of a partitioned mesh back into one mesh"""
+    
+    @classmethod
+    def INPUT_TYPES(s):
+        return {
+            "required": {
+                "chunks": ("MESHLIB_CHUNKS",),
+            }
+        }
+    
+    RETURN_TYPES = ("MESHLIB_MESH",)
+    RETURN_NAMES = ("mesh",)
+    FUNCTION = "process"
+    CATEGORY = "Meshlib/Partition"
+    DESCRIPTION = "Weld octree chunks back into a single mesh, merging the shared border vertices."
+    
+    def process(self, chunks):
+        return (merge_chunks(chunks),)
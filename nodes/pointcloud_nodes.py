@@ -3,6 +3,512 @@ Point Cloud Nodes for ComfyUI-Meshlib
 Point cloud triangulation and sampling
 """
 
+import math
+import os
+
+import numpy as np
+
+from ..memory_budget import (check_memory, estimate_offset, estimate_tiled_triangulation, estimate_triangulation,
+                             fit_voxel_count, fits_memory, memory_policy, reserve_memory)
+from ..utils import mesh_to_numpy, numpy_to_pointcloud, pointcloud_to_numpy, get_object_cache, spatial_keys, NodeProgress
+
+
+def _sample_surface(vertices, faces, num_samples, rng):
+    """
+    Draw exactly num_samples points uniformly over the surface area.
+    
+    Per-face sample counts are drawn from a multinomial over face areas, which
+    yields face indices already sorted (cache friendly gathers) and exactly
+    num_samples points. Points are placed with uniform barycentric coordinates,
+    all in one vectorized pass.
+    
+    Returns:
+        Tuple of (points float32 [N, 3], face normals float32 [N, 3])
+    """
+    v0 = vertices[faces[:, 0]]
+    e1 = vertices[faces[:, 1]] - v0
+    e2 = vertices[faces[:, 2]] - v0
+    cross = np.cross(e1, e2)
+    double_areas = np.linalg.norm(cross, axis=1)
+    
+    total = double_areas.sum(dtype=np.float64)
+    if total <= 0:
+        raise ValueError("Cannot sample points: mesh has no surface area.")
+    
+    counts = rng.multinomial(num_samples, double_areas / total)
+    face_idx = np.repeat(np.arange(len(faces)), counts)
+    
+    # Gather everything needed per sample in a single indexing pass
+    face_data = np.hstack([v0, e1, e2, cross / np.maximum(double_areas, 1e-30)[:, None]])
+    samples = face_data.astype(np.float32, copy=False)[face_idx]
+    
+    # Uniform barycentric coordinates (sqrt warp avoids clustering at a corner)
+    r1 = np.sqrt(rng.random(num_samples, dtype=np.float32))
+    r2 = rng.random(num_samples, dtype=np.float32)
+    
+    coords = samples[:, 0:3] + (r1 * (1.0 - r2))[:, None] * samples[:, 3:6]
+    coords += (r1 * r2)[:, None] * samples[:, 6:9]
+    
+    return coords, np.ascontiguousarray(samples[:, 9:12])
+
+
+def _vertex_pointcloud(mesh):
+    """Point cloud of the valid vertices of a mesh."""
+    import meshlib.mrmeshnumpy as mrmeshnumpy
+    
+    vertices, _ = mesh_to_numpy(mesh)
+    valid = mrmeshnumpy.getNumpyBitSet(mesh.topology.getValidVerts())[:len(vertices)]
+    
+    return numpy_to_pointcloud(vertices[:len(valid)][valid])
+
+
+def _grid_keys(coords, cell_size, pad=0):
+    """
+    Hash points into integer keys of a regular grid with the given cell size.
+    
+    Args:
+        coords: Array of shape [N, 3]
+        cell_size: Edge length of a grid cell
+        pad: Number of empty cells kept around the occupied range, so keys of
+            neighbouring cells can be computed by adding offsets
+    
+    Returns:
+        Tuple of (keys int64 [N], grid dims int64 [3])
+    """
+    ijk = np.floor((coords - coords.min(axis=0)) / cell_size).astype(np.int64) + pad
+    dims = ijk.max(axis=0) + 1 + pad
+    keys = (ijk[:, 0] * dims[1] + ijk[:, 1]) * dims[2] + ijk[:, 2]
+    return keys, dims
+
+
+def _poisson_disk_select(coords, radius, rng):
+    """
+    Select a subset of coords with no two points closer than radius.
+    
+    Candidates are bucketed in a spatial hash grid whose cells are small enough
+    to hold a single accepted point; one random candidate is kept per cell and
+    conflicts with neighbouring cells are resolved by random priority.
+    
+    Returns:
+        Indices into coords of the selected points
+    """
+    keys, dims = _grid_keys(coords, radius / math.sqrt(3.0), pad=2)
+    
+    # One random candidate per occupied cell (keys come out sorted)
+    order = rng.permutation(len(coords))
+    cell_keys, first = np.unique(keys[order], return_index=True)
+    selected = order[first]
+    points = coords[selected]
+    priority = rng.random(len(selected))
+    keep = np.ones(len(selected), dtype=bool)
+    
+    radius_sq = radius * radius
+    last = len(cell_keys) - 1
+    for di in range(-2, 3):
+        for dj in range(-2, 3):
+            for dk in range(-2, 3):
+                # Each pair of cells is visited once; skip corners that can't be within radius
+                if (di, dj, dk) <= (0, 0, 0) or abs(di) + abs(dj) + abs(dk) == 6:
+                    continue
+                target = cell_keys + (di * dims[1] + dj) * dims[2] + dk
+                nb = np.minimum(np.searchsorted(cell_keys, target), last)
+                idx = np.nonzero(cell_keys[nb] == target)[0]
+                if len(idx) == 0:
+                    continue
+                nb = nb[idx]
+                close = np.sum((points[idx] - points[nb]) ** 2, axis=1) < radius_sq
+                idx, nb = idx[close], nb[close]
+                keep[np.where(priority[idx] < priority[nb], idx, nb)] = False
+    
+    return selected[keep]
+
+
+def _poisson_disk_sample(vertices, faces, num_samples, area, rng):
+    """
+    Blue-noise surface sampling with an exact point count.
+    
+    An oversampled uniform candidate set is thinned with _poisson_disk_select,
+    shrinking the radius until enough points survive.
+    """
+    coords, normals = _sample_surface(vertices, faces, num_samples * 4, rng)
+    
+    # Fraction of the hexagonal packing distance that keeps slightly more than num_samples
+    radius = 0.5 * math.sqrt(2.0 * area / (math.sqrt(3.0) * num_samples))
+    selected = _poisson_disk_select(coords, radius, rng)
+    for _ in range(8):
+        if len(selected) >= num_samples:
+            break
+        radius *= max(0.5, 0.95 * math.sqrt(len(selected) / num_samples))
+        selected = _poisson_disk_select(coords, radius, rng)
+    
+    if len(selected) >= num_samples:
+        selected = rng.choice(selected, num_samples, replace=False)
+    else:
+        # Top up with the remaining candidates to honour the exact count
+        rest = np.setdiff1d(np.arange(len(coords)), selected)
+        extra = rng.choice(rest, num_samples - len(selected), replace=False)
+        selected = np.concatenate([selected, extra])
+    
+    return coords[selected], normals[selected]
+
+
+def _voxel_centroids(coords, normals, voxel_size):
+    """Replace all points falling in the same voxel by their centroid."""
+    keys, _ = _grid_keys(coords, voxel_size)
+    _, inverse, counts = np.unique(keys, return_inverse=True, return_counts=True)
+    
+    def voxel_mean(values):
+        sums = np.stack([np.bincount(inverse, weights=values[:, i], minlength=len(counts)) for i in range(3)], axis=1)
+        return (sums / counts[:, None]).astype(np.float32)
+    
+    centroids = voxel_mean(coords)
+    if normals is None:
+        return centroids, None
+    
+    mean_normals = voxel_mean(normals)
+    mean_normals /= np.maximum(np.linalg.norm(mean_normals, axis=1), 1e-12)[:, None]
+    return centroids, mean_normals
+
+
+def _farthest_point_indices(coords, count, rng, block_size=256):
+    """
+    Greedy farthest point sampling, starting from a random point.
+    
+    A new sample only lowers the distance of points closer to it than the
+    current farthest distance, so each step updates the neighbourhood found
+    by a KD-tree ball query. The maximum is kept per block of points sorted
+    along a Morton curve; a neighbourhood touches few blocks, and the next
+    sample is found by scanning the block maxima instead of every point.
+    """
+    num = len(coords)
+    order = np.argsort(spatial_keys(coords), kind="stable")
+    rank = np.empty(num, dtype=np.int64)
+    rank[order] = np.arange(num)
+    coords = np.ascontiguousarray(coords[order])
+    tree = _kdtree(coords)
+    
+    num_blocks = -(-num // block_size)
+    # Padding past the last point is never the farthest
+    min_dist = np.full(num_blocks * block_size, -1.0, dtype=np.float32)
+    min_dist[:num] = np.inf
+    blocks = min_dist.reshape(num_blocks, block_size)
+    block_max = np.full(num_blocks, np.inf, dtype=np.float32)
+    
+    selected = np.empty(count, dtype=np.int64)
+    current = rank[rng.integers(num)]
+    for i in range(count):
+        selected[i] = current
+        radius = math.sqrt(min_dist[current]) if i else math.inf
+        if math.isinf(radius):
+            near = np.arange(num)
+        else:
+            near = np.asarray(tree.query_ball_point(coords[current], radius, return_sorted=True), dtype=np.int64)
+        dist = np.sum((coords[near] - coords[current]) ** 2, axis=1)
+        min_dist[near] = np.minimum(min_dist[near], dist)
+        
+        touched = near // block_size
+        touched = touched[np.flatnonzero(np.diff(touched, prepend=-1))]
+        block_max[touched] = blocks[touched].max(axis=1)
+        block = int(np.argmax(block_max))
+        current = block * block_size + int(np.argmax(blocks[block]))
+    
+    return order[selected]
+
+
+def _kdtree(coords):
+    """Build a KD-tree over coords (unbalanced build is much faster on large clouds)."""
+    from scipy.spatial import cKDTree
+    
+    return cKDTree(coords, balanced_tree=False, compact_nodes=False)
+
+
+def _knn(tree, coords, k):
+    """
+    k nearest neighbours of every point (excluding itself), queried on all cores.
+    
+    Returns:
+        Tuple of (distances float [N, k], indices int [N, k])
+    """
+    dist, idx = tree.query(coords, k=k + 1, workers=-1)
+    return dist[:, 1:], idx[:, 1:]
+
+
+def _knn_graph(points, coords, k):
+    """
+    kNN graph of a point cloud, cached on the point cloud object.
+    
+    A graph built for a larger k is sliced for smaller requests, so normal
+    estimation, outlier removal and later nodes share a single KD-tree query.
+    
+    Args:
+        points: meshlib.mrmeshpy.PointCloud the graph belongs to
+        coords: Its valid points, as returned by pointcloud_to_numpy
+        k: Number of neighbours (excluding the point itself)
+    
+    Returns:
+        Tuple of (distances float [N, k], indices int [N, k])
+    """
+    cache = get_object_cache(points)
+    graph = cache.get("knn_graph")
+    if graph is None or graph[0] < k or len(graph[1]) != len(coords):
+        dist, idx = _knn(_kdtree(coords), coords, k)
+        graph = (k, dist, idx)
+        cache["knn_graph"] = graph
+    
+    return graph[1][:, :k], graph[2][:, :k]
+
+
+def _pca_normals(coords, idx, mask, chunk_size=65536):
+    """
+    Normals as the smallest principal axis of every neighbourhood.
+    
+    Args:
+        coords: Array of shape [N, 3]
+        idx: Neighbour indices [N, k], the point itself in column 0
+        mask: Boolean [N, k] of neighbours to use
+        chunk_size: Points per chunk; chunks are processed on a thread pool
+    
+    Returns:
+        Unit normals float32 [N, 3]
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    
+    normals = np.empty((len(coords), 3), dtype=np.float32)
+    
+    def solve(start):
+        stop = min(start + chunk_size, len(coords))
+        weights = mask[start:stop, :, None].astype(np.float32)
+        nbrs = coords[idx[start:stop]]
+        mean = (nbrs * weights).sum(axis=1, keepdims=True) / weights.sum(axis=1, keepdims=True)
+        centered = (nbrs - mean) * weights
+        cov = np.einsum("nki,nkj->nij", centered, centered)
+        _, vecs = np.linalg.eigh(cov)
+        normals[start:stop] = vecs[:, :, 0]
+    
+    with ThreadPoolExecutor() as pool:
+        list(pool.map(solve, range(0, len(coords), chunk_size)))
+    
+    return normals
+
+
+def _orient_normals_propagate(coords, normals, idx, mask):
+    """
+    Make normal directions consistent across the kNN graph.
+    
+    Builds a minimum spanning tree weighted by 1 - |n_i . n_j| (so flips are
+    propagated between nearly parallel normals first). Every connected
+    component is rooted at its point farthest from the centroid, whose normal
+    is pointed outwards; signs are then accumulated from the roots by pointer
+    jumping, which needs O(log depth) vectorized passes instead of a traversal.
+    """
+    from scipy.sparse import coo_matrix
+    from scipy.sparse.csgraph import minimum_spanning_tree, connected_components, breadth_first_order
+    
+    n = len(coords)
+    rows = np.broadcast_to(np.arange(n)[:, None], idx.shape)[mask]
+    cols = idx[mask]
+    edges = np.unique(np.minimum(rows, cols).astype(np.int64) * n + np.maximum(rows, cols))
+    rows, cols = edges // n, edges % n
+    keep = rows != cols
+    rows, cols = rows[keep], cols[keep]
+    
+    weights = 1.0 - np.abs(np.sum(normals[rows] * normals[cols], axis=1)) + 1e-6
+    tree = minimum_spanning_tree(coo_matrix((weights, (rows, cols)), shape=(n, n)).tocsr())
+    
+    # Connect one root per component to a virtual node n, then traverse once
+    _, labels = connected_components(tree, directed=False)
+    center = coords.mean(axis=0)
+    outward = coords - center
+    order = np.lexsort((-np.einsum("ij,ij->i", outward, outward), labels))
+    roots = order[np.r_[0, np.nonzero(np.diff(labels[order]))[0] + 1]]
+    
+    tree = tree.tocoo()
+    graph = coo_matrix(
+        (np.r_[tree.data, np.ones(len(roots))], (np.r_[tree.row, roots], np.r_[tree.col, np.full(len(roots), n)])),
+        shape=(n + 1, n + 1),
+    ).tocsr()
+    _, parent = breadth_first_order(graph, n, directed=False, return_predecessors=True)
+    parent[n] = n
+    
+    # Sign of every node relative to its parent; roots relative to the outward direction
+    sign = np.ones(n + 1, dtype=np.int8)
+    is_root = parent[:n] == n
+    reference = np.where(is_root[:, None], outward, normals[np.minimum(parent[:n], n - 1)])
+    sign[:n] = np.where(np.sum(normals * reference, axis=1) < 0, -1, 1)
+    
+    while np.any(parent[:n] != n):
+        sign = sign * sign[parent]
+        parent = parent[parent]
+    
+    return normals * sign[:n, None]
+
+
+def _tile_size_for(coords, tile_points):
+    """Tile edge length giving roughly tile_points points per occupied tile."""
+    extent = coords.max(axis=0) - coords.min(axis=0)
+    size = float(extent.max()) * min(1.0, (tile_points / len(coords)) ** (1.0 / 3.0))
+    
+    # Scans are mostly surfaces: refine assuming points per tile grow with size^2
+    for _ in range(3):
+        keys, _ = _grid_keys(coords, size)
+        mean_points = len(coords) / len(np.unique(keys))
+        size *= min(2.0, max(0.5, math.sqrt(tile_points / mean_points)))
+    
+    return max(size, 1e-6)
+
+
+def _split_tiles(coords, tile_size, overlap):
+    """
+    Assign points to overlapping cubic tiles.
+    
+    Every point belongs to its own tile, and also to the neighbouring tiles
+    whose border it is closer than overlap to.
+    
+    Returns:
+        List of (tile ijk int [3], point indices) pairs
+    """
+    origin = coords.min(axis=0)
+    ijk = np.floor((coords - origin) / tile_size).astype(np.int64)
+    frac = (coords - origin) - ijk * tile_size
+    near_low = frac < overlap
+    near_high = frac > tile_size - overlap
+    
+    point_ids = []
+    tile_ids = []
+    for offset in np.ndindex(3, 3, 3):
+        offset = np.array(offset) - 1
+        select = np.ones(len(coords), dtype=bool)
+        for axis in range(3):
+            if offset[axis] < 0:
+                select &= near_low[:, axis]
+            elif offset[axis] > 0:
+                select &= near_high[:, axis]
+        ids = np.nonzero(select)[0]
+        point_ids.append(ids)
+        tile_ids.append(ijk[ids] + offset)
+    
+    point_ids = np.concatenate(point_ids)
+    tile_ids = np.concatenate(tile_ids)
+    
+    tiles, inverse = np.unique(tile_ids, axis=0, return_inverse=True)
+    inverse = inverse.ravel()
+    order = np.argsort(inverse, kind="stable")
+    groups = np.split(point_ids[order], np.cumsum(np.bincount(inverse, minlength=len(tiles)))[:-1])
+    
+    return list(zip(tiles, groups))
+
+
+def _triangulate_tiled(coords, normals, tile_size, overlap, max_workers, callback=None):
+    """
+    Triangulate a large point cloud tile by tile.
+    
+    Tiles are triangulated concurrently with a bounded worker pool, so only
+    max_workers tiles are in memory at once. Each tile keeps the faces whose
+    centroid lies in its own (non overlapping) cell. Triangulation keeps the
+    input points as vertices, so the trimmed pieces share vertices exactly
+    and are stitched by global point index. callback is passed to every
+    tile's triangulation as its MeshLib ProgressCallback.
+    """
+    import meshlib.mrmeshpy as mrmeshpy
+    import meshlib.mrmeshnumpy as mrmeshnumpy
+    from concurrent.futures import ThreadPoolExecutor
+    
+    origin = coords.min(axis=0)
+    
+    def run_tile(tile):
+        ijk, ids = tile
+        if len(ids) < 3:
+            return None
+        
+        cloud = numpy_to_pointcloud(coords[ids], normals[ids] if normals is not None else None)
+        mesh = mrmeshpy.triangulatePointCloud(cloud, mrmeshpy.TriangulationParameters(), callback)
+        if mesh is None:
+            return None
+        
+        verts, faces = mesh_to_numpy(mesh)
+        cell = np.floor((verts[faces].mean(axis=1) - origin) / tile_size).astype(np.int64)
+        return ids[faces[np.all(cell == ijk, axis=1)]]
+    
+    with ThreadPoolExecutor(max_workers=max_workers or None) as pool:
+        pieces = [faces for faces in pool.map(run_tile, _split_tiles(coords, tile_size, overlap)) if faces is not None]
+    
+    if not pieces:
+        raise ValueError("Triangulation failed: no tile produced any faces.")
+    
+    used, faces = np.unique(np.concatenate(pieces), return_inverse=True)
+    return mrmeshnumpy.meshFromFacesVerts(faces.reshape(-1, 3).astype(np.int32), coords[used])
+
+
+def _fix_mesh_tiled(mesh, voxel_size, tile_size, max_workers):
+    """
+    Tiled equivalent of a zero offset of the whole mesh.
+    
+    The bounding box is covered by a single voxel lattice cut into blocks of
+    about tile_size. Every block is rasterized into its own signed distance
+    volume (winding rule against the full mesh, narrow band only) and
+    converted with marching cubes; neighbouring blocks share one layer of
+    lattice points, so seam vertices coincide and are welded afterwards.
+    Peak memory is one block per worker instead of the whole grid.
+    """
+    import meshlib.mrmeshpy as mrmeshpy
+    import meshlib.mrmeshnumpy as mrmeshnumpy
+    from concurrent.futures import ThreadPoolExecutor
+    
+    verts, _ = mesh_to_numpy(mesh)
+    lattice_origin = verts.min(axis=0) - 2 * voxel_size
+    lattice_dims = np.ceil((verts.max(axis=0) - lattice_origin) / voxel_size).astype(np.int64) + 2
+    block = max(8, int(round(tile_size / voxel_size)))
+    
+    # Blocks containing surface, grown by one block so no crossing is missed
+    occupied = np.unique(np.floor((verts - lattice_origin) / (block * voxel_size)).astype(np.int64), axis=0)
+    blocks = np.unique((occupied[:, None, :] + (np.array(list(np.ndindex(3, 3, 3))) - 1)[None]).reshape(-1, 3), axis=0)
+    blocks = blocks[np.all((blocks >= 0) & (blocks * block < lattice_dims), axis=1)]
+    
+    mesh.getAABBTree()
+    
+    def run_block(ijk):
+        start = ijk * block
+        dims = np.minimum(start + block, lattice_dims) - start + 1
+        origin = lattice_origin + start * voxel_size
+        
+        params = mrmeshpy.MeshToDistanceVolumeParams()
+        params.vol.origin = mrmeshpy.Vector3f(*origin.tolist())
+        params.vol.voxelSize = mrmeshpy.Vector3f(voxel_size, voxel_size, voxel_size)
+        params.vol.dimensions = mrmeshpy.Vector3i(*dims.tolist())
+        params.dist.signMode = mrmeshpy.SignDetectionMode.WindingRule
+        params.dist.maxDistSq = (3 * voxel_size) ** 2
+        params.dist.nullOutsideMinMax = True
+        volume = mrmeshpy.meshToDistanceVolume(mesh, params)
+        
+        mc_params = mrmeshpy.MarchingCubesParams()
+        mc_params.origin = params.vol.origin
+        mc_params.iso = 0.0
+        mc_params.lessInside = True
+        part = mrmeshpy.marchingCubes(volume, mc_params)
+        return mesh_to_numpy(part) if part.topology.numValidFaces() else None
+    
+    with ThreadPoolExecutor(max_workers=max_workers or None) as pool:
+        pieces = [piece for piece in pool.map(run_block, blocks) if piece is not None]
+    
+    if not pieces:
+        raise ValueError("Mesh fixing failed: no surface found in the voxel lattice.")
+    
+    offsets = np.cumsum([0] + [len(verts) for verts, _ in pieces[:-1]])
+    verts = np.concatenate([verts for verts, _ in pieces])
+    faces = np.concatenate([faces + offset for (_, faces), offset in zip(pieces, offsets)])
+    
+    fixed = mrmeshnumpy.meshFromFacesVerts(faces.astype(np.int32), verts)
+    mrmeshpy.uniteCloseVertices(fixed, voxel_size * 1e-3)
+    
+    return fixed
+
+
+def _reduction_info(before, after):
+    """Human readable summary of a point count reduction."""
+    ratio = after / before if before else 1.0
+    factor = before / after if after else float("inf")
+    return ratio, f"Points: {before} -> {after} ({ratio * 100:.1f}% kept, {factor:.2f}x reduction)"
+
 
 class MeshlibTriangulatePointCloud:
     """Convert a point cloud to a mesh via triangulation"""
@@ -24,6 +530,29 @@ class MeshlibTriangulatePointCloud:
                     "max": 50000000,
                     "tooltip": "Voxel count for mesh fixing (if enabled)"
                 }),
+                "tiled": ("BOOLEAN", {
+                    "default": False,
+                    "tooltip": "Triangulate overlapping spatial tiles in parallel and stitch them (bounded memory for very large clouds)"
+                }),
+                "tile_points": ("INT", {
+                    "default": 2000000,
+                    "min": 10000,
+                    "max": 100000000,
+                    "tooltip": "Approximate number of points per tile (tiled mode)"
+                }),
+                "tile_overlap": ("FLOAT", {
+                    "default": 0.05,
+                    "min": 0.0,
+                    "max": 0.45,
+                    "step": 0.01,
+                    "tooltip": "Overlap between neighbouring tiles as a fraction of the tile size (tiled mode)"
+                }),
+                "max_workers": ("INT", {
+                    "default": 4,
+                    "min": 0,
+                    "max": 256,
+                    "tooltip": "Tiles triangulated at the same time; bounds peak memory (0 = one per CPU core)"
+                }),
             }
         }
     
@@ -31,18 +560,58 @@ class MeshlibTriangulatePointCloud:
     RETURN_NAMES = ("mesh",)
     FUNCTION = "process"
     CATEGORY = "Meshlib/PointCloud"
-    DESCRIPTION = "Triangulate a point cloud to create a mesh surface."
+    DESCRIPTION = """Triangulate a point cloud to create a mesh surface.
+In tiled mode the cloud is split into overlapping tiles that are triangulated (and fixed) concurrently, then trimmed and stitched."""
 
-    def process(self, points, fix_mesh=True, voxel_count=5000000):
+    def process(self, points, fix_mesh=True, voxel_count=5000000, tiled=False,
+                tile_points=2000000, tile_overlap=0.05, max_workers=4):
         import meshlib.mrmeshpy as mrmeshpy
         
-        mesh = mrmeshpy.triangulatePointCloud(points)
+        num_points = points.validPoints.count()
+        estimate = estimate_triangulation(num_points)
+        if not tiled and num_points > tile_points and memory_policy() == "auto" and not fits_memory(estimate):
+            print(f"ComfyUI-Meshlib: triangulation of {num_points:,} points exceeds the memory budget, "
+                  f"using tiled mode")
+            tiled = True
+        
+        if tiled:
+            coords, normals = pointcloud_to_numpy(points)
+            if len(coords) > tile_points:
+                check_memory("Tiled triangulation",
+                             estimate_tiled_triangulation(len(coords), tile_points, max_workers or os.cpu_count()))
+                tile_size = _tile_size_for(coords, tile_points)
+                with NodeProgress(2 if fix_mesh else 1) as progress:
+                    mesh = _triangulate_tiled(coords, normals, tile_size, tile_size * tile_overlap, max_workers,
+                                              progress.keep_going)
+                    progress.update()
+                    
+                    if fix_mesh:
+                        progress.check()
+                        # Same resolution the untiled fix would use: voxel_count over the whole box
+                        box_volume = float(np.prod(np.maximum(coords.max(axis=0) - coords.min(axis=0), 1e-12)))
+                        voxel_size = (box_volume / voxel_count) ** (1.0 / 3.0)
+                        mesh = _fix_mesh_tiled(mesh, voxel_size, tile_size, max_workers)
+                        progress.update()
+                
+                return (mesh,)
         
-        if fix_mesh and mesh is not None:
-            # Fix possible issues with offset of 0
-            params = mrmeshpy.OffsetParameters()
-            params.voxelSize = mrmeshpy.suggestVoxelSize(mesh, voxel_count)
-            mesh = mrmeshpy.offsetMesh(mesh, 0.0, params)
+        check_memory("Triangulation", estimate)
+        
+        # Triangulation, then the fix, each take one unit of progress
+        with NodeProgress(2 if fix_mesh else 1) as progress:
+            with reserve_memory(estimate):
+                mesh = mrmeshpy.triangulatePointCloud(points, mrmeshpy.TriangulationParameters(), progress.set)
+            
+            if fix_mesh and mesh is not None:
+                # Fix possible issues with offset of 0
+                area = mesh.area()
+                voxel_count = fit_voxel_count("Triangulation fix",
+                                              lambda count: estimate_offset(mesh, 0.0, count, area), voxel_count)
+                params = mrmeshpy.OffsetParameters()
+                params.voxelSize = mrmeshpy.suggestVoxelSize(mesh, voxel_count)
+                params.callBack = lambda fraction: progress.set(1 + fraction)
+                with reserve_memory(estimate_offset(mesh, 0.0, voxel_count, area)):
+                    mesh = mrmeshpy.offsetMesh(mesh, 0.0, params)
         
         return (mesh,)
 
@@ -59,7 +628,23 @@ class MeshlibPointSampling:
                     "default": 10000,
                     "min": 100,
                     "max": 10000000,
-                    "tooltip": "Approximate number of points to sample"
+                    "tooltip": "Number of points to sample (exact for 'surface', approximate for 'vertices')"
+                }),
+            },
+            "optional": {
+                "method": (["surface", "vertices"], {
+                    "default": "surface",
+                    "tooltip": "surface: area-weighted random points on the triangles. vertices: thin the mesh vertices"
+                }),
+                "seed": ("INT", {
+                    "default": 0,
+                    "min": 0,
+                    "max": 0xffffffffffffffff,
+                    "tooltip": "Random seed for reproducible sampling (surface method)"
+                }),
+                "poisson_disk": ("BOOLEAN", {
+                    "default": False,
+                    "tooltip": "Refine surface samples to a blue-noise (Poisson-disk) distribution"
                 }),
             }
         }
@@ -68,9 +653,23 @@ class MeshlibPointSampling:
     RETURN_NAMES = ("points",)
     FUNCTION = "process"
     CATEGORY = "Meshlib/PointCloud"
-    DESCRIPTION = "Sample points uniformly from a mesh surface."
+    DESCRIPTION = """Sample points from a mesh surface.
+
+- surface: exact number of area-weighted points with face normals, optionally Poisson-disk refined
+- vertices: uniformly thin the existing mesh vertices"""
 
-    def process(self, mesh, num_samples):
+    def process(self, mesh, num_samples, method="surface", seed=0, poisson_disk=False):
+        if method == "surface":
+            vertices, faces = mesh_to_numpy(mesh)
+            rng = np.random.default_rng(seed)
+            
+            if poisson_disk:
+                coords, normals = _poisson_disk_sample(vertices, faces, num_samples, mesh.area(), rng)
+            else:
+                coords, normals = _sample_surface(vertices, faces, num_samples, rng)
+            
+            return (numpy_to_pointcloud(coords, normals),)
+        
         import meshlib.mrmeshpy as mrmeshpy
         
         # Calculate approximate sampling distance based on surface area
@@ -79,7 +678,6 @@ class MeshlibPointSampling:
             # Approximate distance needed for num_samples points
             # Area per point = total_area / num_samples
             # For uniform distribution, distance ~ sqrt(area_per_point)
-            import math
             distance = math.sqrt(area / num_samples)
         else:
             distance = 0.01
@@ -88,7 +686,7 @@ class MeshlibPointSampling:
         settings = mrmeshpy.UniformSamplingSettings()
         settings.distance = distance
         
-        point_cloud = mrmeshpy.pointCloudFromMesh(mesh)
+        point_cloud = _vertex_pointcloud(mesh)
         
         # Uniformly sample
         valid_points = mrmeshpy.pointUniformSampling(point_cloud, settings)
@@ -115,10 +713,230 @@ class MeshlibPointCloudFromMesh:
     FUNCTION = "process"
     CATEGORY = "Meshlib/PointCloud"
     DESCRIPTION = "Convert a mesh to a point cloud (extracts all vertices)."
-
+    
     def process(self, mesh):
-        import meshlib.mrmeshpy as mrmeshpy
-        
-        point_cloud = mrmeshpy.pointCloudFromMesh(mesh)
+        point_cloud = _vertex_pointcloud(mesh)
         
         return (point_cloud,)
+
+
+class MeshlibDownsamplePointCloud:
+    """Reduce the number of points in a point cloud"""
+    
+    @classmethod
+    def INPUT_TYPES(s):
+        return {
+            "required": {
+                "points": ("MESHLIB_POINTCLOUD",),
+                "mode": (["voxel_centroid", "random", "farthest_point"], {
+                    "default": "voxel_centroid",
+                    "tooltip": "voxel_centroid: one averaged point per voxel. random: random subset. farthest_point: evenly spread subset"
+                }),
+            },
+            "optional": {
+                "voxel_size_factor": ("FLOAT", {
+                    "default": 0.005,
+                    "min": 0.0001,
+                    "max": 0.5,
+                    "step": 0.0001,
+                    "tooltip": "Voxel size as a factor of the bounding box diagonal (voxel_centroid mode)"
+                }),
+                "target_points": ("INT", {
+                    "default": 100000,
+                    "min": 1,
+                    "max": 100000000,
+                    "tooltip": "Number of points to keep (random and farthest_point modes)"
+                }),
+                "seed": ("INT", {
+                    "default": 0,
+                    "min": 0,
+                    "max": 0xffffffffffffffff,
+                    "tooltip": "Random seed (random and farthest_point modes)"
+                }),
+            }
+        }
+    
+    RETURN_TYPES = ("MESHLIB_POINTCLOUD", "FLOAT", "STRING")
+    RETURN_NAMES = ("points", "kept_ratio", "info")
+    FUNCTION = "process"
+    CATEGORY = "Meshlib/PointCloud"
+    DESCRIPTION = """Downsample a point cloud before triangulation or alignment.
+
+- voxel_centroid: hash points into a voxel grid and keep each voxel's centroid
+- random: keep a random subset of target_points
+- farthest_point: keep target_points spread as evenly as possible (slowest, candidates are pre-thinned to 8x the target)"""
+
+    def process(self, points, mode, voxel_size_factor=0.005, target_points=100000, seed=0):
+        coords, normals = pointcloud_to_numpy(points)
+        before = len(coords)
+        rng = np.random.default_rng(seed)
+        
+        if mode == "voxel_centroid":
+            diagonal = float(np.linalg.norm(coords.max(axis=0) - coords.min(axis=0))) if before else 0.0
+            if diagonal > 0:
+                coords, normals = _voxel_centroids(coords, normals, diagonal * voxel_size_factor)
+        elif target_points < before:
+            if mode == "random":
+                keep = np.sort(rng.choice(before, target_points, replace=False))
+            else:
+                candidates = np.arange(before)
+                if before > 8 * target_points:
+                    candidates = np.sort(rng.choice(before, 8 * target_points, replace=False))
+                keep = candidates[_farthest_point_indices(coords[candidates], target_points, rng)]
+            coords = coords[keep]
+            normals = normals[keep] if normals is not None else None
+        
+        ratio, info = _reduction_info(before, len(coords))
+        
+        return (numpy_to_pointcloud(coords, normals), ratio, info)
+
+
+class MeshlibRemoveOutliers:
+    """Remove isolated points from a point cloud"""
+    
+    @classmethod
+    def INPUT_TYPES(s):
+        return {
+            "required": {
+                "points": ("MESHLIB_POINTCLOUD",),
+                "mode": (["statistical", "radius"], {
+                    "default": "statistical",
+                    "tooltip": "statistical: mean kNN distance test. radius: minimum neighbour count within a radius"
+                }),
+            },
+            "optional": {
+                "nb_neighbors": ("INT", {
+                    "default": 16,
+                    "min": 1,
+                    "max": 256,
+                    "tooltip": "Number of neighbours used for the mean distance (statistical mode)"
+                }),
+                "std_ratio": ("FLOAT", {
+                    "default": 2.0,
+                    "min": 0.0,
+                    "max": 10.0,
+                    "step": 0.1,
+                    "tooltip": "Points whose mean neighbour distance exceeds mean + std_ratio * std are removed (statistical mode)"
+                }),
+                "radius_factor": ("FLOAT", {
+                    "default": 5.0,
+                    "min": 0.1,
+                    "max": 100.0,
+                    "step": 0.1,
+                    "tooltip": "Search radius as a multiple of the median nearest-neighbour spacing (radius mode)"
+                }),
+                "min_neighbors": ("INT", {
+                    "default": 4,
+                    "min": 1,
+                    "max": 1000,
+                    "tooltip": "Minimum number of neighbours within the radius to keep a point (radius mode)"
+                }),
+            }
+        }
+    
+    RETURN_TYPES = ("MESHLIB_POINTCLOUD", "FLOAT", "STRING")
+    RETURN_NAMES = ("points", "kept_ratio", "info")
+    FUNCTION = "process"
+    CATEGORY = "Meshlib/PointCloud"
+    DESCRIPTION = """Remove outliers from a point cloud using a parallel KD-tree search.
+
+- statistical: remove points whose mean distance to their nearest neighbours is unusually large
+- radius: remove points with too few neighbours within a radius"""
+
+    def process(self, points, mode, nb_neighbors=16, std_ratio=2.0, radius_factor=5.0, min_neighbors=4):
+        coords, normals = pointcloud_to_numpy(points)
+        before = len(coords)
+        
+        if before <= nb_neighbors:
+            ratio, info = _reduction_info(before, before)
+            return (points, ratio, info)
+        
+        if mode == "statistical":
+            dist, _ = _knn_graph(points, coords, nb_neighbors)
+            mean_dist = dist.mean(axis=1)
+            keep = mean_dist <= mean_dist.mean() + std_ratio * mean_dist.std()
+        else:
+            tree = _kdtree(coords)
+            
+            # Estimate the typical spacing on a subset so the radius adapts to the density
+            sample = coords[np.random.default_rng(0).choice(before, min(before, 10000), replace=False)]
+            spacing = float(np.median(tree.query(sample, k=2, workers=-1)[0][:, 1]))
+            # Counts include the point itself
+            counts = tree.query_ball_point(coords, spacing * radius_factor, workers=-1, return_length=True)
+            keep = counts > min_neighbors
+        
+        coords = coords[keep]
+        normals = normals[keep] if normals is not None else None
+        ratio, info = _reduction_info(before, len(coords))
+        
+        return (numpy_to_pointcloud(coords, normals), ratio, info)
+
+
+class MeshlibEstimateNormals:
+    """Estimate consistently oriented normals for a point cloud"""
+    
+    @classmethod
+    def INPUT_TYPES(s):
+        return {
+            "required": {
+                "points": ("MESHLIB_POINTCLOUD",),
+                "k": ("INT", {
+                    "default": 16,
+                    "min": 3,
+                    "max": 256,
+                    "tooltip": "Number of nearest neighbours used for each normal"
+                }),
+            },
+            "optional": {
+                "radius_factor": ("FLOAT", {
+                    "default": 0.0,
+                    "min": 0.0,
+                    "max": 100.0,
+                    "step": 0.1,
+                    "tooltip": "Ignore neighbours farther than this multiple of the median nearest-neighbour spacing (0 = disabled)"
+                }),
+                "orientation": (["propagate", "outward", "existing", "none"], {
+                    "default": "propagate",
+                    "tooltip": "propagate: consistent flips along a minimum spanning tree. outward: away from the centroid. existing: agree with the input normals"
+                }),
+            }
+        }
+    
+    RETURN_TYPES = ("MESHLIB_POINTCLOUD",)
+    RETURN_NAMES = ("points",)
+    FUNCTION = "process"
+    CATEGORY = "Meshlib/PointCloud"
+    DESCRIPTION = """Estimate point normals by PCA over the k nearest neighbours.
+The kNN graph is built once and kept with the point cloud, so later point cloud nodes (e.g. outlier removal) reuse it."""
+
+    def process(self, points, k, radius_factor=0.0, orientation="propagate"):
+        coords, old_normals = pointcloud_to_numpy(points)
+        if len(coords) <= k:
+            raise ValueError(f"Point cloud has {len(coords)} points, need more than k={k} to estimate normals.")
+        
+        dist, nbrs = _knn_graph(points, coords, k)
+        
+        # Each point is part of its own neighbourhood
+        idx = np.concatenate([np.arange(len(coords))[:, None], nbrs], axis=1)
+        mask = np.ones(idx.shape, dtype=bool)
+        if radius_factor > 0:
+            radius = radius_factor * float(np.median(dist[:, 0]))
+            mask[:, 1:] = dist <= radius
+        
+        normals = _pca_normals(coords, idx, mask)
+        
+        if orientation == "propagate":
+            normals = _orient_normals_propagate(coords, normals, idx, mask)
+        elif orientation == "outward":
+            flip = np.sum(normals * (coords - coords.mean(axis=0)), axis=1) < 0
+            normals[flip] *= -1
+        elif orientation == "existing" and old_normals is not None:
+            flip = np.sum(normals * old_normals, axis=1) < 0
+            normals[flip] *= -1
+        
+        result = numpy_to_pointcloud(coords, normals)
+        
+        # Same points in the same order: hand the kNN graph over to the output
+        get_object_cache(result)["knn_graph"] = get_object_cache(points)["knn_graph"]
+        
+        return (result,)
@@ -3,6 +3,53 @@ Primitive Nodes for ComfyUI-Meshlib
 Creates basic mesh primitives
 """
 
+import threading
+from collections import OrderedDict
+
+
+# Number of generated primitives kept in memory
+PRIMITIVE_CACHE_SIZE = 32
+
+_primitive_cache = OrderedDict()
+_primitive_cache_lock = threading.Lock()
+
+
+def _primitive_key(kind, params):
+    """Cache key of a primitive: its type and its sorted parameters."""
+    return (kind,) + tuple(sorted(params.items()))
+
+
+def _cached_primitive(kind, params, build):
+    """
+    Return a generated primitive, building it only on the first request.
+    
+    Primitives are deterministic, so one instance per parameter set is kept
+    (LRU evicted) and every request gets a copy of it: copying is an order of
+    magnitude faster than generating, and nothing downstream can change the
+    cached mesh.
+    
+    Args:
+        kind: Primitive type name
+        params: Dict of generation parameters
+        build: Callable creating the mesh on a cache miss
+        
+    Returns:
+        meshlib.mrmeshpy.Mesh object
+    """
+    import meshlib.mrmeshpy as mrmeshpy
+    
+    key = _primitive_key(kind, params)
+    
+    with _primitive_cache_lock:
+        mesh = _primitive_cache.pop(key, None)
+        if mesh is None:
+            mesh = build()
+        _primitive_cache[key] = mesh
+        while len(_primitive_cache) > PRIMITIVE_CACHE_SIZE:
+            _primitive_cache.popitem(last=False)
+    
+    return mrmeshpy.copyMesh(mesh)
+
 
 class MeshlibMakeSphere:
     """Create a UV sphere primitive"""
@@ -42,7 +89,11 @@ class MeshlibMakeSphere:
     def process(self, radius, horizontal_resolution, vertical_resolution):
         import meshlib.mrmeshpy as mrmeshpy
         
-        mesh = mrmeshpy.makeUVSphere(radius, horizontal_resolution, vertical_resolution)
+        mesh = _cached_primitive(
+            "sphere",
+            {"radius": radius, "horizontal_resolution": horizontal_resolution, "vertical_resolution": vertical_resolution},
+            lambda: mrmeshpy.makeUVSphere(radius, horizontal_resolution, vertical_resolution),
+        )
         return (mesh,)
 
 
@@ -97,7 +148,11 @@ class MeshlibMakeCube:
         else:
             base = mrmeshpy.Vector3f(0, 0, 0)
         
-        mesh = mrmeshpy.makeCube(size, base)
+        mesh = _cached_primitive(
+            "cube",
+            {"size_x": size_x, "size_y": size_y, "size_z": size_z, "center": center},
+            lambda: mrmeshpy.makeCube(size, base),
+        )
         return (mesh,)
 
 
@@ -146,7 +201,12 @@ class MeshlibMakeTorus:
     def process(self, primary_radius, secondary_radius, primary_resolution, secondary_resolution):
         import meshlib.mrmeshpy as mrmeshpy
         
-        mesh = mrmeshpy.makeTorus(primary_radius, secondary_radius, primary_resolution, secondary_resolution)
+        mesh = _cached_primitive(
+            "torus",
+            {"primary_radius": primary_radius, "secondary_radius": secondary_radius,
+             "primary_resolution": primary_resolution, "secondary_resolution": secondary_resolution},
+            lambda: mrmeshpy.makeTorus(primary_radius, secondary_radius, primary_resolution, secondary_resolution),
+        )
         return (mesh,)
 
 
@@ -189,5 +249,9 @@ class MeshlibMakeCylinder:
     def process(self, radius, length, resolution):
         import meshlib.mrmeshpy as mrmeshpy
         
-        mesh = mrmeshpy.makeCylinder(radius, length, resolution)
+        mesh = _cached_primitive(
+            "cylinder",
+            {"radius": radius, "length": length, "resolution": resolution},
+            lambda: mrmeshpy.makeCylinder(radius, length, resolution),
+        )
         return (mesh,)
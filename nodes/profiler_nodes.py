@@ -0,0 +1,54 @@
+"""
+Profiler Nodes for ComfyUI-Meshlib
+Report the per-node timings collected by the profiler
+"""
+
+from ..profiler import profiling_enabled, current_prompt_id, get_records, format_report, reset as reset_stats
+
+
+class MeshlibProfilerReport:
+    """Print aggregated profiling stats of the Meshlib nodes"""
+    
+    @classmethod
+    def INPUT_TYPES(s):
+        return {
+            "required": {
+                "scope": (["current_prompt", "all"], {
+                    "default": "current_prompt",
+                    "tooltip": "Report the calls of the running prompt or every call since start"
+                }),
+                "reset": ("BOOLEAN", {
+                    "default": False,
+                    "tooltip": "Clear the collected stats after reporting"
+                }),
+            },
+            "optional": {
+                "mesh": ("MESHLIB_MESH", {
+                    "tooltip": "Connect the last mesh of the workflow so the report runs after the nodes it measures"
+                }),
+            }
+        }
+    
+    @classmethod
+    def IS_CHANGED(s, **kwargs):
+        # Stats change with every prompt
+        return float("nan")
+    
+    RETURN_TYPES = ("STRING",)
+    RETURN_NAMES = ("report",)
+    OUTPUT_NODE = True
+    FUNCTION = "process"
+    CATEGORY = "Meshlib/Utils"
+    DESCRIPTION = """Aggregated wall / CPU time, peak memory growth, face counts and copies per Meshlib node.
+Requires the MESHLIB_PROFILE=1 environment variable."""
+
+    def process(self, scope, reset, mesh=None):
+        if not profiling_enabled():
+            report = "Profiling is disabled. Set MESHLIB_PROFILE=1 and restart ComfyUI."
+        else:
+            records = get_records(current_prompt_id() if scope == "current_prompt" else None)
+            report = format_report(records)
+            if reset:
+                reset_stats()
+        
+        return {"ui": {"text": [report]}, "result": (report,)}
@@ -3,8 +3,7 @@ Repair Nodes for ComfyUI-Meshlib
 Mesh repair operations: fill holes, stitch holes, fix degeneracies, find self-intersections
 """
 
-from tqdm import tqdm
-from comfy.utils import ProgressBar
+from ..utils import map_batch, report_skipped, topology_summary, NodeProgress
 
 
 class MeshlibFillHoles:
@@ -16,36 +15,52 @@ class MeshlibFillHoles:
             "required": {
                 "mesh": ("MESHLIB_MESH",),
             },
+            "optional": {
+                "max_workers": ("INT", {
+                    "default": 4,
+                    "min": 1,
+                    "max": 64,
+                    "tooltip": "Maximum number of list items processed concurrently"
+                }),
+            }
         }
     
+    INPUT_IS_LIST = True
     RETURN_TYPES = ("MESHLIB_MESH", "INT")
     RETURN_NAMES = ("mesh", "holes_filled")
+    OUTPUT_IS_LIST = (True, True)
     FUNCTION = "process"
+    ITEM_FUNCTION = "process_item"
     CATEGORY = "Meshlib/Repair"
     DESCRIPTION = "Fill all holes in a mesh using optimal triangulation."
-
-    def process(self, mesh):
+    
+    def process(self, mesh, max_workers=(4,)):
+        inputs = dict(mesh=mesh)
+        return map_batch(self.process_item, inputs, len(self.RETURN_TYPES), max_workers[0])
+    
+    def process_item(self, mesh):
         import meshlib.mrmeshpy as mrmeshpy
         
+        if topology_summary(mesh).closed:
+            report_skipped("Fill Holes", "mesh is closed")
+            return (mesh, 0)
+        
         mesh = mrmeshpy.copyMesh(mesh)
         
         hole_edges = mesh.topology.findHoleRepresentiveEdges()
         holes_filled = 0
         
         nb_holes = len(hole_edges)
-        print(f"{nb_holes} holes found")
         
         if nb_holes>0:
-            progress_bar = tqdm(total=nb_holes,desc="Filling holes")
-            pbar = ProgressBar(nb_holes)
-            
-            for e in hole_edges:
-                params = mrmeshpy.FillHoleParams()
-                params.metric = mrmeshpy.getUniversalMetric(mesh)
-                mrmeshpy.fillHole(mesh, e, params)
-                holes_filled += 1
-                progress_bar.update(1)
-                pbar.update(1)
+            with NodeProgress(nb_holes) as progress:
+                for e in hole_edges:
+                    params = mrmeshpy.FillHoleParams()
+                    params.metric = mrmeshpy.getUniversalMetric(mesh)
+                    mrmeshpy.fillHole(mesh, e, params)
+                    holes_filled += 1
+                    if not progress.update():
+                        break
         
         return (mesh, holes_filled)
 
@@ -76,7 +91,7 @@ class MeshlibStitchHoles:
     FUNCTION = "process"
     CATEGORY = "Meshlib/Repair"
     DESCRIPTION = "Stitch two holes together creating a tunnel between them."
-
+    
     def process(self, mesh, hole_index_a, hole_index_b):
         import meshlib.mrmeshpy as mrmeshpy
         
@@ -129,16 +144,19 @@ class MeshlibFixDegeneracies:
     FUNCTION = "process"
     CATEGORY = "Meshlib/Repair"
     DESCRIPTION = "Fix mesh degeneracies including degenerate triangles, tiny edges, and duplicate vertices."
-
+    
     def process(self, mesh, max_deviation_factor, tiny_edge_length):
         import meshlib.mrmeshpy as mrmeshpy
         
-        mesh = mrmeshpy.copyMesh(mesh)
-        
         params = mrmeshpy.FixMeshDegeneraciesParams()
         params.maxDeviation = max_deviation_factor * mesh.computeBoundingBox().diagonal()
         params.tinyEdgeLength = tiny_edge_length
         
+        if topology_summary(mesh).degeneracies(tiny_edge_length, params.criticalTriAspectRatio) == 0:
+            report_skipped("Fix Degeneracies", "no degenerate faces or tiny edges")
+            return (mesh,)
+        
+        mesh = mrmeshpy.copyMesh(mesh)
         mrmeshpy.fixMeshDegeneracies(mesh, params)
         
         return (mesh,)
@@ -160,7 +178,7 @@ class MeshlibFindSelfIntersections:
     FUNCTION = "process"
     CATEGORY = "Meshlib/Repair"
     DESCRIPTION = "Find self-intersecting triangles in a mesh. Returns the count of intersecting faces."
-
+    
     def process(self, mesh):
         import meshlib.mrmeshpy as mrmeshpy
         
@@ -0,0 +1,87 @@
+"""
+Settings Nodes for ComfyUI-Meshlib
+Process-wide settings of the MeshLib runtime
+"""
+
+import os
+
+from ..memory_budget import MEMORY_POLICIES, format_bytes, memory_budget, set_memory_budget
+from ..thread_control import set_thread_limit, active_thread_limit
+
+
+class MeshlibThreadSettings:
+    """Limit the number of native threads used by MeshLib"""
+    
+    @classmethod
+    def INPUT_TYPES(s):
+        return {
+            "required": {
+                "max_threads": ("INT", {
+                    "default": 0,
+                    "min": 0,
+                    "max": 1024,
+                    "tooltip": "Maximum number of threads used by MeshLib algorithms (0 = all cores)"
+                }),
+            }
+        }
+    
+    RETURN_TYPES = ("STRING",)
+    RETURN_NAMES = ("info",)
+    OUTPUT_NODE = True
+    FUNCTION = "process"
+    CATEGORY = "Meshlib/Utils"
+    DESCRIPTION = """Set the process-wide limit of MeshLib's native (TBB) threads, e.g. to leave cores to PyTorch.
+The setting stays in effect for later prompts; the MESHLIB_NUM_THREADS environment variable sets it at startup.
+Heavy nodes also have a max_threads input that lowers the limit while they run."""
+
+    def process(self, max_threads):
+        set_thread_limit(max_threads)
+        
+        active = active_thread_limit()
+        if active is None:
+            info = "TBB library not found; thread limit ignored"
+        else:
+            info = f"MeshLib threads: {active} of {os.cpu_count()} cores"
+        
+        return {"ui": {"text": [info]}, "result": (info,)}
+
+
+class MeshlibMemorySettings:
+    """Set the memory budget checked before heavy MeshLib jobs"""
+    
+    @classmethod
+    def INPUT_TYPES(s):
+        return {
+            "required": {
+                "budget_mb": ("INT", {
+                    "default": -1,
+                    "min": -1,
+                    "max": 16777216,
+                    "tooltip": "Memory budget in MiB (-1 = MESHLIB_MEMORY_BUDGET_MB, or 80% of the available memory; 0 = no checks)"
+                }),
+                "policy": (list(MEMORY_POLICIES), {
+                    "default": "auto",
+                    "tooltip": "auto: tile or lower the voxel count to fit; reduce: only lower the voxel count; fail: raise an error"
+                }),
+            }
+        }
+    
+    RETURN_TYPES = ("STRING",)
+    RETURN_NAMES = ("info",)
+    OUTPUT_NODE = True
+    FUNCTION = "process"
+    CATEGORY = "Meshlib/Utils"
+    DESCRIPTION = """Set the process-wide memory budget of Offset, Triangulate, Boolean and Decimate.
+Before running, these nodes estimate their peak memory; jobs over the budget are tiled, run at a lower voxel count or fail with a clear message, depending on the policy.
+The setting stays in effect for later prompts; MESHLIB_MEMORY_BUDGET_MB and MESHLIB_MEMORY_POLICY set it at startup."""
+
+    def process(self, budget_mb, policy):
+        set_memory_budget(None if budget_mb < 0 else budget_mb, policy)
+        
+        budget = memory_budget()
+        if budget is None:
+            info = "Memory checks disabled"
+        else:
+            info = f"Memory budget: {format_bytes(budget)} ({policy})"
+        
+        return {"ui": {"text": [info]}, "result": (info,)}
@@ -0,0 +1,329 @@
+"""
+Per-node profiling for ComfyUI-Meshlib
+
+Opt-in instrumentation of every node's FUNCTION. Each call records wall and
+CPU time, the peak resident memory growth, the vertex / face counts of the
+input and output meshes (and point counts of point clouds) and the number of
+copies made (output meshes / point clouds that are new objects).
+
+Enable it with MESHLIB_PROFILE=1. When disabled, nothing is wrapped, so the
+nodes run exactly as without this module.
+
+Records are kept in memory (for the Profiler Report node), appended as JSON
+lines to the file named by MESHLIB_PROFILE_LOG when set, and aggregated on a
+Prometheus text endpoint at /meshlib/metrics when the ComfyUI server is
+available.
+"""
+
+import collections
+import inspect
+import json
+import os
+import threading
+import time
+from multiprocessing import parent_process
+
+from .utils import wrap_node_function
+
+
+# Number of call records kept in memory
+MAX_RECORDS = 10000
+
+# Nodes that are not profiled
+EXCLUDED_NODES = ("MeshlibProfilerReport",)
+
+_records = collections.deque(maxlen=MAX_RECORDS)
+_totals = {}
+_lock = threading.Lock()
+
+
+def profiling_enabled():
+    """Whether MESHLIB_PROFILE is set."""
+    return os.environ.get("MESHLIB_PROFILE", "0") not in ("", "0", "false", "False")
+
+
+def current_rss():
+    """Resident set size of this process in bytes, or None when unavailable."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+class PeakRSS:
+    """
+    Sample the resident set size in a background thread.
+    
+    Use it as a context manager, or call start() and stop(). Afterwards, peak
+    holds the highest RSS seen minus the RSS at the start, in bytes (None
+    where /proc is not available). The benchmarks measure with it as well.
+    """
+    
+    def __init__(self, interval=0.01):
+        self.interval = interval
+        self.peak = None
+        self._start = None
+        self._thread = None
+        self._stop = threading.Event()
+    
+    def _sample(self):
+        while not self._stop.wait(self.interval):
+            self._highest = max(self._highest, current_rss())
+    
+    def start(self):
+        self._start = current_rss()
+        if self._start is not None:
+            self._highest = self._start
+            self._thread = threading.Thread(target=self._sample, daemon=True)
+            self._thread.start()
+        return self
+    
+    def stop(self):
+        """Stop sampling; returns peak."""
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+            self.peak = max(self._highest, current_rss()) - self._start
+        return self.peak
+    
+    def __enter__(self):
+        return self.start()
+    
+    def __exit__(self, *exc_info):
+        self.stop()
+        return False
+
+
+def _geometry(value, objects):
+    """Collect the meshes and point clouds of a (nested) value into objects."""
+    import meshlib.mrmeshpy as mrmeshpy
+    
+    if isinstance(value, (mrmeshpy.Mesh, mrmeshpy.PointCloud)):
+        objects.append(value)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            _geometry(item, objects)
+    elif isinstance(value, dict):
+        for item in value.values():
+            _geometry(item, objects)
+    
+    return objects
+
+
+def _counts(objects):
+    import meshlib.mrmeshpy as mrmeshpy
+    
+    counts = {"meshes": 0, "vertices": 0, "faces": 0, "points": 0}
+    for obj in objects:
+        if isinstance(obj, mrmeshpy.Mesh):
+            counts["meshes"] += 1
+            counts["vertices"] += obj.topology.numValidVerts()
+            counts["faces"] += obj.topology.numValidFaces()
+        else:
+            counts["points"] += obj.validPoints.count()
+    
+    return counts
+
+
+def current_prompt_id():
+    """Id of the prompt being executed, when running inside the ComfyUI server."""
+    try:
+        from server import PromptServer
+    except ImportError:
+        return None
+    
+    return getattr(getattr(PromptServer, "instance", None), "last_prompt_id", None)
+
+
+class _Call:
+    """Measurements of one node call."""
+    
+    def __init__(self, node_name, args, kwargs):
+        self.node_name = node_name
+        self.inputs = _geometry([args, kwargs], [])
+        self.prompt_id = current_prompt_id()
+        self.rss = PeakRSS().start()
+        self.cpu = time.process_time()
+        self.wall = time.perf_counter()
+    
+    def finish(self, result, error=None):
+        wall = time.perf_counter() - self.wall
+        cpu = time.process_time() - self.cpu
+        peak = self.rss.stop()
+        
+        outputs = _geometry(result, []) if error is None else []
+        input_ids = {id(obj) for obj in self.inputs}
+        record = {
+            "time": time.time(),
+            "prompt_id": self.prompt_id,
+            "node": self.node_name,
+            "wall_s": wall,
+            "cpu_s": cpu,
+            "peak_rss_delta_bytes": peak,
+            "inputs": _counts(self.inputs),
+            "outputs": _counts(outputs),
+            "copies": sum(id(obj) not in input_ids for obj in outputs),
+            "error": error,
+        }
+        _record(record)
+
+
+def _record(record):
+    with _lock:
+        _records.append(record)
+        totals = _totals.setdefault(record["node"], {
+            "calls": 0, "errors": 0, "wall_s": 0.0, "cpu_s": 0.0, "peak_rss_bytes": 0, "copies": 0,
+        })
+        totals["calls"] += 1
+        totals["errors"] += record["error"] is not None
+        totals["wall_s"] += record["wall_s"]
+        totals["cpu_s"] += record["cpu_s"]
+        totals["peak_rss_bytes"] = max(totals["peak_rss_bytes"], record["peak_rss_delta_bytes"] or 0)
+        totals["copies"] += record["copies"]
+    
+    path = os.environ.get("MESHLIB_PROFILE_LOG")
+    if path:
+        with _lock, open(path, "a") as f:
+            f.write(json.dumps(record) + "\n")
+
+
+def get_records(prompt_id=None):
+    """Recorded calls, optionally only those of one prompt."""
+    with _lock:
+        records = list(_records)
+    
+    if prompt_id is not None:
+        records = [record for record in records if record["prompt_id"] == prompt_id]
+    return records
+
+
+def reset():
+    """Forget all recorded calls and totals."""
+    with _lock:
+        _records.clear()
+        _totals.clear()
+
+
+def aggregate(records):
+    """
+    Per-node summary of call records.
+    
+    Returns:
+        Dict node -> {calls, wall_s, cpu_s, peak_rss_bytes, faces_in, faces_out, copies}, slowest first
+    """
+    stats = {}
+    for record in records:
+        entry = stats.setdefault(record["node"], {
+            "calls": 0, "wall_s": 0.0, "cpu_s": 0.0, "peak_rss_bytes": 0, "faces_in": 0, "faces_out": 0, "copies": 0,
+        })
+        entry["calls"] += 1
+        entry["wall_s"] += record["wall_s"]
+        entry["cpu_s"] += record["cpu_s"]
+        entry["peak_rss_bytes"] = max(entry["peak_rss_bytes"], record["peak_rss_delta_bytes"] or 0)
+        entry["faces_in"] += record["inputs"]["faces"]
+        entry["faces_out"] += record["outputs"]["faces"]
+        entry["copies"] += record["copies"]
+    
+    return dict(sorted(stats.items(), key=lambda item: item[1]["wall_s"], reverse=True))
+
+
+def format_report(records):
+    """Human readable table of aggregate(records)."""
+    if not records:
+        return "No profiled Meshlib node calls."
+    
+    lines = [f"{'node':<30} {'calls':>5} {'wall s':>9} {'cpu s':>9} {'peak MB':>9} {'faces in':>11} {'faces out':>11} {'copies':>6}"]
+    for node_name, entry in aggregate(records).items():
+        lines.append(f"{node_name:<30} {entry['calls']:>5} {entry['wall_s']:>9.3f} {entry['cpu_s']:>9.3f} "
+                     f"{entry['peak_rss_bytes'] / 2 ** 20:>9.1f} {entry['faces_in']:>11} {entry['faces_out']:>11} "
+                     f"{entry['copies']:>6}")
+    total_wall = sum(record["wall_s"] for record in records)
+    lines.append(f"{len(records)} calls, {total_wall:.3f}s wall")
+    
+    return "\n".join(lines)
+
+
+def prometheus_metrics():
+    """Totals since start (or the last reset) in the Prometheus text format."""
+    with _lock:
+        totals = {node_name: dict(entry) for node_name, entry in _totals.items()}
+    
+    metrics = (
+        ("meshlib_node_calls_total", "counter", "Number of node calls", "calls"),
+        ("meshlib_node_errors_total", "counter", "Number of node calls that raised", "errors"),
+        ("meshlib_node_wall_seconds_total", "counter", "Wall time spent in the node", "wall_s"),
+        ("meshlib_node_cpu_seconds_total", "counter", "Process CPU time spent in the node", "cpu_s"),
+        ("meshlib_node_copies_total", "counter", "New meshes and point clouds returned by the node", "copies"),
+        ("meshlib_node_peak_rss_bytes", "gauge", "Largest resident memory growth of one call", "peak_rss_bytes"),
+    )
+    lines = []
+    for name, kind, description, field in metrics:
+        lines.append(f"# HELP {name} {description}")
+        lines.append(f"# TYPE {name} {kind}")
+        for node_name, entry in sorted(totals.items()):
+            lines.append(f'{name}{{node="{node_name}"}} {entry[field]}')
+    
+    return "\n".join(lines) + "\n"
+
+
+def _register_metrics_route():
+    """Serve prometheus_metrics() at /meshlib/metrics on the ComfyUI server, when there is one."""
+    try:
+        from aiohttp import web
+        from server import PromptServer
+    except ImportError:
+        return
+    
+    if getattr(PromptServer, "instance", None) is None:
+        return
+    
+    @PromptServer.instance.routes.get("/meshlib/metrics")
+    async def metrics(request):
+        return web.Response(text=prometheus_metrics(), content_type="text/plain")
+
+
+def _profiled(node_name):
+    def wrapper(function):
+        if inspect.iscoroutinefunction(function):
+            async def profiled(self, *args, **kwargs):
+                call = _Call(node_name, args, kwargs)
+                try:
+                    result = await function(self, *args, **kwargs)
+                except Exception as e:
+                    call.finish(None, f"{type(e).__name__}: {e}")
+                    raise
+                call.finish(result)
+                return result
+        else:
+            def profiled(self, *args, **kwargs):
+                call = _Call(node_name, args, kwargs)
+                try:
+                    result = function(self, *args, **kwargs)
+                except Exception as e:
+                    call.finish(None, f"{type(e).__name__}: {e}")
+                    raise
+                call.finish(result)
+                return result
+        
+        return profiled
+    
+    return wrapper
+
+
+def install_profiler(node_class_mappings):
+    """
+    Wrap the FUNCTION of every node with the profiler when MESHLIB_PROFILE is set.
+    
+    Args:
+        node_class_mappings: NODE_CLASS_MAPPINGS dict
+    """
+    if not profiling_enabled() or parent_process() is not None:
+        return
+    
+    for node_name, node_class in node_class_mappings.items():
+        if node_name not in EXCLUDED_NODES:
+            wrap_node_function(node_class, _profiled(node_name))
+    
+    _register_metrics_route()
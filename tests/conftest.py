@@ -0,0 +1,25 @@
+"""
+Shared fixtures: the node package loaded the way ComfyUI loads it.
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"))
+
+from common import load_package  # noqa: E402
+
+# Imported before collection, which also imports the package's __init__.py
+PACKAGE = load_package()
+
+
+@pytest.fixture(scope="session")
+def package():
+    return PACKAGE
+
+
+@pytest.fixture(scope="session")
+def nodes(package):
+    return package.nodes.NODE_CLASS_MAPPINGS
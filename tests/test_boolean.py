@@ -0,0 +1,43 @@
+import sys
+
+import meshlib.mrmeshpy as mrmeshpy
+import pytest
+
+
+def _operands():
+    first = mrmeshpy.makeTorus(1.0, 0.3, 32, 16)
+    second = mrmeshpy.makeTorus(1.0, 0.3, 32, 16)
+    second.transform(mrmeshpy.AffineXf3f.translation(mrmeshpy.Vector3f(0.5, 0.0, 0.0)))
+    return [first, second]
+
+
+def _fail_exact(package, monkeypatch, fail_voxel=False):
+    boolean_nodes = sys.modules[f"{package.__name__}.nodes.boolean_nodes"]
+    run_boolean = boolean_nodes._run_boolean
+    
+    def failing(mesh_a, mesh_b, operation, mode="exact", *args):
+        if mode == "exact" or fail_voxel:
+            raise ValueError("Boolean operation failed: test")
+        return run_boolean(mesh_a, mesh_b, operation, mode, *args)
+    
+    monkeypatch.setattr(boolean_nodes, "_run_boolean", failing)
+
+
+def test_failed_union_is_retried_as_voxel(package, nodes, monkeypatch):
+    _fail_exact(package, monkeypatch)
+    
+    mesh, info = nodes["MeshlibBooleanMany"]().process(_operands(), ["Union"], [False], [1], mode=["exact"],
+                                                       voxel_count=[100000])
+    
+    assert "used voxel boolean" in info
+    assert "1 failed" in info
+    assert mesh.topology.numValidFaces() > 0
+    assert mesh.topology.findNumHoles() == 0
+
+
+def test_failed_voxel_retry_raises(package, nodes, monkeypatch):
+    _fail_exact(package, monkeypatch, fail_voxel=True)
+    
+    with pytest.raises(ValueError):
+        nodes["MeshlibBooleanMany"]().process(_operands(), ["Union"], [False], [1], mode=["exact"],
+                                              voxel_count=[100000])
@@ -0,0 +1,20 @@
+import sys
+
+import meshlib.mrmeshpy as mrmeshpy
+import pytest
+
+
+def test_deleted_anchor_is_rejected(package):
+    deformation_nodes = sys.modules[f"{package.__name__}.nodes.deformation_nodes"]
+    mesh = mrmeshpy.makeTorus(1.0, 0.3, 8, 4)
+    faces = mrmeshpy.FaceBitSet(mesh.topology.faceSize())
+    for f in range(mesh.topology.faceSize()):
+        if 0 in [int(v) for v in mesh.topology.getTriVerts(mrmeshpy.FaceId(f))]:
+            faces.set(mrmeshpy.FaceId(f))
+    mesh.deleteFaces(faces)
+    
+    assert list(deformation_nodes._resolve_anchors(mesh, "1, 31")) == [1, 31]
+    with pytest.raises(ValueError, match="31 vertices"):
+        deformation_nodes._resolve_anchors(mesh, "0")
+    with pytest.raises(ValueError):
+        deformation_nodes._resolve_anchors(mesh, "32")
@@ -0,0 +1,43 @@
+import os
+
+import meshlib.mrmeshpy as mrmeshpy
+
+
+def _counting_offset(nodes):
+    calls = []
+    
+    class Offset(nodes["MeshlibOffset"]):
+        def process_item(self, mesh, offset, voxel_count, max_threads=0):
+            calls.append(offset)
+            return super().process_item(mesh, offset, voxel_count, max_threads)
+    
+    return Offset, calls
+
+
+def test_list_node_items_hit_and_miss(package, nodes, tmp_path, monkeypatch):
+    monkeypatch.setenv("MESHLIB_DISK_CACHE_DIR", str(tmp_path))
+    Offset, calls = _counting_offset(nodes)
+    package.disk_cache.install_disk_cache({"MeshlibOffset": Offset})
+    mesh = mrmeshpy.makeTorus(1.0, 0.3, 32, 16)
+    
+    first, = Offset().process([mesh], [0.05, 0.1], [100000])
+    assert sorted(calls) == [0.05, 0.1]
+    
+    # Same items are loaded from the cache, only the new one is computed
+    second, = Offset().process([mesh], [0.05, 0.1, 0.15], [100000])
+    assert sorted(calls) == [0.05, 0.1, 0.15]
+    assert len(second) == 3
+    for cached, computed in zip(second, first):
+        assert cached.topology.numValidFaces() == computed.topology.numValidFaces()
+    
+    entries = [entry for bucket in os.scandir(tmp_path) for entry in os.scandir(bucket.path)]
+    assert len(entries) == 3
+    assert all(os.path.exists(os.path.join(entry.path, "meta.json")) for entry in entries)
+
+
+def test_uncacheable_result_leaves_no_directories(package, tmp_path, monkeypatch):
+    monkeypatch.setenv("MESHLIB_DISK_CACHE_DIR", str(tmp_path))
+    
+    package.disk_cache.store("ab" + "0" * 38, (object(),))
+    
+    assert os.listdir(tmp_path) == []
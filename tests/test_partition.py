@@ -0,0 +1,53 @@
+import gc
+import os
+import subprocess
+import sys
+import textwrap
+
+import meshlib.mrmeshpy as mrmeshpy
+
+
+def test_partition_roundtrip(nodes):
+    mesh = mrmeshpy.makeTorus(1.0, 0.3, 64, 32)
+    chunks, _ = nodes["MeshlibOctreePartition"]().process(mesh, 1000)
+    merged, = nodes["MeshlibOctreeMerge"]().process(chunks)
+    
+    assert merged.topology.numValidFaces() == mesh.topology.numValidFaces()
+    assert merged.topology.numValidVerts() == mesh.topology.numValidVerts()
+
+
+def test_subdivide_chunks_terminates():
+    # Runs in a child process: a subdivision that never ends can't be interrupted from a thread
+    script = textwrap.dedent("""
+        import sys
+        sys.path.insert(0, sys.argv[1])
+        from common import load_package
+        nodes = load_package().nodes.NODE_CLASS_MAPPINGS
+        import meshlib.mrmeshpy as mrmeshpy
+        
+        mesh = mrmeshpy.makeTorus(1.0, 0.3, 64, 32)
+        chunks, _ = nodes["MeshlibOctreePartition"]().process(mesh, 1000)
+        chunks, _ = nodes["MeshlibOctreeProcess"]().process(chunks, "subdivide", 1, max_edge_length=0.03)
+        merged, = nodes["MeshlibOctreeMerge"]().process(chunks)
+        print(merged.topology.numValidFaces(), merged.area(), mesh.area())
+    """)
+    benchmarks = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks")
+    output = subprocess.run([sys.executable, "-c", script, benchmarks], check=True, capture_output=True,
+                            text=True, timeout=60).stdout
+    
+    faces, area, original_area = map(float, output.split()[-3:])
+    assert faces > 4 * 4096
+    assert abs(area - original_area) < 0.01 * original_area
+
+
+def test_chunk_directory_is_removed_with_the_chunks(nodes):
+    mesh = mrmeshpy.makeTorus(1.0, 0.3, 64, 32)
+    chunks, _ = nodes["MeshlibOctreePartition"]().process(mesh, 1000)
+    processed, _ = nodes["MeshlibOctreeProcess"]().process(chunks, "relax", 1)
+    directories = [chunks["directory"], processed["directory"]]
+    assert all(os.path.isdir(directory) for directory in directories)
+    
+    del chunks, processed
+    gc.collect()
+    
+    assert not any(os.path.exists(directory) for directory in directories)
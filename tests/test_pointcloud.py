@@ -0,0 +1,35 @@
+import sys
+
+import numpy as np
+
+
+def _brute_force_farthest_points(coords, count, rng):
+    selected = np.empty(count, dtype=np.int64)
+    selected[0] = rng.integers(len(coords))
+    min_dist = np.full(len(coords), np.inf, dtype=np.float32)
+    for i in range(1, count):
+        dist = np.sum((coords - coords[selected[i - 1]]) ** 2, axis=1)
+        np.minimum(min_dist, dist, out=min_dist)
+        selected[i] = np.argmax(min_dist)
+    return selected
+
+
+def test_farthest_points_match_brute_force(package):
+    pointcloud_nodes = sys.modules[f"{package.__name__}.nodes.pointcloud_nodes"]
+    coords = np.random.default_rng(1).random((20000, 3), dtype=np.float32)
+    coords[:, 2] *= 0.01
+    
+    fast = pointcloud_nodes._farthest_point_indices(coords, 2000, np.random.default_rng(0))
+    slow = _brute_force_farthest_points(coords, 2000, np.random.default_rng(0))
+    
+    np.testing.assert_array_equal(fast, slow)
+
+
+def test_downsample_farthest_point(package, nodes):
+    coords = np.random.default_rng(2).random((5000, 3), dtype=np.float32)
+    points = package.utils.numpy_to_pointcloud(coords)
+    
+    result, ratio, _ = nodes["MeshlibDownsamplePointCloud"]().process(points, "farthest_point", target_points=300)
+    
+    assert result.validPoints.count() == 300
+    assert abs(ratio - 300 / 5000) < 1e-6
@@ -0,0 +1,55 @@
+import sys
+import threading
+import types
+
+import meshlib.mrmeshpy as mrmeshpy
+import meshlib.mrmeshnumpy as mrmeshnumpy
+import numpy as np
+
+
+def _io_nodes(package):
+    return sys.modules[f"{package.__name__}.nodes.io_nodes"]
+
+
+def test_sampled_proxy_within_budget(package, monkeypatch):
+    io_nodes = _io_nodes(package)
+    monkeypatch.setattr(io_nodes, "PREVIEW_SOURCE_FACES", 10000)
+    mesh = mrmeshpy.makeTorus(1.0, 0.3, 256, 128)
+    
+    vertices, faces = io_nodes._preview_proxy(mesh, 5000, 1 << 20)
+    proxy = mrmeshnumpy.meshFromFacesVerts(faces.astype(np.int32), vertices)
+    
+    assert 0 < len(faces) <= 5000
+    assert proxy.topology.findNumHoles() == 0
+    assert abs(proxy.area() - mesh.area()) < 0.05 * mesh.area()
+
+
+def test_preview_is_sent_before_the_save_finishes(package, nodes, monkeypatch):
+    sent = threading.Event()
+    messages = []
+    
+    def send_sync(event, data, sid=None):
+        messages.append((event, data))
+        sent.set()
+    
+    server = types.ModuleType("server")
+    server.PromptServer = types.SimpleNamespace(instance=types.SimpleNamespace(
+        send_sync=send_sync, last_prompt_id="prompt", client_id="client"))
+    monkeypatch.setitem(sys.modules, "server", server)
+    
+    save_mesh = mrmeshpy.saveMesh
+    
+    def slow_save(mesh, path):
+        # The full-resolution save only completes once the preview reached the UI
+        assert sent.wait(30)
+        save_mesh(mesh, path)
+    
+    monkeypatch.setattr(mrmeshpy, "saveMesh", slow_save)
+    mesh = mrmeshpy.makeTorus(1.0, 0.3, 64, 32)
+    
+    result = nodes["MeshlibSaveMesh"]().process([mesh], ["tests/preview"], ["ply"], preview=[True],
+                                                 preview_triangles=[1000], unique_id=["7"])
+    
+    event, data = messages[0]
+    assert event == "executed" and data["node"] == "7"
+    assert data["output"]["3d"] == result["ui"]["3d"]
@@ -0,0 +1,10 @@
+def test_cached_primitives_are_copies(nodes):
+    first, = nodes["MeshlibMakeTorus"]().process(1.0, 0.3, 32, 16)
+    second, = nodes["MeshlibMakeTorus"]().process(1.0, 0.3, 32, 16)
+    
+    assert first is not second
+    first.deleteFaces(first.topology.getValidFaces())
+    assert second.topology.numValidFaces() == 32 * 16 * 2
+    
+    third, = nodes["MeshlibMakeTorus"]().process(1.0, 0.3, 32, 16)
+    assert third.topology.numValidFaces() == 32 * 16 * 2
@@ -0,0 +1,21 @@
+import numpy as np
+
+
+def test_peak_rss_sees_allocations(package):
+    with package.profiler.PeakRSS(0.001) as rss:
+        block = np.ones(64 << 20, dtype=np.uint8)
+        del block
+    
+    if rss.peak is not None:
+        assert rss.peak >= 32 << 20
+
+
+def test_profiled_call_records_memory(package):
+    profiler = package.profiler
+    
+    call = profiler._Call("MeshlibTest", (), {})
+    call.finish(())
+    
+    record = profiler.get_records()[-1]
+    assert record["node"] == "MeshlibTest"
+    assert record["peak_rss_delta_bytes"] is None or record["peak_rss_delta_bytes"] >= 0
@@ -0,0 +1,35 @@
+import threading
+import time
+
+import comfy.model_management
+import pytest
+
+
+def test_interrupt_stops_every_batch_item(package):
+    utils = package.utils
+    started = []
+    running = threading.Barrier(2, timeout=10)
+    
+    def item(index):
+        started.append(index)
+        with utils.NodeProgress() as progress:
+            if index < 2:
+                running.wait()
+            if index == 0:
+                # The user interrupts while the first two items run
+                comfy.model_management.interrupt_processing = True
+            deadline = time.monotonic() + 5
+            while progress.update(0) and time.monotonic() < deadline:
+                pass
+        return (index,)
+    
+    start = time.monotonic()
+    try:
+        with pytest.raises(comfy.model_management.InterruptProcessingException):
+            utils.map_batch(item, {"index": list(range(8))}, 1, max_workers=2)
+    finally:
+        comfy.model_management.interrupt_processing = False
+    
+    # The item running next to the interrupted one stops as well instead of running to its end
+    assert time.monotonic() - start < 2
+    assert sorted(started) == [0, 1]
@@ -0,0 +1,20 @@
+import numpy as np
+import meshlib.mrmeshpy as mrmeshpy
+
+
+def test_reorder_keeps_the_mesh(package):
+    mesh = mrmeshpy.makeTorus(1.0, 0.3, 32, 16)
+    
+    for curve in package.utils.SPACE_FILLING_CURVES:
+        reordered = package.utils.reorder_mesh(mesh, curve)
+        assert reordered.topology.numValidFaces() == mesh.topology.numValidFaces()
+        assert abs(reordered.area() - mesh.area()) < 1e-4
+
+
+def test_reorder_empty_inputs(package):
+    utils = package.utils
+    
+    assert len(utils.spatial_keys(np.zeros((0, 3)))) == 0
+    vertices, faces = utils.reorder_arrays(np.zeros((5, 3)), np.zeros((0, 3), dtype=np.int32))
+    assert vertices.shape == (0, 3) and faces.shape == (0, 3)
+    assert utils.reorder_mesh(mrmeshpy.Mesh()).topology.numValidFaces() == 0
@@ -0,0 +1,25 @@
+import gc
+import weakref
+
+import meshlib.mrmeshpy as mrmeshpy
+
+
+def test_summary_facts(package):
+    mesh = mrmeshpy.makeTorus(1.0, 0.3, 32, 16)
+    summary = package.utils.topology_summary(mesh)
+    
+    assert summary.closed
+    assert summary.holes == 0
+    assert summary.components == 1
+    assert package.utils.topology_summary(mesh) is summary
+
+
+def test_summary_does_not_keep_mesh_alive(package):
+    mesh = mrmeshpy.makeTorus(1.0, 0.3, 32, 16)
+    package.utils.topology_summary(mesh).as_dict()
+    ref = weakref.ref(mesh)
+    
+    del mesh
+    gc.collect()
+    
+    assert ref() is None
@@ -0,0 +1,144 @@
+"""
+Native thread control for ComfyUI-Meshlib
+
+MeshLib parallelizes decimation, offsets, booleans, ICP and most other
+algorithms with its bundled oneTBB, which by default uses every core. This
+module limits TBB's parallelism through tbb::global_control, so mesh work
+can share a machine with PyTorch and other native thread pools.
+
+- MESHLIB_NUM_THREADS: process-wide limit applied at import (0 or unset =
+  all cores). Worker processes inherit it.
+- set_thread_limit(n): change the process-wide limit (the Thread Settings
+  node calls this).
+- thread_limit(n): context manager used for per-node overrides.
+
+TBB applies the smallest active limit, so a per-node override can only lower
+the process-wide limit, and it also applies to other nodes running at the
+same time. When the TBB library can't be found, limits are ignored.
+"""
+
+import contextlib
+import ctypes
+import glob
+import os
+import threading
+
+
+# tbb::global_control::parameter
+_MAX_ALLOWED_PARALLELISM = 0
+
+_tbb = None
+_tbb_loaded = False
+_global_limit = None
+_lock = threading.Lock()
+
+
+class _GlobalControl(ctypes.Structure):
+    """Memory layout of oneTBB's tbb::detail::d1::global_control."""
+    
+    _fields_ = [
+        ("value", ctypes.c_size_t),
+        ("reserved", ctypes.c_ssize_t),
+        ("param", ctypes.c_int),
+    ]
+
+
+def _load_tbb():
+    """The TBB library loaded by MeshLib, or None when it can't be found."""
+    global _tbb, _tbb_loaded
+    
+    with _lock:
+        if _tbb_loaded:
+            return _tbb
+        _tbb_loaded = True
+        
+        import meshlib.mrmeshpy  # noqa: F401 - loads the bundled TBB first
+        
+        site_packages = os.path.dirname(os.path.dirname(os.path.abspath(meshlib.mrmeshpy.__file__)))
+        patterns = ("meshlib_core.libs/libtbb-*.so*", "meshlib.libs/libtbb-*.so*", "meshlib*/libtbb*.so*")
+        candidates = [path for pattern in patterns for path in sorted(glob.glob(os.path.join(site_packages, pattern)))]
+        # Windows / macOS wheels and system installs
+        candidates += ["tbb12.dll", "libtbb.12.dylib", "libtbb.so.12"]
+        
+        for candidate in candidates:
+            try:
+                library = ctypes.CDLL(candidate)
+                library.create = getattr(library, "_ZN3tbb6detail2r16createERNS0_2d114global_controlE")
+                library.destroy = getattr(library, "_ZN3tbb6detail2r17destroyERNS0_2d114global_controlE")
+                library.active_value = getattr(library, "_ZN3tbb6detail2r127global_control_active_valueEi")
+            except (OSError, AttributeError):
+                continue
+            library.create.argtypes = library.destroy.argtypes = [ctypes.POINTER(_GlobalControl)]
+            library.active_value.argtypes = [ctypes.c_int]
+            library.active_value.restype = ctypes.c_size_t
+            _tbb = library
+            break
+        else:
+            print("ComfyUI-Meshlib: TBB library not found, native thread limits are ignored")
+        
+        return _tbb
+
+
+def _create(threads):
+    tbb = _load_tbb()
+    if tbb is None:
+        return None
+    
+    control = _GlobalControl(threads, 0, _MAX_ALLOWED_PARALLELISM)
+    tbb.create(ctypes.byref(control))
+    return control
+
+
+def _destroy(control):
+    if control is not None:
+        _tbb.destroy(ctypes.byref(control))
+
+
+def active_thread_limit():
+    """Number of threads TBB currently allows (cores when unlimited), or None without TBB."""
+    tbb = _load_tbb()
+    return None if tbb is None else int(tbb.active_value(_MAX_ALLOWED_PARALLELISM))
+
+
+def set_thread_limit(threads):
+    """
+    Set the process-wide native thread limit.
+    
+    Args:
+        threads: Maximum number of threads, 0 = all cores
+    """
+    global _global_limit
+    
+    control = _create(threads) if threads > 0 else None
+    with _lock:
+        previous, _global_limit = _global_limit, control
+    _destroy(previous)
+
+
+@contextlib.contextmanager
+def thread_limit(threads):
+    """
+    Limit the native threads while the block runs (0 = no per-node limit).
+    
+    Args:
+        threads: Maximum number of threads
+    """
+    control = _create(threads) if threads > 0 else None
+    try:
+        yield
+    finally:
+        _destroy(control)
+
+
+def configured_thread_count():
+    """Thread limit requested by MESHLIB_NUM_THREADS (0 = all cores)."""
+    try:
+        return max(0, int(os.environ.get("MESHLIB_NUM_THREADS", "0")))
+    except ValueError:
+        return 0
+
+
+def install_thread_limit():
+    """Apply MESHLIB_NUM_THREADS when set."""
+    if configured_thread_count() > 0:
+        set_thread_limit(configured_thread_count())
@@ -2,9 +2,20 @@
 Utility functions for ComfyUI-Meshlib nodes
 """
 
+import functools
+import hashlib
+import os
+import threading
+import time
+import weakref
+
 import numpy as np
 
 
+_object_caches = {}
+_object_caches_lock = threading.RLock()
+
+
 def trimesh_to_meshlib(tm):
     """
     Convert a trimesh.Trimesh object to a MeshLib Mesh.
@@ -20,6 +31,10 @@ def trimesh_to_meshlib(tm):
     vertices = np.asarray(tm.vertices, dtype=np.float32)
     faces = np.asarray(tm.faces, dtype=np.int32)
     
+    curve = reorder_on_load()
+    if curve is not None:
+        vertices, faces = reorder_arrays(vertices, faces, curve)
+    
     return mrmeshnumpy.meshFromFacesVerts(faces, vertices)
 
 
@@ -42,6 +57,743 @@ def meshlib_to_trimesh(mesh):
     return trimesh.Trimesh(vertices=vertices, faces=faces)
 
 
+def mesh_to_numpy(mesh):
+    """
+    Extract vertex and face arrays from a MeshLib Mesh.
+    
+    Deleted faces are dropped; vertex indices are left untouched so the
+    returned faces index directly into the returned vertices.
+    
+    Args:
+        mesh: meshlib.mrmeshpy.Mesh object
+    
+    Returns:
+        Tuple of (vertices float32 [V, 3], faces int32 [F, 3])
+    """
+    import meshlib.mrmeshnumpy as mrmeshnumpy
+    
+    vertices = np.asarray(mrmeshnumpy.getNumpyVerts(mesh), dtype=np.float32)
+    faces = np.asarray(mrmeshnumpy.getNumpyFaces(mesh.topology), dtype=np.int32)
+    
+    # Invalid faces are reported as (0, 0, 0)
+    faces = faces[faces[:, 0] != faces[:, 1]]
+    
+    return vertices, faces
+
+
+def pointcloud_to_numpy(points):
+    """
+    Extract the valid points (and normals, if any) of a MeshLib PointCloud.
+    
+    Args:
+        points: meshlib.mrmeshpy.PointCloud object
+    
+    Returns:
+        Tuple of (points float32 [N, 3], normals float32 [N, 3] or None)
+    """
+    import meshlib.mrmeshnumpy as mrmeshnumpy
+    
+    coords = np.asarray(mrmeshnumpy.toNumpyArray(points.points), dtype=np.float32)
+    valid = mrmeshnumpy.getNumpyBitSet(points.validPoints)[:len(coords)]
+    count = len(valid)
+    
+    normals = None
+    if points.hasNormals():
+        normals = np.asarray(mrmeshnumpy.toNumpyArray(points.normals), dtype=np.float32)
+        normals = normals[:count][valid]
+    
+    return coords[:count][valid], normals
+
+
+def numpy_to_pointcloud(coords, normals=None):
+    """
+    Build a MeshLib PointCloud from NumPy arrays.
+    
+    Args:
+        coords: Array of shape [N, 3]
+        normals: Optional array of shape [N, 3]
+    
+    Returns:
+        meshlib.mrmeshpy.PointCloud object
+    """
+    import meshlib.mrmeshnumpy as mrmeshnumpy
+    
+    coords = np.ascontiguousarray(coords, dtype=np.float32)
+    if normals is None:
+        return mrmeshnumpy.pointCloudFromPoints(coords)
+    
+    normals = np.ascontiguousarray(normals, dtype=np.float32)
+    return mrmeshnumpy.pointCloudFromPoints(coords, normals)
+
+
+def to_numpy_array(value, dtype=np.float32):
+    """
+    Convert a MESHLIB_ARRAY input (NumPy array, torch tensor or nested lists) to NumPy.
+    
+    CPU tensors and arrays that already have the requested dtype are not copied.
+    
+    Args:
+        value: Array-like input
+        dtype: Target NumPy dtype
+    
+    Returns:
+        numpy.ndarray
+    """
+    if hasattr(value, "detach") and hasattr(value, "cpu"):
+        value = value.detach().cpu().numpy()
+    
+    return np.asarray(value, dtype=dtype)
+
+
+def coordinate_view(owner, coords):
+    """
+    Read-only float32 [N, 3] view of a MeshLib coordinate vector, without a copy.
+    
+    getNumpyVerts and toNumpyArray copy into float64; this maps the
+    Vector3f storage itself. The view keeps owner alive and stays valid as
+    long as the coordinates are not resized or replaced (nodes never modify
+    their inputs in place).
+    
+    Args:
+        owner: Object holding the vector (Mesh, PointCloud)
+        coords: Its VertCoords (e.g. mesh.points)
+    
+    Returns:
+        numpy.ndarray float32 [N, 3], read-only
+    """
+    import ctypes
+    
+    count = coords.vec.size()
+    if count == 0:
+        return np.zeros((0, 3), dtype=np.float32)
+    
+    buffer = (ctypes.c_float * (3 * count)).from_address(coords.vec.data_pointer())
+    buffer.owner = owner
+    view = np.frombuffer(buffer, dtype=np.float32).reshape(count, 3)
+    view.flags.writeable = False
+    return view
+
+
+def to_output_array(array, output_type="numpy"):
+    """
+    Return a NumPy array as a MESHLIB_ARRAY of the requested type.
+    
+    torch tensors share the array's memory (CPU). Read-only arrays are
+    shared too; the tensor must not be modified in place then.
+    
+    Args:
+        array: numpy.ndarray
+        output_type: "numpy" or "torch"
+    """
+    if output_type == "numpy":
+        return array
+    
+    import warnings
+    import torch
+    
+    with warnings.catch_warnings():
+        # from_numpy warns about read-only arrays (coordinate views)
+        warnings.simplefilter("ignore", UserWarning)
+        return torch.from_numpy(array)
+
+
+def set_mesh_points(mesh, vertices):
+    """
+    Overwrite all vertex coordinates of a MeshLib Mesh in place.
+    
+    Args:
+        mesh: meshlib.mrmeshpy.Mesh object
+        vertices: Array of shape [V, 3], V being the size of mesh.points
+    """
+    import meshlib.mrmeshnumpy as mrmeshnumpy
+    
+    mesh.points.vec = mrmeshnumpy.fromNumpyArray(np.ascontiguousarray(vertices, dtype=np.float32))
+    mesh.invalidateCaches()
+
+
+def get_object_cache(obj):
+    """
+    Get a dict for data derived from a MeshLib object (kNN graphs, weights, ...).
+    
+    The dict lives as long as the object itself. Nodes never modify their
+    inputs in place, so anything computed from an input stays valid; callers
+    should still store enough (e.g. point count) to sanity check an entry.
+    
+    Args:
+        obj: Any weak-referenceable object (Mesh, PointCloud)
+    
+    Returns:
+        dict attached to obj (a throwaway dict if obj can't be tracked)
+    """
+    key = id(obj)
+    
+    with _object_caches_lock:
+        entry = _object_caches.get(key)
+        if entry is not None and entry[0]() is obj:
+            return entry[1]
+        
+        def discard(ref, key=key):
+            with _object_caches_lock:
+                if _object_caches.get(key, (None,))[0] is ref:
+                    del _object_caches[key]
+        
+        try:
+            ref = weakref.ref(obj, discard)
+        except TypeError:
+            return {}
+        
+        cache = {}
+        _object_caches[key] = (ref, cache)
+        return cache
+
+
+class TopologySummary:
+    """
+    Cached facts about a mesh's topology, to skip operations that would do nothing.
+    
+    Every fact is computed on first access (each is one linear scan, cheaper
+    than copying the mesh) and kept for the lifetime of the mesh; get one
+    through topology_summary(mesh) so all nodes share it.
+    """
+    
+    def __init__(self, mesh):
+        # Weak, since the summary lives in the mesh's own object cache
+        self._mesh_ref = weakref.ref(mesh)
+        self._facts = {}
+        self.stamp = (mesh.topology.numValidVerts(), mesh.topology.numValidFaces())
+    
+    @property
+    def _mesh(self):
+        mesh = self._mesh_ref()
+        if mesh is None:
+            raise ReferenceError("The mesh of this TopologySummary has been freed")
+        return mesh
+    
+    def _get(self, name, compute):
+        if name not in self._facts:
+            self._facts[name] = compute()
+        return self._facts[name]
+    
+    @property
+    def holes(self):
+        """Number of holes (boundary loops)."""
+        return self._get("holes", self._mesh.topology.findNumHoles)
+    
+    @property
+    def closed(self):
+        """Whether the mesh has no boundary."""
+        if "holes" in self._facts:
+            return self._facts["holes"] == 0
+        return self._get("closed", self._mesh.topology.isClosed)
+    
+    @property
+    def manifold(self):
+        """Whether no vertex appears several times on a hole boundary."""
+        import meshlib.mrmeshpy as mrmeshpy
+        
+        return self._get("manifold", lambda: self.closed
+                         or mrmeshpy.findRepeatedVertsOnHoleBd(self._mesh.topology).count() == 0)
+    
+    @property
+    def components(self):
+        """Number of connected components."""
+        import meshlib.mrmeshpy as mrmeshpy
+        
+        return self._get("components", lambda: mrmeshpy.MeshComponents.getNumComponents(self._mesh))
+    
+    def degeneracies(self, tiny_edge_length=0.0, critical_aspect_ratio=1e4):
+        """
+        Number of degenerate faces plus tiny edges.
+        
+        Args:
+            tiny_edge_length: Edges shorter than this count (0 = none)
+            critical_aspect_ratio: Faces with at least this aspect ratio count
+        """
+        import meshlib.mrmeshpy as mrmeshpy
+        
+        def compute():
+            part = mrmeshpy.MeshPart(self._mesh)
+            count = mrmeshpy.findDegenerateFaces(part, critical_aspect_ratio).count()
+            if tiny_edge_length > 0:
+                count += mrmeshpy.findShortEdges(part, tiny_edge_length).count()
+            return count
+        
+        return self._get(("degeneracies", tiny_edge_length, critical_aspect_ratio), compute)
+    
+    def as_dict(self):
+        """All facts, with the default degeneracy thresholds."""
+        return {
+            "closed": self.closed,
+            "holes": self.holes,
+            "manifold": self.manifold,
+            "components": self.components,
+            "degeneracies": self.degeneracies(),
+        }
+
+
+def topology_summary(mesh):
+    """
+    The TopologySummary of a mesh, shared by all nodes that see the mesh.
+    
+    Args:
+        mesh: meshlib.mrmeshpy.Mesh object
+    
+    Returns:
+        TopologySummary (recomputed when the vertex or face count changed)
+    """
+    cache = get_object_cache(mesh)
+    summary = cache.get("topology_summary")
+    if summary is None or summary.stamp != (mesh.topology.numValidVerts(), mesh.topology.numValidFaces()):
+        summary = cache["topology_summary"] = TopologySummary(mesh)
+    return summary
+
+
+def report_skipped(operation, reason):
+    """Tell the user a node returned its input because the operation would do nothing."""
+    print(f"ComfyUI-Meshlib: {operation} skipped: {reason}")
+
+
+def merge_meshes(meshes):
+    """
+    Concatenate meshes into one mesh without any boolean processing.
+    
+    Every input becomes a separate set of connected components of the result,
+    which is a valid union when the inputs do not overlap. The arrays are
+    concatenated in one go and the topology is built once, which is much
+    faster than appending meshes one by one.
+    
+    Args:
+        meshes: Sequence of meshlib.mrmeshpy.Mesh objects
+    
+    Returns:
+        New meshlib.mrmeshpy.Mesh object
+    """
+    import meshlib.mrmeshnumpy as mrmeshnumpy
+    
+    arrays = [mesh_to_numpy(mesh) for mesh in meshes]
+    offsets = np.cumsum([0] + [len(vertices) for vertices, _ in arrays[:-1]])
+    
+    vertices = np.concatenate([vertices for vertices, _ in arrays])
+    faces = np.concatenate([faces + offset for (_, faces), offset in zip(arrays, offsets)]).astype(np.int32)
+    
+    return mrmeshnumpy.meshFromFacesVerts(faces, vertices)
+
+
+# Maximum bits per axis of the space filling curve keys (3 x 21 bits fit in a uint64)
+CURVE_BITS = 21
+
+SPACE_FILLING_CURVES = ("morton", "hilbert")
+
+
+def _spread_bits(values):
+    """Insert two zero bits between the low 21 bits of each value (uint64)."""
+    x = values & np.uint64(0x1FFFFF)
+    x = (x | x << np.uint64(32)) & np.uint64(0x1F00000000FFFF)
+    x = (x | x << np.uint64(16)) & np.uint64(0x1F0000FF0000FF)
+    x = (x | x << np.uint64(8)) & np.uint64(0x100F00F00F00F00F)
+    x = (x | x << np.uint64(4)) & np.uint64(0x10C30C30C30C30C3)
+    x = (x | x << np.uint64(2)) & np.uint64(0x1249249249249249)
+    return x
+
+
+def _hilbert_transpose(axes, bits):
+    """
+    Convert grid coordinates to the transposed Hilbert index (Skilling's algorithm).
+    
+    Interleaving the bits of the three returned arrays gives the Hilbert key.
+    """
+    x, y, z = (axis.copy() for axis in axes)
+    top = np.uint64(1 << (bits - 1))
+    
+    q = top
+    while q > 1:
+        p = q - np.uint64(1)
+        x ^= np.where((x & q) != 0, p, np.uint64(0))
+        for other in (y, z):
+            high = (other & q) != 0
+            t = np.where(high, np.uint64(0), (x ^ other) & p)
+            x ^= np.where(high, p, t)
+            other ^= t
+        q >>= np.uint64(1)
+    
+    y ^= x
+    z ^= y
+    t = np.zeros_like(x)
+    q = top
+    while q > 1:
+        t ^= np.where((z & q) != 0, q - np.uint64(1), np.uint64(0))
+        q >>= np.uint64(1)
+    
+    return x ^ t, y ^ t, z ^ t
+
+
+def spatial_keys(points, curve="morton", bounds=None, bits=None):
+    """
+    Morton (Z-order) or Hilbert curve keys of 3D points.
+    
+    Points are quantized to a 2^bits grid over a cubic box, so sorting by the
+    keys puts nearby points next to each other in memory.
+    
+    Args:
+        points: Array [N, 3]
+        curve: "morton" or "hilbert"
+        bounds: Optional (min corner, edge length) of the box; defaults to the points' bounding cube
+        bits: Grid resolution per axis; by default about 8 cells per point, at most CURVE_BITS
+    
+    Returns:
+        uint64 array [N]
+    """
+    if curve not in SPACE_FILLING_CURVES:
+        raise ValueError(f"Unknown curve '{curve}', expected one of {SPACE_FILLING_CURVES}")
+    
+    points = np.asarray(points, dtype=np.float32)
+    if len(points) == 0:
+        return np.empty(0, dtype=np.uint64)
+    if bounds is None:
+        box_min = points.min(axis=0)
+        size = float((points.max(axis=0) - box_min).max())
+    else:
+        box_min, size = bounds
+    if bits is None:
+        bits = int(min(CURVE_BITS, max(1, np.ceil(np.log2(max(len(points), 2)) / 3) + 1)))
+    
+    cells = (1 << bits) - 1
+    scale = np.float32(cells / size if size > 0 else 0.0)
+    grid = np.clip((points - box_min) * scale, 0, cells).astype(np.uint64)
+    axes = (grid[:, 0], grid[:, 1], grid[:, 2])
+    if curve == "hilbert":
+        axes = _hilbert_transpose(axes, bits)
+    
+    return (_spread_bits(axes[0]) << np.uint64(2)) | (_spread_bits(axes[1]) << np.uint64(1)) | _spread_bits(axes[2])
+
+
+def reorder_arrays(vertices, faces, curve="morton"):
+    """
+    Sort vertices and faces along a space filling curve.
+    
+    Vertices are ordered by the curve key of their position, faces by their
+    first vertex in that order, so mesh traversals (AABB tree builds,
+    relaxation, booleans) touch memory mostly sequentially. Unreferenced
+    vertices are dropped.
+    
+    Args:
+        vertices: Vertex array [V, 3]
+        faces: Face array [F, 3]
+        curve: "morton" or "hilbert"
+    
+    Returns:
+        Tuple of (vertices float32 [V', 3], faces int32 [F, 3])
+    """
+    vertices = np.asarray(vertices, dtype=np.float32)
+    faces = np.asarray(faces)
+    if len(faces) == 0:
+        return np.empty((0, 3), dtype=np.float32), np.empty((0, 3), dtype=np.int32)
+    
+    used = np.flatnonzero(np.bincount(faces.ravel(), minlength=len(vertices)))
+    vertices = vertices[used]
+    
+    order = np.argsort(spatial_keys(vertices, curve), kind="stable")
+    rank = np.zeros(len(used) and used[-1] + 1, dtype=np.int32)
+    rank[used[order]] = np.arange(len(order), dtype=np.int32)
+    faces = rank[faces]
+    
+    face_order = np.argsort(faces.min(axis=1), kind="stable")
+    
+    return vertices[order], faces[face_order]
+
+
+def reorder_mesh(mesh, curve="morton"):
+    """
+    Copy of a mesh with vertices and faces sorted along a space filling curve.
+    
+    Args:
+        mesh: meshlib.mrmeshpy.Mesh object
+        curve: "morton" or "hilbert"
+    
+    Returns:
+        New meshlib.mrmeshpy.Mesh object
+    """
+    import meshlib.mrmeshpy as mrmeshpy
+    import meshlib.mrmeshnumpy as mrmeshnumpy
+    
+    # Nothing to sort; a mesh without faces would also lose all its vertices
+    if mesh.topology.numValidFaces() == 0:
+        return mrmeshpy.copyMesh(mesh)
+    
+    vertices, faces = reorder_arrays(*mesh_to_numpy(mesh), curve)
+    return mrmeshnumpy.meshFromFacesVerts(faces, vertices)
+
+
+def reorder_on_load():
+    """Curve from MESHLIB_REORDER_ON_LOAD used to sort loaded meshes, or None when disabled."""
+    curve = os.environ.get("MESHLIB_REORDER_ON_LOAD", "").strip().lower()
+    return curve if curve in SPACE_FILLING_CURVES else None
+
+
+def mesh_fingerprint(mesh):
+    """
+    Content hash of a mesh (vertex coordinates and faces).
+    
+    Two meshes with identical geometry and topology get the same fingerprint,
+    whichever node produced them. The hash is cached on the mesh object.
+    
+    Args:
+        mesh: meshlib.mrmeshpy.Mesh object
+    
+    Returns:
+        Hex digest string
+    """
+    cache = get_object_cache(mesh)
+    if "fingerprint" not in cache:
+        vertices, faces = mesh_to_numpy(mesh)
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(vertices.tobytes())
+        digest.update(faces.tobytes())
+        cache["fingerprint"] = digest.hexdigest()
+    
+    return cache["fingerprint"]
+
+
+def pointcloud_fingerprint(points):
+    """
+    Content hash of a point cloud (valid points and normals).
+    
+    Args:
+        points: meshlib.mrmeshpy.PointCloud object
+    
+    Returns:
+        Hex digest string
+    """
+    cache = get_object_cache(points)
+    if "fingerprint" not in cache:
+        coords, normals = pointcloud_to_numpy(points)
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(coords.tobytes())
+        if normals is not None:
+            digest.update(normals.tobytes())
+        cache["fingerprint"] = digest.hexdigest()
+    
+    return cache["fingerprint"]
+
+
+def wrap_node_function(node_class, wrapper, name=None):
+    """
+    Replace the FUNCTION method of a node class by a wrapped version.
+    
+    Used to install optional execution layers (worker processes, caching,
+    profiling) around existing nodes without touching their code.
+    
+    Args:
+        node_class: ComfyUI node class
+        wrapper: Callable taking the original method and returning the replacement
+        name: Method to wrap instead of FUNCTION
+    """
+    name = name or node_class.FUNCTION
+    original = getattr(node_class, name)
+    setattr(node_class, name, functools.update_wrapper(wrapper(original), original))
+
+
+# Minimum seconds between two progress bar updates sent to the UI
+PROGRESS_INTERVAL = 0.1
+
+# Holds the batch NodeProgress in threads running one item of a batch (see map_batch)
+_batch_item = threading.local()
+
+
+def processing_interrupted():
+    """Whether the user interrupted the running ComfyUI prompt."""
+    import comfy.model_management
+    
+    return comfy.model_management.processing_interrupted()
+
+
+def throw_if_interrupted():
+    """Raise ComfyUI's InterruptProcessingException when the prompt was interrupted."""
+    import comfy.model_management
+    
+    comfy.model_management.throw_exception_if_processing_interrupted()
+
+
+class NodeProgress:
+    """
+    Throttled ComfyUI progress bar that doubles as a MeshLib ProgressCallback.
+    
+    Calling the instance with a fraction in [0, 1] moves the bar (at most once
+    every PROGRESS_INTERVAL seconds, MeshLib reports far more often) and
+    returns False once the user interrupted the prompt, which makes MeshLib
+    abort the operation. Used as a context manager, it raises ComfyUI's
+    InterruptProcessingException on exit when an operation was aborted, so
+    the partial result of the native call is never returned.
+    
+    MeshLib may call the callback from its worker threads. Inside a batch item
+    (see map_batch) only the interrupt is checked; the bar shows the batch.
+    An interrupt seen by any item cancels the batch, so the other items stop
+    too even though the first one to raise clears ComfyUI's flag.
+    """
+    
+    def __init__(self, total=100, interval=None):
+        import comfy.model_management
+        from comfy.utils import ProgressBar
+        
+        self.total = total
+        self.interval = PROGRESS_INTERVAL if interval is None else interval
+        self.value = 0
+        self.cancelled = False
+        self._interrupted = comfy.model_management.processing_interrupted
+        self._batch = getattr(_batch_item, "progress", None)
+        self._bar = None if self._batch is not None else ProgressBar(total)
+        self._shown = 0
+        self._last = 0.0
+        self._lock = threading.Lock()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, traceback):
+        if self.cancelled:
+            import comfy.model_management
+            
+            # The flag is cleared by the first check; raise anyway
+            throw_if_interrupted()
+            raise comfy.model_management.InterruptProcessingException()
+        return False
+    
+    def __call__(self, fraction):
+        return self.set(fraction * self.total)
+    
+    def set(self, value):
+        """Set the absolute progress; returns False when the node should stop."""
+        self.value = min(value, self.total)
+        return self._poll()
+    
+    def update(self, steps=1):
+        """Advance the progress by steps; returns False when the node should stop."""
+        with self._lock:
+            self.value = min(self.value + steps, self.total)
+        return self._poll()
+    
+    def keep_going(self, fraction=None):
+        """ProgressCallback that only checks for an interrupt, leaving the bar alone."""
+        if not self.cancelled:
+            batch = self._batch
+            if self._interrupted() or (batch is not None and batch.cancelled):
+                self.cancelled = True
+                if batch is not None:
+                    batch.cancelled = True
+        return not self.cancelled
+    
+    def check(self):
+        """Raise InterruptProcessingException when the prompt was interrupted."""
+        if not self.keep_going():
+            self.__exit__(None, None, None)
+    
+    def _poll(self):
+        # MeshLib calls back up to millions of times: only look at the bar
+        # and the interrupt flag once per interval
+        now = time.monotonic()
+        if now - self._last < self.interval and self.value < self.total:
+            return not self.cancelled
+        
+        with self._lock:
+            self._last = now
+            if self.value != self._shown and self._bar is not None:
+                self._bar.update_absolute(self.value, self.total)
+                self._shown = self.value
+        return self.keep_going()
+
+
+def batch_items(inputs):
+    """
+    Split ComfyUI list inputs (INPUT_IS_LIST) into per-item keyword arguments.
+    
+    Shorter lists are repeated from their last value, the way ComfyUI maps
+    lists over nodes without INPUT_IS_LIST.
+    
+    Args:
+        inputs: Dict of input name -> list of values
+    
+    Returns:
+        List of dicts of input name -> value, as long as the longest list
+    """
+    inputs = {name: values for name, values in inputs.items() if values is not None}
+    if not inputs or any(len(values) == 0 for values in inputs.values()):
+        return []
+    
+    count = max(len(values) for values in inputs.values())
+    return [{name: values[min(i, len(values) - 1)] for name, values in inputs.items()} for i in range(count)]
+
+
+def merge_batch_results(results, num_outputs):
+    """
+    Combine per-item node results into OUTPUT_IS_LIST outputs.
+    
+    Args:
+        results: List of node results (tuples, or dicts with "result" and "ui")
+        num_outputs: Number of node outputs
+    
+    Returns:
+        Tuple of lists, or a dict with the merged "ui" when items returned one
+    """
+    outputs = tuple([] for _ in range(num_outputs))
+    ui = {}
+    for result in results:
+        if isinstance(result, dict):
+            for key, values in result.get("ui", {}).items():
+                ui.setdefault(key, []).extend(values)
+            result = result["result"]
+        for output, value in zip(outputs, result):
+            output.append(value)
+    
+    if ui:
+        return {"ui": ui, "result": outputs}
+    return outputs
+
+
+def map_batch(function, inputs, num_outputs, max_workers=4):
+    """
+    Run a per-item node function over ComfyUI list inputs.
+    
+    Items run concurrently in a bounded thread pool and results keep the
+    input order. MeshLib algorithms that release the GIL (relax, mesh I/O,
+    NumPy work) overlap; the others already use all cores through TBB, and
+    with the worker pool enabled every item runs in a worker process.
+    
+    Args:
+        function: Node method taking one item's inputs as keyword arguments
+        inputs: Dict of input name -> list of values
+        num_outputs: Number of node outputs
+        max_workers: Maximum number of items processed at once
+    
+    Returns:
+        Node result with one list per output (for OUTPUT_IS_LIST)
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    import comfy.model_management
+    
+    items = batch_items(inputs)
+    if len(items) <= 1:
+        return merge_batch_results([function(**item) for item in items], num_outputs)
+    
+    with NodeProgress(len(items)) as progress:
+        def run(item):
+            progress.check()
+            _batch_item.progress = progress
+            try:
+                return function(**item)
+            except comfy.model_management.InterruptProcessingException:
+                # Raising cleared ComfyUI's flag; the items still queued check this one
+                progress.cancelled = True
+                raise
+            finally:
+                _batch_item.progress = None
+                progress.update()
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(items)))) as pool:
+            results = list(pool.map(run, items))
+    
+    return merge_batch_results(results, num_outputs)
+
+
 def get_output_path(filename_prefix: str, file_format: str) -> str:
     """
     Generate an output path for saving files.
@@ -49,19 +801,35 @@ def get_output_path(filename_prefix: str, file_format: str) -> str:
     Args:
         filename_prefix: Prefix for the filename
         file_format: File extension (without dot)
-        
+    
     Returns:
         Full path to the output file
     """
+    return get_output_paths(filename_prefix, file_format, 1)[0]
+
+
+def get_output_paths(filename_prefix: str, file_format: str, count: int) -> list:
+    """
+    Generate consecutive output paths for saving a batch of files.
+    
+    The counter is looked up once, so files saved concurrently don't collide.
+    
+    Args:
+        filename_prefix: Prefix for the filenames
+        file_format: File extension (without dot)
+        count: Number of paths
+    
+    Returns:
+        List of full paths to the output files
+    """
     import folder_paths
     from pathlib import Path
     
     full_output_folder, filename, counter, subfolder, filename_prefix = folder_paths.get_save_image_path(filename_prefix, folder_paths.get_output_directory())
     
-    output_path = Path(full_output_folder) / f'{filename}_{counter:05}.{file_format}'
-    output_path.parent.mkdir(exist_ok=True, parents=True) 
+    Path(full_output_folder).mkdir(exist_ok=True, parents=True)
     
-    return str(output_path)
+    return [str(Path(full_output_folder) / f'{filename}_{counter + i:05}.{file_format}') for i in range(count)]
 
 
 def resolve_input_path(file_path: str) -> str:
@@ -70,7 +838,7 @@ def resolve_input_path(file_path: str) -> str:
     
     Args:
         file_path: Path to the file
-        
+    
     Returns:
         Resolved absolute path
     """
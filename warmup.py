@@ -0,0 +1,133 @@
+"""
+Background warm-up for ComfyUI-Meshlib
+
+Nodes import MeshLib lazily, so the first Meshlib node of a fresh process
+pays for importing mrmeshpy / mrmeshnumpy, loading the native libraries and
+starting the TBB thread pool. With MESHLIB_WARMUP set, that work is done on
+a background thread while ComfyUI finishes starting:
+
+- MESHLIB_WARMUP=import (or 1): import and load MeshLib.
+- MESHLIB_WARMUP=smoke: also run a tiny sphere -> decimate -> boolean, which
+  starts the thread pool and touches the code paths of typical first jobs.
+
+Unset or 0 disables it. When the worker pool is enabled, its workers are
+started and warmed up the same way.
+"""
+
+import os
+import threading
+import time
+from multiprocessing import parent_process
+
+
+WARMUP_MODES = ("import", "smoke")
+
+_started = False
+_done = threading.Event()
+_timings = {}
+
+
+def warmup_mode():
+    """Warm-up requested by MESHLIB_WARMUP: "import", "smoke" or None."""
+    mode = os.environ.get("MESHLIB_WARMUP", "0").strip().lower()
+    if mode in ("", "0", "false", "off"):
+        return None
+    if mode in ("1", "true", "on"):
+        return "import"
+    if mode not in WARMUP_MODES:
+        print(f"ComfyUI-Meshlib: unknown MESHLIB_WARMUP value {mode!r}, expected one of {WARMUP_MODES}")
+        return None
+    return mode
+
+
+def warm_up(mode="import"):
+    """
+    Load MeshLib, and run a small smoke operation in "smoke" mode.
+    
+    Args:
+        mode: "import" or "smoke"
+    
+    Returns:
+        Dict of the seconds spent per step
+    """
+    timings = {}
+    
+    start = time.perf_counter()
+    import meshlib.mrmeshpy as mrmeshpy
+    import meshlib.mrmeshnumpy as mrmeshnumpy
+    timings["import_s"] = time.perf_counter() - start
+    
+    if mode == "smoke":
+        start = time.perf_counter()
+        sphere = mrmeshpy.makeUVSphere(1.0, 32, 32)
+        
+        settings = mrmeshpy.DecimateSettings()
+        settings.maxDeletedFaces = sphere.topology.numValidFaces() // 2
+        settings.maxError = 0.01
+        mrmeshpy.decimateMesh(sphere, settings)
+        
+        shifted = mrmeshpy.copyMesh(sphere)
+        shifted.transform(mrmeshpy.AffineXf3f.translation(mrmeshpy.Vector3f(0.5, 0.0, 0.0)))
+        result = mrmeshpy.boolean(sphere, shifted, mrmeshpy.BooleanOperation.Union)
+        if result.valid():
+            mrmeshnumpy.getNumpyVerts(result.mesh)
+        timings["smoke_s"] = time.perf_counter() - start
+    
+    return timings
+
+
+def _run(mode):
+    start = time.perf_counter()
+    try:
+        _timings.update(warm_up(mode))
+    except Exception as e:
+        print(f"ComfyUI-Meshlib: warm-up failed: {e}")
+    else:
+        print(f"ComfyUI-Meshlib: MeshLib warmed up ({mode}) in {time.perf_counter() - start:.2f}s")
+    finally:
+        _done.set()
+
+
+def _warm_up_workers(mode):
+    """Start the worker processes and warm each of them up."""
+    from .worker_pool import worker_count, submit
+    
+    for _ in range(worker_count()):
+        try:
+            submit(warm_up, mode)
+        except Exception as e:
+            print(f"ComfyUI-Meshlib: worker warm-up failed: {e}")
+            return
+
+
+def warmup_timings():
+    """Seconds per warm-up step of this process (empty until the warm-up finished)."""
+    return dict(_timings)
+
+
+def wait_for_warmup(timeout=None):
+    """
+    Block until the background warm-up finished.
+    
+    Returns:
+        False when the timeout expired or no warm-up was started
+    """
+    if not _started:
+        return False
+    return _done.wait(timeout)
+
+
+def install_warmup():
+    """Start the background warm-up when MESHLIB_WARMUP is set."""
+    global _started
+    
+    mode = warmup_mode()
+    if mode is None or parent_process() is not None:
+        return
+    _started = True
+    
+    def run():
+        _warm_up_workers(mode)
+        _run(mode)
+    
+    threading.Thread(target=run, name="meshlib-warmup", daemon=True).start()
@@ -0,0 +1,347 @@
+"""
+Process worker pool for ComfyUI-Meshlib
+
+Optional execution backend that runs heavy node calls in separate worker
+processes. A long offset or boolean no longer blocks the server process, and
+a native crash only takes down a worker (the pool is recreated).
+
+Meshes, point clouds and NumPy arrays are not pickled: their arrays are
+copied into multiprocessing.shared_memory blocks and rebuilt with
+mrmeshnumpy on the other side. Everything else (numbers, strings, ...) is
+passed as usual.
+
+Enable it with the MESHLIB_WORKER_PROCESSES environment variable (number of
+worker processes, 0 or unset = disabled). Set MESHLIB_WORKER_ASYNC=1 on
+ComfyUI versions that run async nodes concurrently to let independent
+branches execute in parallel.
+"""
+
+import asyncio
+import contextlib
+import importlib
+import inspect
+import os
+import sys
+import threading
+import types
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import get_context, parent_process, shared_memory
+
+import numpy as np
+
+from .utils import mesh_to_numpy, pointcloud_to_numpy, numpy_to_pointcloud, wrap_node_function
+
+
+# Nodes dispatched to the workers: long running, mesh in / mesh out
+WORKER_NODES = (
+    "MeshlibOffset",
+    "MeshlibBoolean",
+    "MeshlibBooleanMany",
+    "MeshlibDecimate",
+    "MeshlibSubdivide",
+    "MeshlibTriangulatePointCloud",
+    "MeshlibFixDegeneracies",
+)
+
+_pool = None
+_pool_lock = threading.Lock()
+_spawn_lock = threading.Lock()
+
+
+def worker_count():
+    """Number of worker processes requested by MESHLIB_WORKER_PROCESSES (0 = disabled)."""
+    try:
+        return max(0, int(os.environ.get("MESHLIB_WORKER_PROCESSES", "0")))
+    except ValueError:
+        return 0
+
+
+# ---------------------------------------------------------------------------
+# Shared memory transport
+# ---------------------------------------------------------------------------
+
+def _share_array(array, blocks):
+    """Copy an array into a new shared memory block; returns its descriptor."""
+    array = np.ascontiguousarray(array)
+    block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+    blocks.append(block)
+    return ("__shm__", block.name, array.shape, array.dtype.str)
+
+
+def _read_array(descriptor, unlink=False):
+    """Copy an array out of the shared memory block of a descriptor."""
+    _, name, shape, dtype = descriptor
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        return np.ndarray(shape, dtype=dtype, buffer=block.buf).copy()
+    finally:
+        block.close()
+        if unlink:
+            block.unlink()
+
+
+def encode(value, blocks):
+    """
+    Replace meshes, point clouds and arrays in a (nested) value by shared memory descriptors.
+    
+    Args:
+        value: Any node argument or result (lists, tuples and dicts are walked)
+        blocks: List collecting the created SharedMemory objects
+    
+    Returns:
+        Picklable value
+    """
+    import meshlib.mrmeshpy as mrmeshpy
+    
+    if isinstance(value, mrmeshpy.Mesh):
+        vertices, faces = mesh_to_numpy(value)
+        return ("__mesh__", _share_array(vertices, blocks), _share_array(faces, blocks))
+    if isinstance(value, mrmeshpy.PointCloud):
+        coords, normals = pointcloud_to_numpy(value)
+        return ("__points__", _share_array(coords, blocks),
+                None if normals is None else _share_array(normals, blocks))
+    if isinstance(value, np.ndarray):
+        return _share_array(value, blocks)
+    if isinstance(value, list):
+        return [encode(item, blocks) for item in value]
+    if isinstance(value, tuple):
+        return ("__tuple__", [encode(item, blocks) for item in value])
+    if isinstance(value, dict):
+        return {key: encode(item, blocks) for key, item in value.items()}
+    
+    return value
+
+
+def decode(value, unlink=False):
+    """
+    Inverse of encode: rebuild meshes, point clouds and arrays.
+    
+    Args:
+        value: Encoded value
+        unlink: Free the shared memory blocks once read (for blocks created by the other process)
+    """
+    import meshlib.mrmeshnumpy as mrmeshnumpy
+    
+    if isinstance(value, tuple) and value and isinstance(value[0], str):
+        tag = value[0]
+        if tag == "__shm__":
+            return _read_array(value, unlink)
+        if tag == "__mesh__":
+            vertices = _read_array(value[1], unlink)
+            faces = _read_array(value[2], unlink)
+            return mrmeshnumpy.meshFromFacesVerts(faces, vertices)
+        if tag == "__points__":
+            coords = _read_array(value[1], unlink)
+            normals = None if value[2] is None else _read_array(value[2], unlink)
+            return numpy_to_pointcloud(coords, normals)
+        if tag == "__tuple__":
+            return tuple(decode(item, unlink) for item in value[1])
+    if isinstance(value, list):
+        return [decode(item, unlink) for item in value]
+    if isinstance(value, dict):
+        return {key: decode(item, unlink) for key, item in value.items()}
+    
+    return value
+
+
+def _release(blocks):
+    for block in blocks:
+        block.close()
+        with contextlib.suppress(FileNotFoundError):
+            block.unlink()
+
+
+# ---------------------------------------------------------------------------
+# Worker side
+# ---------------------------------------------------------------------------
+
+def _run_node(node_name, encoded_kwargs, function_name=None):
+    """Worker entry point: run one node (FUNCTION, or function_name) and return its encoded result."""
+    nodes = importlib.import_module(".nodes", __package__)
+    node = nodes.NODE_CLASS_MAPPINGS[node_name]()
+    
+    result = getattr(node, function_name or node.FUNCTION)(**decode(encoded_kwargs))
+    
+    # Blocks are freed by the parent after reading; closing our handles keeps them alive
+    blocks = []
+    encoded = encode(result, blocks)
+    for block in blocks:
+        block.close()
+    
+    return encoded
+
+
+def _echo(encoded):
+    """Worker entry point returning its (decoded, re-encoded) input; used to measure transport cost."""
+    blocks = []
+    encoded = encode(decode(encoded), blocks)
+    for block in blocks:
+        block.close()
+    
+    return encoded
+
+
+# ---------------------------------------------------------------------------
+# Parent side
+# ---------------------------------------------------------------------------
+
+@contextlib.contextmanager
+def _spawn_environment():
+    """
+    Prepare the parent process for starting spawn workers.
+    
+    Spawned children re-import the parent's __main__ (ComfyUI's main.py, which
+    must not run twice), so it is hidden while workers start. The directory
+    containing this package is put on sys.path so workers import the package
+    under the same name and can unpickle references to this module.
+    """
+    package_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    
+    with _spawn_lock:
+        main = sys.modules.get("__main__")
+        sys.modules["__main__"] = types.ModuleType("__main__")
+        added = package_root not in sys.path
+        if added:
+            sys.path.append(package_root)
+        try:
+            yield
+        finally:
+            if main is not None:
+                sys.modules["__main__"] = main
+            if added:
+                sys.path.remove(package_root)
+
+
+def get_pool():
+    """The shared worker pool, created on first use."""
+    global _pool
+    
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=worker_count() or 1, mp_context=get_context("spawn"))
+        return _pool
+
+
+def _reset_pool(pool):
+    """Drop a broken pool so the next call starts fresh workers."""
+    global _pool
+    
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def submit(fn, *args):
+    """Submit a call to the worker pool; workers are started inside the spawn environment."""
+    pool = get_pool()
+    with _spawn_environment():
+        try:
+            return pool, pool.submit(fn, *args)
+        except BrokenProcessPool:
+            _reset_pool(pool)
+            pool = get_pool()
+            return pool, pool.submit(fn, *args)
+
+
+def _collect(node_name, pool, future, blocks):
+    try:
+        encoded = future.result()
+    except BrokenProcessPool:
+        _reset_pool(pool)
+        raise RuntimeError(f"MeshLib worker process crashed while running {node_name}. "
+                           "Unset MESHLIB_WORKER_PROCESSES to run it in the server process.")
+    finally:
+        _release(blocks)
+    
+    return decode(encoded, unlink=True)
+
+
+def run_in_worker(node_name, kwargs, function_name=None):
+    """
+    Run a node in a worker process.
+    
+    Args:
+        node_name: Key of the node in NODE_CLASS_MAPPINGS
+        kwargs: Node inputs
+        function_name: Method to call instead of the node's FUNCTION
+    
+    Returns:
+        The node result, with meshes and arrays rebuilt in this process
+    """
+    blocks = []
+    try:
+        pool, future = submit(_run_node, node_name, encode(kwargs, blocks), function_name)
+    except BaseException:
+        _release(blocks)
+        raise
+    
+    return _collect(node_name, pool, future, blocks)
+
+
+async def run_in_worker_async(node_name, kwargs, function_name=None):
+    """Awaitable variant of run_in_worker."""
+    blocks = []
+    try:
+        pool, future = submit(_run_node, node_name, encode(kwargs, blocks), function_name)
+    except BaseException:
+        _release(blocks)
+        raise
+    
+    # Errors are re-raised by _collect
+    with contextlib.suppress(Exception):
+        await asyncio.wrap_future(future)
+    
+    return _collect(node_name, pool, future, blocks)
+
+
+def _dispatcher(node_name, use_async, function_name=None):
+    def wrapper(function):
+        signature = inspect.signature(function)
+        
+        def bind(self, args, kwargs):
+            arguments = signature.bind(self, *args, **kwargs).arguments
+            arguments.pop(next(iter(signature.parameters)))
+            return dict(arguments)
+        
+        if use_async:
+            async def dispatched(self, *args, **kwargs):
+                return await run_in_worker_async(node_name, bind(self, args, kwargs), function_name)
+        else:
+            def dispatched(self, *args, **kwargs):
+                return run_in_worker(node_name, bind(self, args, kwargs), function_name)
+        
+        return dispatched
+    
+    return wrapper
+
+
+def install_worker_pool(node_class_mappings):
+    """
+    Route the FUNCTION of the WORKER_NODES to the worker pool when enabled.
+    
+    List (batch) nodes route their ITEM_FUNCTION instead: each item of a list
+    goes to a worker, so the items run in parallel processes.
+    
+    Does nothing when MESHLIB_WORKER_PROCESSES is unset or 0, and inside the
+    worker processes themselves.
+    
+    Args:
+        node_class_mappings: NODE_CLASS_MAPPINGS dict
+    """
+    if worker_count() == 0 or parent_process() is not None:
+        return
+    
+    use_async = os.environ.get("MESHLIB_WORKER_ASYNC", "0") == "1"
+    for node_name in WORKER_NODES:
+        if node_name not in node_class_mappings:
+            continue
+        node_class = node_class_mappings[node_name]
+        item_function = getattr(node_class, "ITEM_FUNCTION", None)
+        if item_function is not None:
+            # Items are dispatched from map_batch's threads, which wait synchronously
+            wrap_node_function(node_class, _dispatcher(node_name, False, item_function), item_function)
+        else:
+            wrap_node_function(node_class, _dispatcher(node_name, use_async))